@@ -1,10 +1,15 @@
 #!/usr/bin/env python3
 from flask import Flask, render_template, request, jsonify, send_file
-from jobspy_enhanced import scrape_jobs
+from jobspy_enhanced import scrape_jobs_batch, deduplicate_jobs, JobStore, QueryCache
 import pandas as pd
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import json
+import sqlite3
+import threading
+import time
+import uuid
 
 app = Flask(__name__)
 
@@ -13,48 +18,173 @@ UPLOAD_FOLDER = 'uploads'
 if not os.path.exists(UPLOAD_FOLDER):
     os.makedirs(UPLOAD_FOLDER)
 
-def scrape_multiple_companies(companies, location, hours_old, results_wanted):
-    """Scrape jobs for multiple companies and combine results"""
-    all_jobs = []
-    
-    for i, company in enumerate(companies, 1):
-        try:
-            jobs = scrape_jobs(
-                site_name=['indeed'],
-                indeed_company_id=company,
-                location=location,
-                results_wanted=results_wanted,
-                hours_old=hours_old,
-                verbose=0  # Reduce console output for web
-            )
-            
+# Every scrape is upserted into this SQLite job store
+job_store = JobStore(os.environ.get('JOB_STORE_PATH', 'jobs.db'))
+# Recent scrapes; a narrower repeat search (e.g. 24h after 48h) is answered by filtering them
+query_cache = QueryCache(ttl=15 * 60)
+
+def scrape_multiple_companies(companies, location, hours_old, results_wanted, on_result=None):
+    """Scrape jobs for multiple companies concurrently and combine results"""
+    queries = [
+        {
+            'indeed_company_id': company,
             # Add company info to track which company each job came from
-            jobs['search_company'] = company
-            all_jobs.append(jobs)
-            
-        except Exception as e:
-            print(f"Error scraping {company}: {e}")
-            continue
-    
-    # Combine all results
-    if all_jobs:
-        combined_jobs = pd.concat(all_jobs, ignore_index=True)
-        return combined_jobs
-    else:
-        return pd.DataFrame()
+            'tags': {'search_company': company},
+        }
+        for company in companies
+    ]
+    combined_jobs = scrape_jobs_batch(
+        queries,
+        site_name=['indeed'],
+        location=location,
+        results_wanted=results_wanted,
+        hours_old=hours_old,
+        verbose=0,  # Reduce console output for web
+        job_store=job_store,
+        query_cache=query_cache,
+        dedupe=False,
+        on_result=on_result,
+    )
+    for index, error in combined_jobs.attrs.get('errors', {}).items():
+        print(f"Error scraping {companies[index]}: {error}")
+    return combined_jobs
 
 def analyze_duplicates(jobs_df):
     """Analyze duplicates without removing them"""
-    url_duplicates = jobs_df[jobs_df.duplicated(subset=['job_url_direct'], keep=False)]
-    title_location_duplicates = jobs_df[jobs_df.duplicated(subset=['title', 'location'], keep=False)]
+    # Single pass: exact URL matches, title + company + location matches and cross-site near-duplicates
+    reasons = deduplicate_jobs(jobs_df, drop=False, cross_site_only=False)['duplicate_reason'] if len(jobs_df) > 0 else pd.Series(dtype=object)
+    url_duplicates = int((reasons == 'url').sum())
+    title_location_duplicates = int((reasons == 'key').sum())
+    near_duplicates = int((reasons == 'description').sum())
+    total_duplicates = int(reasons.notna().sum())
     
     return {
-        'url_duplicates': len(url_duplicates),
-        'title_location_duplicates': len(title_location_duplicates),
-        'total_duplicates': len(url_duplicates) + len(title_location_duplicates),
-        'duplicate_rate': (len(url_duplicates) + len(title_location_duplicates)) / len(jobs_df) * 100 if len(jobs_df) > 0 else 0
+        'url_duplicates': url_duplicates,
+        'title_location_duplicates': title_location_duplicates,
+        'near_duplicates': near_duplicates,
+        'total_duplicates': total_duplicates,
+        'duplicate_rate': total_duplicates / len(jobs_df) * 100 if len(jobs_df) > 0 else 0
     }
 
+# Scrapes run in the background on a bounded pool; /scrape only enqueues them
+SCRAPE_WORKERS = int(os.environ.get('SCRAPE_WORKERS', '2'))
+# Finished scrape jobs (and their results) are kept in memory this long
+SCRAPE_JOB_TTL_SECONDS = 3600
+RESULT_COLUMNS = ['id', 'site', 'title', 'company', 'location', 'search_company', 'date_posted',
+                  'min_amount', 'max_amount', 'job_url', 'job_url_direct']
+
+scrape_executor = ThreadPoolExecutor(max_workers=SCRAPE_WORKERS)
+scrape_jobs_lock = threading.Lock()
+scrape_job_registry = {}  # job id -> ScrapeJob
+pending_scrape_jobs = {}  # request key -> id of the queued or running job for it
+
+class ScrapeJob:
+    """One queued multi-company scrape, shared by every identical request made while it is pending"""
+    def __init__(self, key, companies, location, hours_old, results_wanted, export_csv):
+        self.id = uuid.uuid4().hex
+        self.key = key
+        self.companies = companies
+        self.location = location
+        self.hours_old = hours_old
+        self.results_wanted = results_wanted
+        self.export_csv = export_csv
+        self.status = 'queued'
+        self.completed_companies = 0
+        self.requests = 1
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.error = None
+        self.summary = None
+        self.jobs = None
+    
+    def to_dict(self):
+        return {
+            'job_id': self.id,
+            'status': self.status,
+            'companies': self.companies,
+            'location': self.location,
+            'hours_old': self.hours_old,
+            'results_wanted': self.results_wanted,
+            'progress': {'completed_companies': self.completed_companies, 'total_companies': len(self.companies)},
+            'requests': self.requests,
+            'created_at': datetime.fromtimestamp(self.created_at).isoformat(timespec='seconds'),
+            'started_at': datetime.fromtimestamp(self.started_at).isoformat(timespec='seconds') if self.started_at else None,
+            'finished_at': datetime.fromtimestamp(self.finished_at).isoformat(timespec='seconds') if self.finished_at else None,
+            'error': self.error,
+            'results': self.summary,
+        }
+
+def scrape_request_key(companies, location, hours_old, results_wanted):
+    """Requests with the same key would scrape the same jobs and are coalesced"""
+    return (tuple(sorted({c.lower() for c in companies})), location.lower(), hours_old, results_wanted)
+
+def run_scrape_job(job):
+    job.status = 'running'
+    job.started_at = time.time()
+    
+    def on_result(index, query, jobs, error):
+        job.completed_companies += 1
+    
+    try:
+        combined_jobs = scrape_multiple_companies(job.companies, job.location, job.hours_old, job.results_wanted, on_result=on_result)
+        
+        if len(combined_jobs) == 0:
+            job.error = 'No jobs found for any company'
+            job.status = 'failed'
+            return
+        
+        # Prepare results for display
+        job.summary = {
+            'total_jobs': len(combined_jobs),
+            'duplicate_analysis': analyze_duplicates(combined_jobs),
+            'company_breakdown': combined_jobs['search_company'].value_counts().to_dict(),
+            'location_breakdown': combined_jobs['location'].value_counts().head(10).to_dict(),
+            'sample_jobs': combined_jobs[['title', 'company', 'location', 'search_company', 'date_posted']].head(10).to_dict('records')
+        }
+        
+        # Save to CSV if requested
+        if job.export_csv:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            companies_str = '_'.join([c.lower() for c in job.companies])
+            filename = f"{companies_str}_{job.location.lower().replace(', ', '_').replace(' ', '_')}_{timestamp}.csv"
+            filepath = os.path.join(UPLOAD_FOLDER, filename)
+            combined_jobs.to_csv(filepath, index=False)
+            job.summary['csv_file'] = filename
+        
+        job.jobs = combined_jobs.reset_index(drop=True)
+        job.status = 'finished'
+    except Exception as e:
+        job.error = f'An error occurred: {str(e)}'
+        job.status = 'failed'
+    finally:
+        job.finished_at = time.time()
+        with scrape_jobs_lock:
+            if pending_scrape_jobs.get(job.key) == job.id:
+                del pending_scrape_jobs[job.key]
+
+def submit_scrape_job(companies, location, hours_old, results_wanted, export_csv):
+    """:return: (job, whether an identical pending job was reused)"""
+    key = scrape_request_key(companies, location, hours_old, results_wanted)
+    with scrape_jobs_lock:
+        now = time.time()
+        for job_id, job in list(scrape_job_registry.items()):
+            if job.finished_at and now - job.finished_at > SCRAPE_JOB_TTL_SECONDS:
+                del scrape_job_registry[job_id]
+        
+        pending_id = pending_scrape_jobs.get(key)
+        if pending_id in scrape_job_registry:
+            job = scrape_job_registry[pending_id]
+            job.requests += 1
+            job.export_csv = job.export_csv or export_csv
+            return job, True
+        
+        job = ScrapeJob(key, companies, location, hours_old, results_wanted, export_csv)
+        scrape_job_registry[job.id] = job
+        pending_scrape_jobs[key] = job.id
+    scrape_executor.submit(run_scrape_job, job)
+    return job, False
+
 @app.route('/')
 def index():
     return render_template('index.html')
@@ -79,42 +209,77 @@ def scrape():
         results_wanted = request.form.get('results_wanted', '1000').strip()
         results_wanted = int(results_wanted) if results_wanted else 1000
         
-        # Scrape jobs
-        combined_jobs = scrape_multiple_companies(companies, location, hours_old, results_wanted)
-        
-        if len(combined_jobs) == 0:
-            return jsonify({'error': 'No jobs found for any company'})
-        
-        # Analyze duplicates
-        duplicate_analysis = analyze_duplicates(combined_jobs)
+        # Queue the scrape; identical requests made while it is pending share it
+        job, coalesced = submit_scrape_job(companies, location, hours_old, results_wanted, request.form.get('export_csv') == 'true')
         
-        # Prepare results for display
-        results = {
-            'total_jobs': len(combined_jobs),
-            'companies': companies,
-            'location': location,
-            'hours_old': hours_old,
-            'results_wanted': results_wanted,
-            'duplicate_analysis': duplicate_analysis,
-            'company_breakdown': combined_jobs['search_company'].value_counts().to_dict(),
-            'location_breakdown': combined_jobs['location'].value_counts().head(10).to_dict(),
-            'sample_jobs': combined_jobs[['title', 'company', 'location', 'search_company', 'date_posted']].head(10).to_dict('records')
-        }
-        
-        # Save to CSV if requested
-        if request.form.get('export_csv') == 'true':
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            companies_str = '_'.join([c.lower() for c in companies])
-            filename = f"{companies_str}_{location.lower().replace(', ', '_').replace(' ', '_')}_{timestamp}.csv"
-            filepath = os.path.join(UPLOAD_FOLDER, filename)
-            combined_jobs.to_csv(filepath, index=False)
-            results['csv_file'] = filename
-        
-        return jsonify(results)
+        return jsonify({
+            'job_id': job.id,
+            'status': job.status,
+            'coalesced': coalesced,
+            'status_url': f'/status/{job.id}',
+            'results_url': f'/results/{job.id}',
+        }), 202
         
     except Exception as e:
         return jsonify({'error': f'An error occurred: {str(e)}'})
 
+@app.route('/jobs')
+def stored_jobs():
+    """Query previously scraped jobs from the job store instead of re-scraping"""
+    try:
+        companies = [c.strip() for c in request.args.get('companies', '').split(',') if c.strip()]
+        hours_old = request.args.get('hours_old', type=int)
+        limit = request.args.get('limit', 100, type=int)
+        jobs = job_store.query(
+            site=request.args.get('site') or None,
+            company_contains=companies or None,
+            location=request.args.get('location') or None,
+            hours_old=hours_old,
+            search=request.args.get('q') or None,
+            limit=limit,
+        )
+        columns = ['id', 'site', 'title', 'company', 'location', 'date_posted',
+                   'min_amount', 'max_amount', 'job_url', 'first_seen', 'last_seen']
+        return jsonify({
+            'total_jobs': len(jobs),
+            'jobs': jobs[columns].astype(object).where(jobs[columns].notna(), None).to_dict('records'),
+        })
+    except sqlite3.OperationalError as e:
+        return jsonify({'error': f'Invalid search: {str(e)}'}), 400
+    except Exception as e:
+        return jsonify({'error': f'An error occurred: {str(e)}'})
+
+@app.route('/status/<job_id>')
+def scrape_status(job_id):
+    """Progress of a queued scrape, with the result summary once it has finished"""
+    job = scrape_job_registry.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Unknown job id'}), 404
+    return jsonify(job.to_dict())
+
+@app.route('/results/<job_id>')
+def scrape_results(job_id):
+    """Jobs found by a finished scrape, one page at a time"""
+    job = scrape_job_registry.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Unknown job id'}), 404
+    if job.status != 'finished':
+        return jsonify({'error': f'Job is {job.status}', 'status': job.status, 'details': job.error}), 409
+    
+    page = max(request.args.get('page', 1, type=int), 1)
+    per_page = min(max(request.args.get('per_page', 50, type=int), 1), 500)
+    start = (page - 1) * per_page
+    columns = [column for column in RESULT_COLUMNS if column in job.jobs.columns]
+    page_jobs = job.jobs[columns].iloc[start:start + per_page]
+    return jsonify({
+        'job_id': job.id,
+        'page': page,
+        'per_page': per_page,
+        'total_jobs': len(job.jobs),
+        'total_pages': (len(job.jobs) + per_page - 1) // per_page,
+        'jobs': page_jobs.astype(object).where(page_jobs.notna(), None).to_dict('records'),
+    })
+
 @app.route('/download/<filename>')
 def download(filename):
     try:
@@ -0,0 +1,612 @@
+"""
+Offline stand-ins for the job board endpoints the scrapers call.
+
+`JobBoardFixtures.respond` answers a request (method, url, body) with a
+response in the format each board returns, captured from the live
+endpoints: Indeed GraphQL JSON, LinkedIn guest search and job page HTML,
+Glassdoor /graph JSON, ZipRecruiter jobs-app JSON and job pages, Google
+search HTML and async payloads, Naukri search JSON and Bayt search HTML.
+The jobs in them come from the checked-in CSVs, so titles, companies,
+salaries and descriptions have realistic sizes. Every board paginates
+through `jobs_per_site` jobs.
+
+`patched_network(fixtures)` routes every request of the scrapers (requests
+and tls_client sessions alike) to the fixtures for offline benchmarks.
+"""
+
+from __future__ import annotations
+
+import glob
+import html
+import json
+import os
+import re
+import time
+from contextlib import ExitStack, contextmanager
+from unittest.mock import patch
+from urllib.parse import parse_qs, quote, urlparse
+
+import pandas as pd
+import requests
+import tls_client
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# jobs per page (or per cursor step) of each board
+PAGE_SIZES = {
+    "indeed": 100,
+    "linkedin": 10,
+    "glassdoor": 30,
+    "zip_recruiter": 20,
+    "google": 10,
+    "naukri": 20,
+    "bayt": 20,
+}
+
+
+def load_csv_jobs() -> pd.DataFrame:
+    frames = [
+        pd.read_csv(path) for path in sorted(glob.glob(os.path.join(ROOT, "*.csv")))
+    ]
+    jobs = pd.concat(frames, ignore_index=True).drop_duplicates(subset=["id"])
+    jobs = jobs[jobs["title"].notna() & jobs["description"].notna()]
+    return jobs.sample(frac=1, random_state=7).reset_index(drop=True)
+
+
+def markdown_to_html(text: str) -> str:
+    """Rough inverse of markdownify, enough to give the descriptions real markup"""
+    blocks = []
+    for block in re.split(r"\n\s*\n", text.replace("\\", "")):
+        block = html.escape(block.strip())
+        if not block:
+            continue
+        block = re.sub(r"\*\*(.+?)\*\*", r"<b>\1</b>", block)
+        items = re.findall(r"^\s*[*-] (.+)$", block, flags=re.M)
+        if items:
+            blocks.append(
+                "<ul>" + "".join(f"<li>{item}</li>" for item in items) + "</ul>"
+            )
+        else:
+            blocks.append(f"<p>{block}</p>")
+    return "".join(blocks)
+
+
+class JobBoardFixtures:
+    def __init__(self, jobs: pd.DataFrame | None = None, jobs_per_site: int = 1000):
+        jobs = load_csv_jobs() if jobs is None else jobs
+        self.jobs_per_site = jobs_per_site
+        self.rows = []
+        for row in jobs.head(2000).itertuples():
+            parts = [part.strip() for part in str(row.location).split(",")]
+            self.rows.append(
+                {
+                    "title": row.title,
+                    "company": row.company if isinstance(row.company, str) else "Acme",
+                    "city": parts[0] if parts and parts[0] != "nan" else "Seattle",
+                    "state": parts[1] if len(parts) > 1 else "WA",
+                    "description": markdown_to_html(row.description),
+                    "min_amount": (
+                        None if pd.isna(row.min_amount) else int(row.min_amount)
+                    ),
+                    "max_amount": (
+                        None if pd.isna(row.max_amount) else int(row.max_amount)
+                    ),
+                }
+            )
+        self.now_ms = int(time.time() * 1000)
+        self.routes = [
+            ("apis.indeed.com", r"/graphql", self.indeed_search),
+            (
+                "www.linkedin.com",
+                r"/jobs-guest/jobs/api/seeMoreJobPostings/search",
+                self.linkedin_search,
+            ),
+            ("www.linkedin.com", r"/jobs/view/(\d+)", self.linkedin_job),
+            (
+                "www.glassdoor.com",
+                r"/Job/computer-science-jobs.htm",
+                self.glassdoor_csrf,
+            ),
+            (
+                "www.glassdoor.com",
+                r"/findPopularLocationAjax.htm",
+                self.glassdoor_locations,
+            ),
+            ("www.glassdoor.com", r"/graph", self.glassdoor_graph),
+            (
+                "api.ziprecruiter.com",
+                r"/jobs-app/event",
+                lambda query, body: ("application/json", {}),
+            ),
+            ("api.ziprecruiter.com", r"/jobs-app/jobs", self.ziprecruiter_search),
+            ("www.ziprecruiter.com", r"/jobs/j", self.ziprecruiter_job),
+            ("www.google.com", r"/search", self.google_initial),
+            ("www.google.com", r"/async/callback:550", self.google_async),
+            ("www.naukri.com", r"/jobapi/v3/search", self.naukri_search),
+            ("www.bayt.com", r"/en/international/jobs/.+", self.bayt_search),
+        ]
+
+    def respond(
+        self, method: str, url: str, body: bytes | None = None
+    ) -> tuple[int, str, bytes]:
+        """:return: status code, content type and body of the board's response"""
+        parsed = urlparse(url)
+        path = re.sub(r"/+", "/", parsed.path).rstrip("/") or "/"
+        query = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        for host, pattern, handler in self.routes:
+            match = re.fullmatch(pattern, path)
+            if parsed.hostname == host and match:
+                if match.groups():
+                    query["_match"] = match.group(1)
+                content_type, payload = handler(query, body)
+                if not isinstance(payload, (str, bytes)):
+                    payload = json.dumps(payload)
+                if isinstance(payload, str):
+                    payload = payload.encode()
+                return 200, content_type, payload
+        return 404, "text/plain", b"not found"
+
+    def page(self, site: str, number: int) -> range:
+        """Indices of the jobs on page `number` (0-based) of a board"""
+        size = PAGE_SIZES[site]
+        start = number * size
+        return range(start, min(start + size, self.jobs_per_site))
+
+    def row(self, index: int) -> dict:
+        return self.rows[index % len(self.rows)]
+
+    def days_ago(self, index: int) -> int:
+        return index % 30
+
+    # Indeed
+
+    def indeed_search(self, query, body):
+        graphql = json.loads(body)["query"]
+        job_key = re.search(r'jobKeys: \["([0-9a-f]+)"\]', graphql)
+        if job_key:
+            row = self.row(int(job_key.group(1), 16))
+            return "application/json", {
+                "data": {
+                    "jobData": {
+                        "results": [
+                            {
+                                "job": {
+                                    "key": job_key.group(1),
+                                    "description": {"html": row["description"]},
+                                }
+                            }
+                        ]
+                    }
+                }
+            }
+        cursor = re.search(r'cursor: "page-(\d+)"', graphql)
+        number = int(cursor.group(1)) if cursor else 0
+        indices = self.page("indeed", number)
+        has_next = indices and indices.stop < self.jobs_per_site
+        with_description = "description {" in graphql
+        results = []
+        for index in indices:
+            job = self.indeed_job(index)
+            if not with_description:
+                del job["description"]
+            results.append({"trackingKey": f"tk{index}", "job": job})
+        return "application/json", {
+            "data": {
+                "jobSearch": {
+                    "pageInfo": {
+                        "nextCursor": f"page-{number + 1}" if has_next else None
+                    },
+                    "results": results,
+                }
+            }
+        }
+
+    def indeed_job(self, index: int) -> dict:
+        row = self.row(index)
+        posted = self.now_ms - self.days_ago(index) * 86_400_000
+        salary = (
+            {
+                "unitOfWork": "YEAR",
+                "range": {"min": row["min_amount"], "max": row["max_amount"]},
+            }
+            if row["min_amount"]
+            else None
+        )
+        company_slug = quote(row["company"].replace(" ", "-"))
+        return {
+            "source": {"name": row["company"]},
+            "key": f"{index:016x}",
+            "title": row["title"],
+            "datePublished": posted,
+            "dateOnIndeed": posted,
+            "description": {"html": row["description"]},
+            "location": {
+                "countryName": "United States",
+                "countryCode": "US",
+                "admin1Code": row["state"],
+                "city": row["city"],
+                "postalCode": None,
+                "streetAddress": None,
+                "formatted": {
+                    "short": f"{row['city']}, {row['state']}",
+                    "long": f"{row['city']}, {row['state']}",
+                },
+            },
+            "compensation": {
+                "estimated": None,
+                "baseSalary": salary,
+                "currencyCode": "USD",
+            },
+            "attributes": [{"key": "CF3CP", "label": "Full-time"}],
+            "employer": {
+                "relativeCompanyPageUrl": f"/cmp/{company_slug}",
+                "name": row["company"],
+                "dossier": {
+                    "employerDetails": {
+                        "addresses": [f"{row['city']}, {row['state']}"],
+                        "industry": "INTERNET_AND_SOFTWARE",
+                        "employeesLocalizedLabel": "10,000+",
+                        "revenueLocalizedLabel": "more than $10B (USD)",
+                        "briefDescription": f"{row['company']} is a technology company.",
+                        "ceoName": None,
+                        "ceoPhotoUrl": None,
+                    },
+                    "images": {
+                        "headerImageUrl": None,
+                        "squareLogoUrl": f"https://d2q79iu7y748jz.cloudfront.net/s/_squarelogo/{index}.png",
+                    },
+                    "links": {
+                        "corporateWebsite": f"https://www.{company_slug.lower()}.com"
+                    },
+                },
+            },
+            "recruit": {
+                "viewJobUrl": f"https://careers.example.com/jobs/{index}",
+                "detailedSalary": None,
+                "workSchedule": None,
+            },
+        }
+
+    # LinkedIn
+
+    def linkedin_search(self, query, body):
+        start = int(query.get("start", 0))
+        cards = []
+        for index in range(
+            start, min(start + PAGE_SIZES["linkedin"], self.jobs_per_site)
+        ):
+            row = self.row(index)
+            salary = (
+                f'<span class="job-search-card__salary-info">${row["min_amount"]:,}.00 - ${row["max_amount"]:,}.00</span>'
+                if row["min_amount"]
+                else ""
+            )
+            posted = pd.Timestamp.now().normalize() - pd.Timedelta(
+                days=self.days_ago(index)
+            )
+            title = html.escape(row["title"])
+            cards.append(
+                f"""<li>
+<div class="base-card relative w-full base-search-card base-search-card--link job-search-card" data-entity-urn="urn:li:jobPosting:{index + 1}">
+<a class="base-card__full-link absolute top-0 right-0 bottom-0 left-0 p-0 z-[2]" href="https://www.linkedin.com/jobs/view/software-engineer-at-acme-{index + 1}?position=1&amp;pageNum=0&amp;refId=abc&amp;trackingId=def">
+<span class="sr-only">{title}</span></a>
+<div class="base-search-card__info">
+<h3 class="base-search-card__title">{title}</h3>
+<h4 class="base-search-card__subtitle"><a class="hidden-nested-link" href="https://www.linkedin.com/company/acme?trk=public_jobs_jserp-result_job-search-card-subtitle">{html.escape(row["company"])}</a></h4>
+<div class="base-search-card__metadata">
+<span class="job-search-card__location">{html.escape(row["city"])}, {html.escape(row["state"])}</span>
+{salary}
+<time class="job-search-card__listdate" datetime="{posted:%Y-%m-%d}">{self.days_ago(index)} days ago</time>
+</div></div></div></li>"""
+            )
+        return "text/html", "\n".join(cards)
+
+    def linkedin_job(self, query, body):
+        index = int(query["_match"]) - 1
+        row = self.row(index)
+        criteria = [
+            ("Seniority level", "Mid-Senior level"),
+            ("Employment type", "Full-time"),
+            ("Job function", "Engineering and Information Technology"),
+            ("Industries", "Software Development"),
+        ]
+        criteria_html = "".join(
+            f"""<li class="description__job-criteria-item">
+<h3 class="description__job-criteria-subheader">{name}</h3>
+<span class="description__job-criteria-text description__job-criteria-text--criteria">{value}</span></li>"""
+            for name, value in criteria
+        )
+        apply_url = quote(f"https://careers.example.com/jobs/{index}", safe="")
+        return (
+            "text/html",
+            f"""<!DOCTYPE html><html><head><title>{html.escape(row["title"])}</title></head><body>
+<img class="artdeco-entity-image" data-delayed-url="https://media.licdn.com/dms/image/{index}/company-logo.png" alt="">
+<code id="applyUrl" style="display: none"><!--"https://www.linkedin.com/jobs/view/externalApply/{index}?url={apply_url}&urlHash=x1"--></code>
+<section class="show-more-less-html"><div class="show-more-less-html__markup show-more-less-html__markup--clamp-after-5 relative overflow-hidden">{row["description"]}</div></section>
+<ul class="description__job-criteria-list">{criteria_html}</ul>
+</body></html>""",
+        )
+
+    # Glassdoor
+
+    def glassdoor_csrf(self, query, body):
+        return (
+            "text/html",
+            '<html><script>window.gdGlobals = {"token": "fixture-csrf-token"}</script></html>',
+        )
+
+    def glassdoor_locations(self, query, body):
+        return "application/json", [
+            {
+                "locationId": 1150505,
+                "locationType": "C",
+                "label": query.get("term", "Seattle, WA"),
+            }
+        ]
+
+    def glassdoor_graph(self, query, body):
+        operation = json.loads(body)[0]
+        variables = operation["variables"]
+        if operation["operationName"] == "JobDetailQuery":
+            row = self.row(int(variables["jl"]))
+            return "application/json", [
+                {
+                    "data": {
+                        "jobview": {
+                            "job": {
+                                "description": row["description"],
+                                "__typename": "JobDetail",
+                            }
+                        }
+                    }
+                }
+            ]
+        number = variables["pageNumber"] - 1
+        indices = self.page("glassdoor", number)
+        listings = []
+        for index in indices:
+            row = self.row(index)
+            header = {
+                "employerNameFromSearch": row["company"],
+                "employer": {"id": 1000 + index % 97, "name": row["company"]},
+                "locationName": f"{row['city']}, {row['state']}",
+                "locationType": "C",
+                "ageInDays": self.days_ago(index),
+                "adOrderSponsorshipLevel": "STANDARD",
+                "payCurrency": "USD",
+            }
+            if row["min_amount"]:
+                header["payPeriod"] = "ANNUAL"
+                header["payPeriodAdjustedPay"] = {
+                    "p10": float(row["min_amount"]),
+                    "p50": float(row["min_amount"] + row["max_amount"]) / 2,
+                    "p90": float(row["max_amount"]),
+                }
+            listings.append(
+                {
+                    "jobview": {
+                        "job": {"listingId": index, "jobTitleText": row["title"]},
+                        "header": header,
+                        "overview": {
+                            "squareLogoUrl": f"https://media.glassdoor.com/sql/{index}.png"
+                        },
+                    }
+                }
+            )
+        cursors = (
+            [{"pageNumber": number + 2, "cursor": f"page-{number + 2}"}]
+            if indices and indices.stop < self.jobs_per_site
+            else []
+        )
+        return "application/json", [
+            {
+                "data": {
+                    "jobListings": {
+                        "jobListings": listings,
+                        "paginationCursors": cursors,
+                        "totalJobsCount": self.jobs_per_site,
+                    }
+                }
+            }
+        ]
+
+    # ZipRecruiter
+
+    def ziprecruiter_search(self, query, body):
+        token = query.get("continue_from")
+        number = int(token.split("-")[1]) if token else 0
+        indices = self.page("zip_recruiter", number)
+        jobs = []
+        for index in indices:
+            row = self.row(index)
+            job = {
+                "listing_key": f"zr{index}",
+                "name": row["title"],
+                "job_description": re.sub(r"<[^>]+>", " ", row["description"])[:500],
+                "buyer_type": "ORGANIC",
+                "hiring_company": {"name": row["company"]},
+                "job_country": "US",
+                "job_city": row["city"],
+                "job_state": row["state"],
+                "employment_type": "FULL_TIME",
+                "posted_time": (
+                    pd.Timestamp.utcnow() - pd.Timedelta(days=self.days_ago(index))
+                ).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            }
+            if row["min_amount"]:
+                job.update(
+                    compensation_interval="annual",
+                    compensation_min=row["min_amount"],
+                    compensation_max=row["max_amount"],
+                    compensation_currency="USD",
+                )
+            jobs.append(job)
+        response = {"jobs": jobs, "total": self.jobs_per_site}
+        if indices and indices.stop < self.jobs_per_site:
+            response["continue"] = f"page-{number + 1}"
+        return "application/json", response
+
+    def ziprecruiter_job(self, query, body):
+        index = int(query["lvk"][2:])
+        row = self.row(index)
+        model = {
+            "model": {
+                "saveJobURL": f"/job/save?job_url=https://careers.example.com/jobs/{index}"
+            }
+        }
+        return (
+            "text/html",
+            f"""<!DOCTYPE html><html><body>
+<div class="job_description">{row["description"]}</div>
+<section class="company_description"><p>{html.escape(row["company"])} is hiring.</p></section>
+<script type="application/json">{json.dumps(model)}</script>
+</body></html>""",
+        )
+
+    # Google
+
+    def google_job_info(self, index: int) -> list:
+        row = self.row(index)
+        text = re.sub(r"<[^>]+>", "\n", row["description"])
+        info = [None] * 29
+        info[0] = row["title"]
+        info[1] = row["company"]
+        info[2] = f"{row['city']}, {row['state']}, United States"
+        info[3] = [[f"https://careers.example.com/jobs/{index}?utm_source=google"]]
+        info[12] = f"{self.days_ago(index)} days ago"
+        info[19] = text
+        info[28] = f"go{index}"
+        return info + [["Full-time"]]
+
+    def google_initial(self, query, body):
+        cards = "".join(
+            '<div class="job">'
+            + json.dumps(
+                {"520084652": self.google_job_info(index)}, separators=(",", ":")
+            )
+            + "]]]]]</div>"
+            for index in self.page("google", 0)
+        )
+        return "text/html", (
+            '<html><body><div jsname="Yust4d" class="results" data-async-fc="page-1"></div>'
+            f"{cards}</body></html>"
+        )
+
+    def google_async(self, query, body):
+        number = int(query["fc"].split("-")[1])
+        indices = self.page("google", number)
+        entries = [
+            [
+                f"entry{index}",
+                json.dumps([[[{"520084652": self.google_job_info(index)}]]]),
+            ]
+            for index in indices
+        ]
+        next_cursor = (
+            f'<div data-async-fc="page-{number + 1}"></div>'
+            if indices and indices.stop < self.jobs_per_site
+            else ""
+        )
+        return "text/plain", ")]}'\n" + next_cursor + json.dumps([entries])
+
+    # Naukri
+
+    def naukri_search(self, query, body):
+        number = int(query.get("pageNo", 1)) - 1
+        jobs = []
+        for index in self.page("naukri", number):
+            row = self.row(index)
+            # the CSV salaries are USD; roughly converted to lakhs of rupees
+            salary = (
+                f"{row['min_amount'] * 83 // 100000}-{row['max_amount'] * 83 // 100000} Lacs P.A."
+                if row["min_amount"]
+                else "Not disclosed"
+            )
+            jobs.append(
+                {
+                    "jobId": f"{index:012d}",
+                    "title": row["title"],
+                    "companyName": row["company"],
+                    "staticUrl": f"{row['company'].lower().replace(' ', '-')}-jobs-careers-{index}",
+                    "placeholders": [
+                        {"type": "experience", "label": "3-5 Yrs"},
+                        {"type": "salary", "label": salary},
+                        {"type": "location", "label": f"{row['city']}, {row['state']}"},
+                    ],
+                    "footerPlaceholderLabel": f"{self.days_ago(index)} Days Ago",
+                    "createdDate": self.now_ms - self.days_ago(index) * 86_400_000,
+                    "jdURL": f"/job-listings-fixture-{index:012d}",
+                    "jobDescription": row["description"],
+                    "tagsAndSkills": "python,sql,distributed systems,aws",
+                    "experienceText": "3-5 Yrs",
+                    "ambitionBoxData": {"AggregateRating": "4.1", "ReviewsCount": 1200},
+                    "vacancy": 1 + index % 3,
+                    "logoPathV3": f"https://img.naukimg.com/logo_images/{index}.gif",
+                }
+            )
+        return "application/json", {"noOfJobs": self.jobs_per_site, "jobDetails": jobs}
+
+    # Bayt
+
+    def bayt_search(self, query, body):
+        number = int(query.get("page", 1)) - 1
+        items = []
+        for index in self.page("bayt", number):
+            row = self.row(index)
+            items.append(
+                f"""<li class="has-pointer-d" data-js-job="" data-job-id="{index}">
+<div class="row is-compact is-m no-wrap"><h2 class="col u-stretch t-large m0 t-nowrap-d">
+<a href="/en/uae/jobs/fixture-{index}/" data-js-aid="jobID">{html.escape(row["title"])}</a></h2></div>
+<div class="t-nowrap p10l"><span>{html.escape(row["company"])}</span></div>
+<div class="t-mute t-small">{html.escape(row["city"])}, {html.escape(row["state"])}</div>
+<div class="jb-descr m10t t-small">{html.escape(row["title"])} role.</div></li>"""
+            )
+        return "text/html", f"<html><body><ul>{''.join(items)}</ul></body></html>"
+
+
+class FixtureResponse(requests.Response):
+    # tls_client sessions assign `ok`, which is a read-only property on requests.Response
+    ok = None
+
+    def __init__(self, status_code: int, content_type: str, content: bytes, url: str):
+        super().__init__()
+        self.status_code = status_code
+        self.headers["Content-Type"] = content_type
+        self._content = content
+        self.encoding = "utf-8"
+        self.url = url
+        self.ok = 200 <= status_code < 400
+
+
+@contextmanager
+def patched_network(fixtures: JobBoardFixtures):
+    """
+    Serves every scraper request (requests and tls_client) from `fixtures`.
+    Responses are rendered once per distinct request and replayed afterwards,
+    so repeated runs time the scrapers rather than the fixtures.
+    """
+    rendered = {}
+
+    def fake_request(session, method, url, params=None, data=None, json=None, **kwargs):
+        prepared = requests.Request(
+            method, url, params=params, data=data, json=json
+        ).prepare()
+        body = (
+            prepared.body.encode() if isinstance(prepared.body, str) else prepared.body
+        )
+        key = (method, prepared.url, body)
+        if key not in rendered:
+            rendered[key] = fixtures.respond(method, prepared.url, body)
+        return FixtureResponse(*rendered[key], prepared.url)
+
+    def fake_execute_request(
+        session, method, url, params=None, data=None, headers=None, json=None, **kwargs
+    ):
+        return fake_request(session, method, url, params=params, data=data, json=json)
+
+    with ExitStack() as stack:
+        stack.enter_context(patch.object(requests.Session, "request", fake_request))
+        stack.enter_context(
+            patch.object(tls_client.Session, "execute_request", fake_execute_request)
+        )
+        yield
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Google Jobs payload extraction speed on fixture pages.
+
+Builds the initial search page and the async result pages of
+benchmarks/fixtures.py and times Google's parsing of them, without network:
+the initial-page extraction and `_parse_jobs` on the async pages. Reports
+pages and jobs per second for each, from the best of --repeat runs.
+
+The fixture jobs are bare; real payloads carry much more data around each
+job. --padding adds that many nested filler nodes to every job (inside its
+job info and ahead of it in the async entry) to approximate them.
+
+Usage: python benchmarks/google_parse.py [--pages N] [--repeat R] [--padding P]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.fixtures import PAGE_SIZES, JobBoardFixtures
+from jobspy.google import Google
+from jobspy.google import util as google_util
+from jobspy.util import set_logger_level
+
+JOB_INFO_KEY = "520084652"
+
+
+def filler(padding: int) -> list:
+    """Nested lists, numbers, strings and keyed dicts, shaped like the rest of a payload"""
+    return [
+        [
+            f"label {i}",
+            i,
+            None,
+            [[i, "x" * 40], [True, f"https://example.com/{i}"]],
+            {str(i): [i]},
+        ]
+        for i in range(padding)
+    ]
+
+
+def job_info(fixtures: JobBoardFixtures, index: int, padding: int) -> list:
+    return fixtures.google_job_info(index) + [filler(padding)]
+
+
+def initial_page(fixtures: JobBoardFixtures, padding: int) -> str:
+    cards = "".join(
+        '<div class="job">'
+        + json.dumps(
+            {JOB_INFO_KEY: job_info(fixtures, index, padding)}, separators=(",", ":")
+        )
+        + "]]]]]</div>"
+        for index in fixtures.page("google", 0)
+    )
+    return (
+        '<html><body><div jsname="Yust4d" class="results" data-async-fc="page-1"></div>'
+        f"{cards}</body></html>"
+    )
+
+
+def async_page(fixtures: JobBoardFixtures, number: int, padding: int) -> str:
+    entries = [
+        [
+            f"entry{index}",
+            json.dumps(
+                [
+                    [
+                        filler(padding),
+                        [{JOB_INFO_KEY: job_info(fixtures, index, padding)}],
+                    ]
+                ]
+            ),
+        ]
+        for index in fixtures.page("google", number)
+    ]
+    return (
+        ")]}'\n"
+        + f'<div data-async-fc="page-{number + 1}"></div>'
+        + json.dumps([entries])
+    )
+
+
+def rate(count: int, seconds: float) -> float:
+    return round(count / seconds, 1) if seconds else float("inf")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--pages", type=int, default=50, help="async pages per run")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--padding", type=int, default=20, help="filler nodes per job")
+    args = parser.parse_args()
+    set_logger_level(1)
+
+    fixtures = JobBoardFixtures(jobs_per_site=PAGE_SIZES["google"] * (args.pages + 1))
+    html = initial_page(fixtures, args.padding)
+    pages = [
+        async_page(fixtures, number, args.padding)
+        for number in range(1, args.pages + 1)
+    ]
+    jobs_per_page = PAGE_SIZES["google"]
+
+    # best of the repeats, the least disturbed by the rest of the machine
+    initial_seconds = async_seconds = float("inf")
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        jobs = google_util.find_job_info_initial_page(html)
+        initial_seconds = min(initial_seconds, time.perf_counter() - start)
+        assert len(jobs) == jobs_per_page, f"initial page: {len(jobs)} jobs"
+
+        scraper = Google()
+        start = time.perf_counter()
+        parsed = sum(len(scraper._parse_jobs(page)[0]) for page in pages)
+        async_seconds = min(async_seconds, time.perf_counter() - start)
+        assert parsed == jobs_per_page * args.pages, f"async pages: {parsed} jobs"
+
+    print(
+        json.dumps(
+            {
+                "json": getattr(google_util, "JSON_LIBRARY", "json"),
+                "padding": args.padding,
+                "initial_pages_per_second": rate(1, initial_seconds),
+                "async_pages_per_second": rate(args.pages, async_seconds),
+                "async_jobs_per_second": rate(parsed, async_seconds),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+End-to-end load test of scrape_jobs against the local mock job boards.
+
+Starts benchmarks/mock_boards.py in-process, routes every scraper request to
+it and runs --queries concurrent scrape_jobs calls over --sites. Each query
+uses its own search term, so the in-flight coalescing of identical calls does
+not merge them. Scraper page delays are skipped; board latency, errors and
+429s come from the server settings.
+
+Reports throughput (jobs and queries per second), p50/p99 latency of the
+individual board requests and of whole queries, and the 429 and error
+responses served. Failed 429/500 responses are retried by the sessions that
+have retries, with their usual backoff.
+
+Usage: python benchmarks/loadtest.py [--sites indeed linkedin ...] [--queries M]
+                                     [--results N] [--latency-median S]
+                                     [--latency-sigma S] [--error-rate R]
+                                     [--rate-limit-rate R] [--json]
+"""
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.fixtures import JobBoardFixtures
+from benchmarks.mock_boards import BoardBehavior, MockBoardServer, routed_to
+from jobspy import scrape_jobs
+from jobspy.model import Scraper
+from jobspy.util import set_logger_level
+
+DEFAULT_SITES = ["indeed", "linkedin", "glassdoor", "zip_recruiter"]
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def run_query(index: int, sites: list[str], results_wanted: int) -> dict:
+    started = time.perf_counter()
+    jobs = scrape_jobs(
+        site_name=sites,
+        search_term=f"software engineer {index}",
+        location="Seattle, WA",
+        results_wanted=results_wanted,
+        on_error="partial",
+        verbose=0,
+    )
+    return {
+        "seconds": time.perf_counter() - started,
+        "jobs": len(jobs),
+        "site_status": {
+            site: status["status"]
+            for site, status in jobs.attrs.get("site_status", {}).items()
+        },
+    }
+
+
+def load_test(
+    sites: list[str],
+    queries: int,
+    results_wanted: int,
+    behavior: BoardBehavior,
+) -> dict:
+    server = MockBoardServer(JobBoardFixtures(), behavior).start()
+    latencies = defaultdict(list)
+    statuses = defaultdict(int)
+    lock = threading.Lock()
+
+    def on_response(host: str, seconds: float, status_code: int):
+        with lock:
+            latencies[host].append(seconds)
+            statuses[status_code] += 1
+
+    try:
+        with routed_to(server, on_response), patch.object(
+            Scraper, "pause", lambda self, seconds: not self.cancelled()
+        ):
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=queries) as executor:
+                runs = list(
+                    executor.map(
+                        lambda index: run_query(index, sites, results_wanted),
+                        range(queries),
+                    )
+                )
+            elapsed = time.perf_counter() - started
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    request_seconds = [seconds for values in latencies.values() for seconds in values]
+    query_seconds = [run["seconds"] for run in runs]
+    jobs = sum(run["jobs"] for run in runs)
+    site_outcomes = defaultdict(lambda: defaultdict(int))
+    for run in runs:
+        for site, status in run["site_status"].items():
+            site_outcomes[site][status] += 1
+    return {
+        "sites": sites,
+        "queries": queries,
+        "seconds": round(elapsed, 3),
+        "jobs": jobs,
+        "jobs_per_second": round(jobs / elapsed, 1),
+        "queries_per_second": round(queries / elapsed, 2),
+        "requests": len(request_seconds),
+        "request_p50_ms": round(percentile(request_seconds, 50) * 1000, 1),
+        "request_p99_ms": round(percentile(request_seconds, 99) * 1000, 1),
+        "query_p50_s": round(percentile(query_seconds, 50), 3),
+        "query_p99_s": round(percentile(query_seconds, 99), 3),
+        "served": dict(server.counts),
+        "status_codes": dict(statuses),
+        "by_host": {
+            host: {
+                "requests": len(values),
+                "p50_ms": round(percentile(values, 50) * 1000, 1),
+                "p99_ms": round(percentile(values, 99) * 1000, 1),
+            }
+            for host, values in sorted(latencies.items())
+        },
+        "site_outcomes": {
+            site: dict(outcomes) for site, outcomes in site_outcomes.items()
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sites", nargs="+", default=DEFAULT_SITES)
+    parser.add_argument("--queries", type=int, default=8)
+    parser.add_argument("--results", type=int, default=50)
+    parser.add_argument("--latency-median", type=float, default=0.05)
+    parser.add_argument("--latency-sigma", type=float, default=0.5)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--json", action="store_true", help="print the report as JSON")
+    args = parser.parse_args()
+    set_logger_level(0)
+
+    report = load_test(
+        args.sites,
+        args.queries,
+        args.results,
+        BoardBehavior(
+            args.latency_median,
+            args.latency_sigma,
+            args.error_rate,
+            args.rate_limit_rate,
+        ),
+    )
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(
+        f"{len(report['sites'])} sites x {report['queries']} concurrent queries "
+        f"in {report['seconds']}s"
+    )
+    print(
+        f"  throughput: {report['jobs_per_second']} jobs/s, "
+        f"{report['queries_per_second']} queries/s ({report['jobs']} jobs)"
+    )
+    print(
+        f"  requests:   {report['requests']}, p50 {report['request_p50_ms']} ms, "
+        f"p99 {report['request_p99_ms']} ms"
+    )
+    print(f"  queries:    p50 {report['query_p50_s']} s, p99 {report['query_p99_s']} s")
+    print(
+        f"  served:     {report['served']['rate_limited']} x 429, "
+        f"{report['served']['errors']} x 500"
+    )
+    for host, host_report in report["by_host"].items():
+        print(
+            f"  {host:<28} {host_report['requests']:>6} requests  "
+            f"p50 {host_report['p50_ms']} ms  p99 {host_report['p99_ms']} ms"
+        )
+    for site, outcomes in report["site_outcomes"].items():
+        print(f"  {site:<28} {outcomes}")
+
+
+if __name__ == "__main__":
+    main()
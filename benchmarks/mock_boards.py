@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for the job boards, for end-to-end load tests.
+
+A stdlib HTTP server answers `http://host:port/<board host>/<path>` with the
+fixture responses of benchmarks/fixtures.py. Those responses emulate the
+Indeed GraphQL endpoint, LinkedIn guest search and job pages, Glassdoor
+/graph and location lookups, the ZipRecruiter jobs-app API, Google, Naukri
+and Bayt, all with cursor pagination. Each response is delayed by a draw
+from a latency distribution. A configurable share of requests fails with
+500 or 429.
+
+`routed_to(server)` rewrites every scraper request to the server, so
+`scrape_jobs` runs unchanged against it.
+
+Usage: python benchmarks/mock_boards.py [--port P] [--latency-median S]
+                                        [--latency-sigma S] [--error-rate R]
+                                        [--rate-limit-rate R]
+"""
+import argparse
+import os
+import random
+import sys
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from urllib.parse import urlparse
+
+import requests
+import tls_client
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.fixtures import JobBoardFixtures
+
+
+@dataclass
+class BoardBehavior:
+    """
+    Latency is lognormal around `latency_median` seconds (`latency_sigma` 0
+    makes it fixed); `error_rate` and `rate_limit_rate` are the shares of
+    requests answered with 500 and 429
+    """
+
+    latency_median: float = 0.1
+    latency_sigma: float = 0.5
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+
+    def latency(self, rng: random.Random) -> float:
+        if self.latency_sigma <= 0:
+            return self.latency_median
+        return self.latency_median * rng.lognormvariate(0, self.latency_sigma)
+
+
+class MockBoardServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(
+        self,
+        fixtures: JobBoardFixtures | None = None,
+        behavior: BoardBehavior | None = None,
+        port: int = 0,
+        seed: int = 0,
+    ):
+        super().__init__(("127.0.0.1", port), _Handler)
+        self.fixtures = fixtures or JobBoardFixtures()
+        self.behavior = behavior or BoardBehavior()
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.counts = {"requests": 0, "errors": 0, "rate_limited": 0}
+        self.rendered = {}
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def start(self) -> "MockBoardServer":
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def outcome(self) -> tuple[float, int | None]:
+        """:return: latency to add and the forced error status, if any"""
+        with self.lock:
+            self.counts["requests"] += 1
+            latency = self.behavior.latency(self.rng)
+            draw = self.rng.random()
+            if draw < self.behavior.rate_limit_rate:
+                self.counts["rate_limited"] += 1
+                return latency, 429
+            if draw < self.behavior.rate_limit_rate + self.behavior.error_rate:
+                self.counts["errors"] += 1
+                return latency, 500
+        return latency, None
+
+    def render(self, method: str, url: str, body: bytes | None):
+        key = (method, url, body)
+        if key not in self.rendered:
+            self.rendered[key] = self.fixtures.respond(method, url, body)
+        return self.rendered[key]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def handle_board(self):
+        host, _, path = self.path.lstrip("/").partition("/")
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else None
+        latency, forced_status = self.server.outcome()
+        time.sleep(latency)
+        if forced_status:
+            status, content_type, content = forced_status, "text/plain", b"mock failure"
+        else:
+            status, content_type, content = self.server.render(
+                self.command, f"https://{host}/{path}", body
+            )
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_POST = handle_board
+
+    def log_message(self, format, *args):
+        pass
+
+
+@contextmanager
+def routed_to(server: MockBoardServer, on_response=None):
+    """
+    Sends every scraper request to `server` instead of the real board.
+    tls_client sessions are served through requests, since the server is plain HTTP.
+    :param on_response: called with (board host, seconds, status code) per request
+    """
+    send = requests.Session.request
+
+    def local_request(session, method, url, **kwargs):
+        parsed = urlparse(url)
+        local_url = f"{server.base_url}/{parsed.hostname}{parsed.path or '/'}"
+        if parsed.query:
+            local_url += f"?{parsed.query}"
+        kwargs.pop("proxies", None)
+        started = time.perf_counter()
+        response = send(session, method, local_url, proxies={}, **kwargs)
+        if on_response:
+            on_response(
+                parsed.hostname, time.perf_counter() - started, response.status_code
+            )
+        return response
+
+    def local_execute_request(
+        session,
+        method,
+        url,
+        params=None,
+        data=None,
+        headers=None,
+        json=None,
+        timeout_seconds=None,
+        allow_redirects=False,
+        **kwargs,
+    ):
+        with requests.Session() as plain:
+            response = local_request(
+                plain,
+                method,
+                url,
+                params=params,
+                data=data,
+                json=json,
+                headers=headers,
+                timeout=timeout_seconds,
+                allow_redirects=allow_redirects,
+            )
+        return _Settable(response)
+
+    with ExitStack() as stack:
+        stack.enter_context(patch.object(requests.Session, "request", local_request))
+        stack.enter_context(
+            patch.object(tls_client.Session, "execute_request", local_execute_request)
+        )
+        yield
+
+
+class _Settable:
+    """requests.Response wrapper that allows assigning `ok`, as tls_client responses do"""
+
+    def __init__(self, response: requests.Response):
+        self.__dict__["_response"] = response
+        self.__dict__["ok"] = response.ok
+
+    def __getattr__(self, name):
+        return getattr(self._response, name)
+
+    def __setattr__(self, name, value):
+        self.__dict__[name] = value
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--port", type=int, default=8700)
+    parser.add_argument("--latency-median", type=float, default=0.1)
+    parser.add_argument("--latency-sigma", type=float, default=0.5)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--jobs-per-site", type=int, default=1000)
+    args = parser.parse_args()
+    behavior = BoardBehavior(
+        args.latency_median, args.latency_sigma, args.error_rate, args.rate_limit_rate
+    )
+    server = MockBoardServer(
+        JobBoardFixtures(jobs_per_site=args.jobs_per_site), behavior, args.port
+    )
+    print(f"serving mock job boards on {server.base_url}/<board host>/<path>")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
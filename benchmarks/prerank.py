@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Recall and latency of the AI filter pre-ranker on the checked-in CSVs.
+
+A job counts as relevant to a target when its title matches the target's
+pattern below (a stand-in for the AI score). For each target the script
+reports how many jobs the pre-ranker keeps, how many relevant jobs survive
+and how long selection takes, then the recall at each of the --caps top_k
+values (with the same min_similarity), to show where a cap starts to cost
+recall compared with the similarity threshold alone. A cap ending in % is a
+share of the jobs, like the app's PRERANK_TOP_FRACTION.
+
+Usage: python benchmarks/prerank.py [--top-k K] [--min-similarity S] [--caps 100,300,25%]
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from jobspy.prerank import RelevancePreRanker
+
+TARGETS = {
+    "data science": r"data scien|applied scien|data analy",
+    "machine learning": r"machine learning|\bml\b|\bai\b",
+    "software engineer": r"software|developer|backend|frontend|full stack",
+    "product manager": r"product manag",
+    "marketing": r"marketing",
+    "finance and accounting": r"financ|accountant|accounting",
+    "warehouse associate": r"warehouse|fulfillment|associate",
+}
+
+
+def load_jobs():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    frames = [
+        pd.read_csv(path) for path in sorted(glob.glob(os.path.join(root, "*.csv")))
+    ]
+    jobs = pd.concat(frames, ignore_index=True)
+    jobs = jobs.drop_duplicates(subset=["id"]).reset_index(drop=True)
+    return jobs[jobs["title"].notna()].reset_index(drop=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--top-k", type=int, default=None)
+    parser.add_argument("--min-similarity", type=float, default=0.05)
+    parser.add_argument(
+        "--caps",
+        default="100,300,1000,25%",
+        help="comma-separated top_k values or shares",
+    )
+    args = parser.parse_args()
+    top_k, min_similarity = args.top_k, args.min_similarity
+
+    jobs = load_jobs()
+    caps = {
+        cap: int(len(jobs) * float(cap[:-1]) / 100) if cap.endswith("%") else int(cap)
+        for cap in args.caps.split(",")
+        if cap
+    }
+    start = time.perf_counter()
+    ranker = RelevancePreRanker.from_jobs(jobs)
+    build = time.perf_counter() - start
+    print(f"{len(jobs)} jobs, index built in {build * 1000:.0f} ms")
+    print(f"top_k={top_k} min_similarity={min_similarity}\n")
+    print(
+        f"{'target':<24} {'relevant':>8} {'kept':>6} {'recall':>7} {'sent':>6} {'ms':>6}"
+    )
+
+    recalls = {}
+    for target, pattern in TARGETS.items():
+        relevant = jobs["title"].str.contains(pattern, case=False, regex=True)
+        start = time.perf_counter()
+        positions, _ = ranker.select(target, top_k=top_k, min_similarity=min_similarity)
+        elapsed = time.perf_counter() - start
+        kept = relevant.iloc[positions].sum()
+        recall = kept / relevant.sum() if relevant.sum() else 1.0
+        print(
+            f"{target:<24} {relevant.sum():>8} {len(positions):>6} {recall:>7.1%}"
+            f" {len(positions) / len(jobs):>6.1%} {elapsed * 1000:>6.1f}"
+        )
+        recalls[target] = []
+        for cap in caps.values():
+            capped, _ = ranker.select(target, top_k=cap, min_similarity=min_similarity)
+            recalls[target].append(
+                relevant.iloc[capped].sum() / relevant.sum() if relevant.sum() else 1.0
+            )
+
+    print(f"\nrecall at cap (min_similarity={min_similarity})\n")
+    print(f"{'target':<24}" + "".join(f" {'@' + cap:>7}" for cap in caps))
+    for target, values in recalls.items():
+        print(f"{target:<24}" + "".join(f" {value:>7.1%}" for value in values))
+
+
+if __name__ == "__main__":
+    main()
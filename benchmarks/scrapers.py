@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark of every scraper's parse path and of scrape_jobs assembly.
+
+Each scraper runs against recorded-format fixtures (benchmarks/fixtures.py)
+with its page delays set to zero. For each one the script reports jobs parsed
+per second, the ScrapeStats time per stage (network is the fixture replay, so
+it is close to zero) and peak traced memory. "scrape_jobs" times turning the
+scraped JobPosts of all sites into the result DataFrame.
+
+Results are compared with benchmarks/baseline.json: a run fails (exit code 1)
+when jobs per second drop, or peak memory grows, by more than --tolerance.
+The baseline is machine-specific; refresh it with --save-baseline on the
+machine the comparison runs on.
+
+Usage: python benchmarks/scrapers.py [--sites indeed linkedin ...] [--results N]
+                                     [--repeat R] [--tolerance T] [--save-baseline]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from benchmarks.fixtures import JobBoardFixtures, patched_network
+from jobspy import scrape_jobs
+from jobspy.bayt import BaytScraper
+from jobspy.glassdoor import Glassdoor
+from jobspy.google import Google
+from jobspy.indeed import Indeed
+from jobspy.linkedin import LinkedIn
+from jobspy.model import Country, ScraperInput, Site
+from jobspy.naukri import Naukri
+from jobspy.util import set_logger_level
+from jobspy.ziprecruiter import ZipRecruiter
+
+BASELINE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "baseline.json"
+)
+SCRAPERS = {
+    Site.INDEED: Indeed,
+    Site.LINKEDIN: LinkedIn,
+    Site.GLASSDOOR: Glassdoor,
+    Site.ZIP_RECRUITER: ZipRecruiter,
+    Site.GOOGLE: Google,
+    Site.NAUKRI: Naukri,
+    Site.BAYT: BaytScraper,
+}
+# metric -> whether a higher value is better
+METRICS = {"jobs_per_second": True, "peak_mb": False}
+
+
+def scrape_once(site: Site, results_wanted: int):
+    scraper = SCRAPERS[site]()
+    for attribute in ("delay", "band_delay"):
+        if hasattr(scraper, attribute):
+            setattr(scraper, attribute, 0)
+    scraper_input = ScraperInput(
+        site_type=[site],
+        search_term="software engineer",
+        location="Seattle, WA",
+        country=Country.USA,
+        results_wanted=results_wanted,
+        # Naukri's description parsers expect HTML soup, not the description text
+        linkedin_fetch_description=site != Site.NAUKRI,
+    )
+    started = time.perf_counter()
+    response = scraper.scrape(scraper_input)
+    return response, scraper.stats, time.perf_counter() - started
+
+
+def peak_memory(fn) -> float:
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1] / 2**20
+    finally:
+        tracemalloc.stop()
+
+
+def measure_site(site: Site, results_wanted: int, repeat: int):
+    response, _, _ = scrape_once(site, results_wanted)  # warm-up, renders the fixtures
+    runs = [scrape_once(site, results_wanted) for _ in range(repeat)]
+    _, stats, seconds = min(runs, key=lambda run: run[2])
+    result = {
+        "jobs": len(response.jobs),
+        "seconds": round(seconds, 4),
+        "jobs_per_second": round(len(response.jobs) / seconds, 1),
+        "peak_mb": round(peak_memory(lambda: scrape_once(site, results_wanted)), 2),
+        "stages": {
+            stage: round(value, 4) for stage, value in stats.seconds.items() if value
+        },
+    }
+    return result, response
+
+
+def measure_assembly(responses: dict, repeat: int):
+    def run():
+        with patch.multiple(
+            "jobspy",
+            **{
+                SCRAPERS[site].__name__: type(
+                    SCRAPERS[site].__name__,
+                    (SCRAPERS[site],),
+                    {"scrape": lambda self, scraper_input, response=response: response},
+                )
+                for site, response in responses.items()
+            },
+        ):
+            return scrape_jobs(
+                site_name=[site.value for site in responses],
+                search_term="software engineer",
+                results_wanted=max(len(r.jobs) for r in responses.values()),
+                return_stats=True,
+            )
+
+    run()
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        jobs, stats = run()
+        timings.append((time.perf_counter() - started, stats))
+    seconds, stats = min(timings, key=lambda timing: timing[0])
+    return {
+        "jobs": len(jobs),
+        "seconds": round(seconds, 4),
+        "jobs_per_second": round(len(jobs) / seconds, 1),
+        "peak_mb": round(peak_memory(run), 2),
+        "stages": {"dataframe": round(stats.seconds["dataframe"], 4)},
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    regressions = []
+    for name, result in results.items():
+        for metric, higher_is_better in METRICS.items():
+            expected = baseline.get(name, {}).get(metric)
+            if not expected:
+                continue
+            change = (result[metric] - expected) / expected
+            if (-change if higher_is_better else change) > tolerance:
+                regressions.append(
+                    f"{name} {metric}: {result[metric]} vs baseline {expected} ({change:+.0%})"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sites", nargs="+", default=[site.value for site in SCRAPERS])
+    parser.add_argument("--results", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--save-baseline", action="store_true")
+    args = parser.parse_args()
+    set_logger_level(0)
+
+    fixtures = JobBoardFixtures()
+    results, responses = {}, {}
+    with patched_network(fixtures):
+        for site in (Site(value) for value in args.sites):
+            results[site.value], responses[site] = measure_site(
+                site, args.results, args.repeat
+            )
+        results["scrape_jobs"] = measure_assembly(responses, args.repeat)
+
+    print(f"{'benchmark':<14} {'jobs':>5} {'jobs/s':>9} {'peak MB':>8}  stages (s)")
+    for name, result in results.items():
+        stages = ", ".join(
+            f"{stage} {value}" for stage, value in result["stages"].items()
+        )
+        print(
+            f"{name:<14} {result['jobs']:>5} {result['jobs_per_second']:>9} "
+            f"{result['peak_mb']:>8}  {stages}"
+        )
+
+    if args.save_baseline:
+        with open(BASELINE_PATH, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"baseline saved to {BASELINE_PATH}")
+        return
+    if not os.path.exists(BASELINE_PATH):
+        print("no baseline to compare with, run with --save-baseline")
+        return
+    with open(BASELINE_PATH) as f:
+        regressions = compare(results, json.load(f), args.tolerance)
+    if regressions:
+        print("regressions:\n  " + "\n  ".join(regressions))
+        sys.exit(1)
+    print(f"no regressions beyond {args.tolerance:.0%} of the baseline")
+
+
+if __name__ == "__main__":
+    main()
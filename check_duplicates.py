@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import pandas as pd
+from jobspy_enhanced import deduplicate_jobs
 
 # Load the CSV file
 df = pd.read_csv('uber_jobs.csv')
@@ -54,8 +55,27 @@ if title_loc_dups > 0:
 
 print()
 
-# 3. Additional analysis
-print('3. Additional Analysis:')
+# 3. Cross-site near-duplicates (canonical URL, normalized title/company/location, description SimHash)
+print('3. Near-duplicates (canonical URL / title+company+location / similar description):')
+marked = deduplicate_jobs(df, drop=False, cross_site_only=False)
+reason_counts = marked['duplicate_reason'].value_counts()
+near_dups = int(marked['duplicate_of'].notna().sum())
+print(f'   Duplicate rows: {near_dups}')
+print(f'   Unique jobs: {len(df) - near_dups}')
+for reason, count in reason_counts.items():
+    print(f'   - by {reason}: {count}')
+if near_dups > 0:
+    print('   Examples of near-duplicate clusters:')
+    for original_id, group in list(marked[marked['duplicate_of'].notna()].groupby('duplicate_of'))[:3]:
+        original = marked[marked['id'] == original_id].iloc[0]
+        print(f'     Original: {str(original["title"])[:50]} ({original["location"]})')
+        print(f'     Duplicates: {list(group["title"].head(2))}')
+        print()
+
+print()
+
+# 4. Additional analysis
+print('4. Additional Analysis:')
 print(f'   Total unique titles: {df["title"].nunique()}')
 print(f'   Total unique locations: {df["location"].nunique()}')
 print(f'   Jobs with salary info: {df["min_amount"].notna().sum()}')
@@ -66,11 +86,13 @@ print(f'   Exact duplicates (all columns): {exact_dups}')
 
 print()
 print('=== SUMMARY ===')
-if direct_dups == 0 and title_loc_dups == 0:
+if direct_dups == 0 and title_loc_dups == 0 and near_dups == 0:
     print('✅ No duplications found!')
 else:
     print('⚠️  Some duplications detected:')
     if direct_dups > 0:
         print(f'   - {direct_dups} duplicate job_url_direct entries')
     if title_loc_dups > 0:
-        print(f'   - {title_loc_dups} duplicate title+location combinations') 
\ No newline at end of file
+        print(f'   - {title_loc_dups} duplicate title+location combinations')
+    if near_dups > 0:
+        print(f'   - {near_dups} near-duplicate jobs') 
\ No newline at end of file
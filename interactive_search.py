@@ -1,5 +1,5 @@
 #!/opt/anaconda3/bin/python
-from jobspy_enhanced import scrape_jobs
+from jobspy_enhanced import scrape_jobs_batch
 import pandas as pd
 
 def analyze_duplicates(jobs_df):
@@ -32,45 +32,48 @@ def analyze_duplicates(jobs_df):
     print(f"   Duplicate rate: {total_duplicates/len(jobs_df)*100:.1f}%" if len(jobs_df) > 0 else "   No jobs found")
 
 def scrape_multiple_companies(companies, location, hours_old, results_wanted):
-    """Scrape jobs for multiple companies and combine results"""
-    all_jobs = []
-    
-    for i, company in enumerate(companies, 1):
-        print(f"\n🔍 [{i}/{len(companies)}] Scraping {company} jobs in {location}...")
-        if hours_old:
-            print(f"   Time filter: Last {hours_old} hours")
-        else:
-            print("   Time filter: All time")
-        
-        try:
-            jobs = scrape_jobs(
-                site_name=['indeed'],
-                indeed_company_id=company,
-                location=location,
-                results_wanted=results_wanted,
-                hours_old=hours_old,
-                verbose=1
-            )
-            
-            # Add company info to track which company each job came from
-            jobs['search_company'] = company
-            
-            print(f"   ✅ Found {len(jobs)} {company} jobs")
-            
-            # Check company accuracy
+    """Scrape jobs for multiple companies concurrently and combine results"""
+    print(f"\n🔍 Scraping {len(companies)} companies in {location}...")
+    if hours_old:
+        print(f"   Time filter: Last {hours_old} hours")
+    else:
+        print("   Time filter: All time")
+
+    def report(index, query, jobs, error):
+        company = companies[index]
+        if error:
+            print(f"   ❌ Error scraping {company}: {error}")
+            return
+        print(f"   ✅ Found {len(jobs)} {company} jobs")
+
+        # Check company accuracy
+        if len(jobs) > 0:
             company_jobs = jobs[jobs['company'].str.contains(company, case=False, na=False)]
-            accuracy = len(company_jobs) / len(jobs) * 100 if len(jobs) > 0 else 0
-            print(f"   📊 Accuracy: {accuracy:.1f}%")
-            
-            all_jobs.append(jobs)
-            
-        except Exception as e:
-            print(f"   ❌ Error scraping {company}: {e}")
-            continue
-    
+            accuracy = len(company_jobs) / len(jobs) * 100
+        else:
+            accuracy = 0
+        print(f"   📊 Accuracy: {accuracy:.1f}%")
+
+    combined_jobs = scrape_jobs_batch(
+        [
+            {
+                'indeed_company_id': company,
+                # Add company info to track which company each job came from
+                'tags': {'search_company': company},
+            }
+            for company in companies
+        ],
+        site_name=['indeed'],
+        location=location,
+        results_wanted=results_wanted,
+        hours_old=hours_old,
+        verbose=1,
+        dedupe=False,
+        on_result=report,
+    )
+
     # Combine all results
-    if all_jobs:
-        combined_jobs = pd.concat(all_jobs, ignore_index=True)
+    if len(combined_jobs) > 0:
         print(f"\n🎯 COMBINED RESULTS:")
         print(f"Total jobs from all companies: {len(combined_jobs)}")
         
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable
+
+import pandas as pd
+
+from jobspy.dedup import JobDeduplicator
+from jobspy.model import Country, Site
+from jobspy.util import (
+    create_logger,
+    hold_host_rate_limit,
+    map_str_to_site,
+    release_host_rate_limit,
+)
+
+log = create_logger("Batch")
+
+SITE_HOSTS = {
+    Site.LINKEDIN: ("www.linkedin.com",),
+    Site.INDEED: ("apis.indeed.com",),
+    Site.ZIP_RECRUITER: ("api.ziprecruiter.com", "www.ziprecruiter.com"),
+    Site.GOOGLE: ("www.google.com",),
+    Site.BAYT: ("www.bayt.com",),
+    Site.NAUKRI: ("www.naukri.com",),
+}
+
+
+def _query_sites(query: dict) -> list[Site]:
+    site_name = query.get("site_name")
+    if site_name is None:
+        return list(Site)
+    if not isinstance(site_name, list):
+        site_name = [site_name]
+    return [map_str_to_site(s) if isinstance(s, str) else s for s in site_name]
+
+
+def _site_hosts(site: Site, query: dict) -> tuple[str, ...]:
+    if site == Site.GLASSDOOR:
+        country = Country.from_string(query.get("country_indeed", "usa"))
+        try:
+            return (country.glassdoor_domain_value,)
+        except Exception:
+            return ()
+    return SITE_HOSTS.get(site, ())
+
+
+def _query_label(query: dict) -> str:
+    what = (
+        query.get("indeed_company_id")
+        or query.get("search_term")
+        or query.get("google_search_term")
+        or ""
+    )
+    location = query.get("location")
+    return f"{what} @ {location}" if location else what
+
+
+def scrape_jobs_batch(
+    queries: list[dict],
+    max_workers: int = 4,
+    requests_per_second: float | dict[str, float] | None = None,
+    dedupe: bool = True,
+    on_result: (
+        Callable[[int, dict, pd.DataFrame, Exception | None], None] | None
+    ) = None,
+    **kwargs,
+) -> pd.DataFrame:
+    """
+    Runs many `scrape_jobs` queries concurrently under one worker pool.
+
+    Each query is a dict of `scrape_jobs` keyword arguments; `kwargs` supplies
+    defaults shared by every query. Two optional keys are not passed through:
+    `label` (stored in the `search_query` column, defaults to the company or
+    search term and location) and `tags` (a dict of extra columns to add).
+
+    :param max_workers: number of queries in flight at once
+    :param requests_per_second: rate limit applied to every host the batch
+        touches, or a dict of limits keyed by site name (e.g. {"indeed": 5});
+        held for the batch alone, so concurrent batches keep their own limits
+    :param dedupe: drop jobs that duplicate one returned by an earlier query
+        (by query index), including near-duplicates from other sites (see
+        JobDeduplicator)
+    :param on_result: called from the calling thread with (query_index,
+        query, jobs, error) as each query finishes, or with `dedupe` once it
+        and every earlier query have finished; jobs are already deduplicated
+    :return: Pandas DataFrame of all jobs with `query_index` and `search_query`
+        columns; per-query errors are kept in `attrs["errors"]`
+    """
+    from jobspy import scrape_jobs
+
+    queries = [{**kwargs, **query} for query in queries]
+
+    held_limits = {}
+    if requests_per_second:
+        for query in queries:
+            for site in _query_sites(query):
+                rate = (
+                    requests_per_second.get(site.value)
+                    if isinstance(requests_per_second, dict)
+                    else requests_per_second
+                )
+                for host in _site_hosts(site, query):
+                    if rate and host not in held_limits:
+                        held_limits[host] = hold_host_rate_limit(host, rate)
+
+    def run_query(query: dict) -> pd.DataFrame:
+        params = {k: v for k, v in query.items() if k not in ("label", "tags")}
+        return scrape_jobs(**params)
+
+    deduplicator = JobDeduplicator()
+    results: dict[int, pd.DataFrame] = {}
+    errors: dict[int, str] = {}
+
+    def finish_query(index: int, jobs: pd.DataFrame, error: Exception | None):
+        query = queries[index]
+        if not jobs.empty:
+            if dedupe:
+                marked = deduplicator.add_frame(jobs)
+                jobs = jobs[marked["duplicate_of"].isna()].reset_index(drop=True)
+            jobs["query_index"] = index
+            jobs["search_query"] = query.get("label") or _query_label(query)
+            for column, value in (query.get("tags") or {}).items():
+                jobs[column] = value
+            results[index] = jobs
+
+        if on_result:
+            on_result(index, query, jobs, error)
+
+    # with dedupe, finished queries wait for the earlier ones so duplicates are
+    # resolved in query order, whichever query happened to finish first
+    waiting: dict[int, tuple[pd.DataFrame, Exception | None]] = {}
+    next_index = 0
+    try:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_index = {
+                executor.submit(run_query, query): i for i, query in enumerate(queries)
+            }
+            for future in as_completed(future_to_index):
+                index = future_to_index[future]
+                error = None
+                try:
+                    jobs = future.result()
+                except Exception as e:
+                    log.error(
+                        f"query {index} ({_query_label(queries[index])}) failed: {e}"
+                    )
+                    error = e
+                    errors[index] = str(e)
+                    jobs = pd.DataFrame()
+
+                if not dedupe:
+                    finish_query(index, jobs, error)
+                    continue
+                waiting[index] = (jobs, error)
+                while next_index in waiting:
+                    finish_query(next_index, *waiting.pop(next_index))
+                    next_index += 1
+    finally:
+        for host, limiter in held_limits.items():
+            release_host_rate_limit(host, limiter)
+
+    frames = [results[i] for i in sorted(results) if not results[i].empty]
+    combined = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    combined.attrs["errors"] = errors
+    return combined
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import random
-import time
 
 from bs4 import BeautifulSoup
 
@@ -35,7 +34,11 @@ class BaytScraper(Scraper):
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         self.scraper_input = scraper_input
         self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
+            proxies=self.proxies,
+            ca_cert=self.ca_cert,
+            is_tls=False,
+            has_retry=True,
+            stats=self.stats,
         )
         job_list: list[JobPost] = []
         page = 1
@@ -43,7 +46,7 @@ class BaytScraper(Scraper):
             scraper_input.results_wanted if scraper_input.results_wanted else 10
         )
 
-        while len(job_list) < results_wanted:
+        while len(job_list) < results_wanted and not self.cancelled():
             log.info(f"Fetching Bayt jobs page {page}")
             job_elements = self._fetch_jobs(self.scraper_input.search_term, page)
             if not job_elements:
@@ -76,7 +79,7 @@ class BaytScraper(Scraper):
                 break
 
             page += 1
-            time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
+            self.pause(random.uniform(self.delay, self.delay + self.band_delay))
 
         job_list = job_list[: scraper_input.results_wanted]
         return JobResponse(jobs=job_list)
@@ -89,7 +92,8 @@ class BaytScraper(Scraper):
             url = f"{self.base_url}/en/international/jobs/{query}-jobs/?page={page}"
             response = self.session.get(url)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, "html.parser")
+            with self.stats.timer("parse"):
+                soup = BeautifulSoup(response.text, "html.parser")
             job_listings = soup.find_all("li", attrs={"data-js-job": ""})
             log.debug(f"Found {len(job_listings)} job listing elements")
             return job_listings
@@ -128,13 +132,14 @@ class BaytScraper(Scraper):
             city=location,
             country=Country.from_string(self.country),
         )
-        return JobPost(
-            id=job_id,
-            title=job_title,
-            company_name=company_name,
-            location=location_obj,
-            job_url=job_url,
-        )
+        with self.stats.timer("validation"):
+            return JobPost(
+                id=job_id,
+                title=job_title,
+                company_name=company_name,
+                location=location_obj,
+                job_url=job_url,
+            )
 
     def _extract_job_url(self, job_general_information: BeautifulSoup) -> str | None:
         """
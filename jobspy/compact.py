@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import pandas as pd
+
+from jobspy.util import create_logger
+
+log = create_logger("Compact")
+
+# columns whose values repeat across rows: the site and salary fields, plus
+# the employer-level fields that are the same on every row of one company
+CATEGORY_COLUMNS = [
+    "site",
+    "company",
+    "location",
+    "job_type",
+    "salary_source",
+    "interval",
+    "currency",
+    "job_level",
+    "job_function",
+    "listing_type",
+    "company_industry",
+    "company_url",
+    "company_logo",
+    "company_url_direct",
+    "company_addresses",
+    "company_num_employees",
+    "company_revenue",
+    "company_description",
+    "experience_range",
+    "work_from_home_type",
+]
+# a column becomes categorical only when it has at most this many distinct
+# values per row, otherwise the categories cost more than they save
+CATEGORY_MAX_RATIO = 0.5
+NULLABLE_DTYPES = {
+    "min_amount": "Float64",
+    "max_amount": "Float64",
+    "company_rating": "Float64",
+    "company_reviews_count": "Int64",
+    "vacancy_count": "Int64",
+    "is_remote": "boolean",
+}
+
+
+def compact_jobs(jobs: pd.DataFrame) -> pd.DataFrame:
+    """
+    Returns a memory-lean copy of a scrape_jobs result (or a merged CSV of them).
+
+    Repeated strings (site, company, location, salary fields, industry and the
+    employer-level company_* fields such as company_description) become
+    categoricals, so each distinct value is stored once and rows hold small
+    codes. Salary amounts, ratings and counts get nullable numeric dtypes and
+    is_remote a nullable boolean. Values are unchanged; missing ones become
+    pd.NA, and string methods need `.astype(str)` on categorical columns.
+
+    `attrs["memory_usage"]` reports `memory_usage(deep=True)` in bytes before
+    and after, in total and for each converted column.
+    """
+    compact = jobs.copy()
+    if compact.empty:
+        compact.attrs["memory_usage"] = {"before": 0, "after": 0, "columns": {}}
+        return compact
+
+    before = jobs.memory_usage(deep=True, index=False)
+    for column in CATEGORY_COLUMNS:
+        if column not in compact.columns or isinstance(
+            compact[column].dtype, pd.CategoricalDtype
+        ):
+            continue
+        if compact[column].nunique() <= CATEGORY_MAX_RATIO * len(compact):
+            compact[column] = compact[column].astype("category")
+    for column, dtype in NULLABLE_DTYPES.items():
+        if column not in compact.columns:
+            continue
+        values = compact[column]
+        if dtype != "boolean":
+            values = pd.to_numeric(values, errors="coerce")
+            if dtype == "Int64":
+                values = values.round()
+        compact[column] = values.astype(dtype)
+
+    after = compact.memory_usage(deep=True, index=False)
+    changed = [
+        column
+        for column in compact.columns
+        if compact[column].dtype != jobs[column].dtype
+    ]
+    compact.attrs["memory_usage"] = {
+        "before": int(before.sum()),
+        "after": int(after.sum()),
+        "columns": {
+            column: {"before": int(before[column]), "after": int(after[column])}
+            for column in changed
+        },
+    }
+    log.info(
+        f"result frame memory {before.sum() / 2**20:.2f} MB -> {after.sum() / 2**20:.2f} MB"
+    )
+    return compact
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+import time
+
+import pandas as pd
+
+from jobspy.util import create_logger, load_pyarrow
+
+log = create_logger("Datasets")
+
+
+class SharedDatasets:
+    """
+    Completed result sets written once to disk and shared by every reader.
+
+    Datasets are keyed by result fingerprint. With pyarrow they are Arrow IPC
+    (Feather v2) files that each process opens memory-mapped, so the columns
+    are backed by the page cache rather than copied per session or process:
+    string columns (descriptions, titles, companies...) are pd.ArrowDtype
+    columns over the mapped buffers. Without pyarrow they are pickles, loaded
+    once per process. Within a process every reader of a fingerprint gets the
+    same DataFrame, which must not be modified in place.
+
+    Readers (e.g. Streamlit sessions) `acquire` a dataset under a holder id
+    and `release` it when they move on. A hold lapses after `lease_seconds`
+    without a `get`, for sessions that disappear without releasing. Past
+    `max_datasets` files (or `max_bytes` on disk), the least recently used
+    ones that no live holder in this process references are deleted; a
+    process that still has one mapped keeps reading it (POSIX semantics,
+    on Windows the deletion is retried on a later eviction).
+    """
+
+    def __init__(
+        self,
+        directory: str | None = None,
+        max_datasets: int = 16,
+        max_bytes: int | None = None,
+        lease_seconds: float = 3600,
+    ):
+        self.directory = directory or os.path.join(
+            tempfile.gettempdir(), "jobspy-datasets"
+        )
+        os.makedirs(self.directory, exist_ok=True)
+        self.max_datasets = max_datasets
+        self.max_bytes = max_bytes
+        self.lease_seconds = lease_seconds
+        self.arrow = load_pyarrow()
+        self.extension = ".arrow" if self.arrow is not None else ".pkl"
+        self.frames: dict[str, pd.DataFrame] = {}
+        self.holders: dict[str, dict[str, float]] = {}
+        self.lock = threading.Lock()
+
+    def path(self, fingerprint: str) -> str:
+        return os.path.join(self.directory, f"{fingerprint}{self.extension}")
+
+    def __contains__(self, fingerprint: str) -> bool:
+        return os.path.exists(self.path(fingerprint))
+
+    def put(self, fingerprint: str, jobs: pd.DataFrame) -> bool:
+        """Writes the dataset unless it exists; False if it cannot be stored"""
+        path = self.path(fingerprint)
+        if os.path.exists(path):
+            return True
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            if self.arrow is None:
+                jobs.to_pickle(temp_path)
+            else:
+                table = self.arrow.Table.from_pandas(jobs, preserve_index=False)
+                with self.arrow.OSFile(temp_path, "wb") as sink:
+                    with self.arrow.ipc.new_file(sink, table.schema) as writer:
+                        writer.write_table(table)
+            # readers only ever see complete files
+            os.replace(temp_path, path)
+        except Exception as e:
+            log.warning(f"could not store dataset {fingerprint}: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            return False
+        self.evict(keep=fingerprint)
+        return True
+
+    def get(self, fingerprint: str, holder: str | None = None) -> pd.DataFrame | None:
+        """The dataset, opened once per process, or None if it was evicted"""
+        with self.lock:
+            if holder is not None and holder in self.holders.get(fingerprint, {}):
+                self.holders[fingerprint][holder] = time.time()
+            jobs = self.frames.get(fingerprint)
+        if jobs is not None:
+            return jobs
+        path = self.path(fingerprint)
+        try:
+            if self.arrow is None:
+                jobs = pd.read_pickle(path)
+            else:
+                source = self.arrow.memory_map(path, "r")
+                table = self.arrow.ipc.open_file(source).read_all()
+                jobs = table.to_pandas(types_mapper=self._string_dtype)
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        with self.lock:
+            return self.frames.setdefault(fingerprint, jobs)
+
+    def _string_dtype(self, arrow_type):
+        """
+        pd.ArrowDtype for string columns, whose values then stay in the memory
+        map instead of being copied into Python strings; other columns convert
+        as usual (numbers are cheap, and dates keep their usual dtype)
+        """
+        types = self.arrow.types
+        if types.is_string(arrow_type) or types.is_large_string(arrow_type):
+            return pd.ArrowDtype(arrow_type)
+        return None
+
+    def acquire(self, fingerprint: str, holder: str) -> pd.DataFrame | None:
+        with self.lock:
+            self.holders.setdefault(fingerprint, {})[holder] = time.time()
+        try:
+            # the file's mtime is the dataset's last use for LRU eviction
+            os.utime(self.path(fingerprint))
+        except FileNotFoundError:
+            return None
+        return self.get(fingerprint, holder)
+
+    def release(self, fingerprint: str, holder: str):
+        """Drops the hold; the process forgets the frame once nobody holds it"""
+        with self.lock:
+            holders = self.holders.get(fingerprint, {})
+            holders.pop(holder, None)
+            if not self._live(fingerprint):
+                self.holders.pop(fingerprint, None)
+                self.frames.pop(fingerprint, None)
+
+    def refcount(self, fingerprint: str) -> int:
+        with self.lock:
+            return self._live(fingerprint)
+
+    def _live(self, fingerprint: str) -> int:
+        now = time.time()
+        return sum(
+            now - seen <= self.lease_seconds
+            for seen in self.holders.get(fingerprint, {}).values()
+        )
+
+    def evict(self, keep: str | None = None):
+        """Deletes the least recently used unheld datasets (other than `keep`) beyond the limits"""
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(self.extension):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name[: -len(self.extension)]))
+        entries.sort()
+        count, size = len(entries), sum(entry[1] for entry in entries)
+        for _, file_size, fingerprint in entries:
+            if count <= self.max_datasets and (
+                self.max_bytes is None or size <= self.max_bytes
+            ):
+                break
+            with self.lock:
+                if fingerprint == keep or self._live(fingerprint):
+                    continue
+                self.holders.pop(fingerprint, None)
+                self.frames.pop(fingerprint, None)
+            try:
+                os.remove(self.path(fingerprint))
+            except OSError:
+                continue
+            log.info(f"evicted dataset {fingerprint}")
+            count, size = count - 1, size - file_size
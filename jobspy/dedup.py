@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from functools import lru_cache
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import numpy as np
+import pandas as pd
+
+TRACKING_PARAMS = {
+    "fbclid",
+    "from",
+    "gclid",
+    "iis",
+    "iisn",
+    "mc_cid",
+    "mc_eid",
+    "ref",
+    "refid",
+    "source",
+    "src",
+    "tk",
+    "trackingid",
+    "trk",
+    "vjs",
+}
+
+_word_regex = re.compile(r"\w+")
+# distinct description words whose hashes are kept for reuse
+TOKEN_HASH_CACHE_SIZE = 2**17
+_band_bits = 16
+_bands = 64 // _band_bits
+_shingle_mult = np.array([0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F], dtype=np.uint64)
+
+
+def canonicalize_url(url: str | None) -> str | None:
+    """
+    Normalizes a job url so the same posting reached through different
+    tracking links compares equal: lowercases the host, drops `www.`, the
+    fragment, tracking parameters and trailing slashes, and sorts the query.
+    """
+    if not url or not isinstance(url, str):
+        return None
+    parts = urlsplit(url.strip())
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    params = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith("utm_")
+    ]
+    return urlunsplit(
+        ("https", host, parts.path.rstrip("/"), urlencode(sorted(params)), "")
+    )
+
+
+def normalize_text(text) -> str:
+    if not isinstance(text, str):
+        return ""
+    return " ".join(_word_regex.findall(text.lower()))
+
+
+def _normalize_location(location) -> str:
+    """Keeps city and state so 'Seattle, WA, US' matches 'Seattle, WA, USA'"""
+    if not isinstance(location, str):
+        return ""
+    return ",".join(normalize_text(part) for part in location.split(",")[:2])
+
+
+@lru_cache(maxsize=TOKEN_HASH_CACHE_SIZE)
+def _token_hash(token: str) -> int:
+    digest = hashlib.blake2b(token.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def simhash(text: str | None) -> int | None:
+    """
+    64-bit SimHash over word 3-shingles. Hashes of the most recently seen
+    TOKEN_HASH_CACHE_SIZE words are cached and shingle hashes are combined
+    with NumPy, so a description costs one pass over its words.
+    """
+    tokens = _word_regex.findall(text.lower()) if isinstance(text, str) else []
+    if not tokens:
+        return None
+    hashes = np.fromiter((_token_hash(t) for t in tokens), np.uint64, len(tokens))
+    if len(hashes) >= 3:
+        hashes = (
+            hashes[:-2] * _shingle_mult[0] + hashes[1:-1] * _shingle_mult[1]
+        ) ^ hashes[2:]
+    bits = np.unpackbits(hashes.view(np.uint8).reshape(-1, 8), axis=1)
+    votes = bits.sum(axis=0, dtype=np.int64) * 2 > len(hashes)
+    return int.from_bytes(np.packbits(votes).tobytes(), "big")
+
+
+def _title_tokens(title: str) -> frozenset[str]:
+    return frozenset(title.split())
+
+
+class JobDeduplicator:
+    """
+    Incremental duplicate detector for job records from any mix of sites.
+
+    A record is a duplicate of an earlier one when it has the same id, the
+    same canonical `job_url_direct`, or, for records from different sites,
+    the same normalized title/company/location or a description whose SimHash
+    is within `max_distance` bits of one from the same company and location
+    with a similar title. Near-duplicate candidates are found through
+    banded SimHash buckets, so each record costs roughly constant time.
+    """
+
+    def __init__(
+        self,
+        max_distance: int = 3,
+        min_title_similarity: float = 0.6,
+        cross_site_only: bool = True,
+    ):
+        self.max_distance = max_distance
+        self.min_title_similarity = min_title_similarity
+        self.cross_site_only = cross_site_only
+        self.ids: list[str] = []
+        self.sites: list = []
+        self.roots: list[int] = []
+        self.titles: list[frozenset[str]] = []
+        self.locations: list[str] = []
+        self.hashes: list[int | None] = []
+        self.by_id: dict[str, int] = {}
+        self.by_url: dict[str, int] = {}
+        self.by_key: dict[str, list[int]] = {}
+        self.buckets: dict[tuple, list[int]] = {}
+
+    def __len__(self):
+        return len(self.ids)
+
+    def _root(self, index: int) -> int:
+        while self.roots[index] != index:
+            self.roots[index] = self.roots[self.roots[index]]
+            index = self.roots[index]
+        return index
+
+    def _other_site(self, index: int, site) -> bool:
+        return not self.cross_site_only or self.sites[index] != site
+
+    def add(self, job: dict) -> tuple[str | None, str | None]:
+        """
+        Registers a job and returns (id of the job it duplicates, reason),
+        or (None, None) if it is new. Reasons: id, url, key, description.
+        """
+        job_id = job.get("id") or job.get("job_url")
+        if job_id in self.by_id:
+            return self.ids[self._root(self.by_id[job_id])], "id"
+
+        site = job.get("site")
+        title = normalize_text(job.get("title"))
+        company = normalize_text(job.get("company"))
+        location = _normalize_location(job.get("location"))
+        key = hashlib.blake2b(
+            f"{title}|{company}|{location}".encode(), digest_size=8
+        ).hexdigest()
+        url = canonicalize_url(job.get("job_url_direct"))
+        fingerprint = simhash(job.get("description"))
+        title_tokens = _title_tokens(title)
+
+        match, reason = None, None
+        if url and url in self.by_url:
+            match, reason = self.by_url[url], "url"
+        if match is None and title:
+            for candidate in self.by_key.get(key, ()):
+                if self._other_site(candidate, site):
+                    match, reason = candidate, "key"
+                    break
+        if match is None and fingerprint is not None:
+            match = self._find_near_duplicate(
+                company, location, site, title_tokens, fingerprint
+            )
+            reason = "description" if match is not None else None
+
+        index = len(self.ids)
+        self.ids.append(job_id)
+        self.sites.append(site)
+        self.roots.append(self._root(match) if match is not None else index)
+        self.titles.append(title_tokens)
+        self.locations.append(location)
+        self.hashes.append(fingerprint)
+        self.by_id[job_id] = index
+        if url:
+            self.by_url.setdefault(url, index)
+        if title:
+            self.by_key.setdefault(key, []).append(index)
+        if fingerprint is not None:
+            for band in range(_bands):
+                band_value = (fingerprint >> (band * _band_bits)) & 0xFFFF
+                self.buckets.setdefault((company, band, band_value), []).append(index)
+
+        if match is None:
+            return None, None
+        return self.ids[self.roots[index]], reason
+
+    def _find_near_duplicate(
+        self,
+        company: str,
+        location: str,
+        site,
+        title_tokens: frozenset[str],
+        fingerprint: int,
+    ) -> int | None:
+        checked = set()
+        for band in range(_bands):
+            band_value = (fingerprint >> (band * _band_bits)) & 0xFFFF
+            for candidate in self.buckets.get((company, band, band_value), ()):
+                if candidate in checked:
+                    continue
+                checked.add(candidate)
+                if not self._other_site(candidate, site):
+                    continue
+                if (
+                    fingerprint ^ self.hashes[candidate]
+                ).bit_count() > self.max_distance:
+                    continue
+                if location and self.locations[candidate] not in ("", location):
+                    continue
+                other_title = self.titles[candidate]
+                union = title_tokens | other_title
+                if union and (
+                    len(title_tokens & other_title) / len(union)
+                    < self.min_title_similarity
+                ):
+                    continue
+                return candidate
+        return None
+
+    def add_frame(self, jobs: pd.DataFrame) -> pd.DataFrame:
+        """
+        Registers every row of `jobs` in order and returns a copy with
+        `duplicate_of` and `duplicate_reason` columns (None for new jobs)
+        """
+        columns = ["id", "site", "job_url", "job_url_direct", "title"]
+        columns += ["company", "location", "description"]
+        present = [c for c in columns if c in jobs.columns]
+        duplicate_of, reasons = [], []
+        for values in zip(*(jobs[c].tolist() for c in present)):
+            record = {
+                c: (None if v is None or v != v else v) for c, v in zip(present, values)
+            }
+            match, reason = self.add(record)
+            duplicate_of.append(match)
+            reasons.append(reason)
+        jobs = jobs.copy()
+        jobs["duplicate_of"] = duplicate_of
+        jobs["duplicate_reason"] = reasons
+        return jobs
+
+
+def deduplicate_jobs(jobs: pd.DataFrame, drop: bool = True, **kwargs) -> pd.DataFrame:
+    """
+    Finds duplicates within `jobs` with a fresh JobDeduplicator (kwargs are
+    passed to it). Keeps the first row of each cluster when `drop` is set,
+    otherwise returns every row with `duplicate_of`/`duplicate_reason` columns.
+    """
+    if jobs.empty:
+        return jobs
+    marked = JobDeduplicator(**kwargs).add_frame(jobs)
+    if not drop:
+        return marked
+    kept = marked[marked["duplicate_of"].isna()]
+    return kept.drop(columns=["duplicate_of", "duplicate_reason"])
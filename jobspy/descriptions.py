@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import pandas as pd
+
+from jobspy.glassdoor import Glassdoor
+from jobspy.indeed import Indeed
+from jobspy.indeed.util import is_job_remote as indeed_is_job_remote
+from jobspy.linkedin import LinkedIn
+from jobspy.linkedin.util import is_job_remote as linkedin_is_job_remote
+from jobspy.model import Country, Location, SalarySource, Scraper, ScraperInput, Site
+from jobspy.util import create_logger, extract_emails_from_text, extract_salary
+from jobspy.ziprecruiter import ZipRecruiter
+
+log = create_logger("Descriptions")
+
+# sites whose scrapers can fetch one job's description (Scraper.fetch_description)
+DETAIL_SCRAPERS = {
+    Site.INDEED: Indeed,
+    Site.LINKEDIN: LinkedIn,
+    Site.GLASSDOOR: Glassdoor,
+    Site.ZIP_RECRUITER: ZipRecruiter,
+}
+# sites whose scrapers decide is_remote from the description, as they do it
+REMOTE_CHECKS = {
+    Site.INDEED: lambda job, description: indeed_is_job_remote(job, description),
+    Site.LINKEDIN: lambda job, description: linkedin_is_job_remote(
+        job.get("title"), description, Location(city=_text(job.get("location")))
+    ),
+}
+
+
+def _text(value) -> str | None:
+    return value if isinstance(value, str) else None
+
+
+def _missing(value) -> bool:
+    return value is None or bool(pd.isna(value))
+
+
+class DescriptionFetcher:
+    """
+    Descriptions of jobs scraped with fetch_descriptions=False, fetched when needed.
+
+    `get` returns a job's description, fetching it the first time with its
+    site's scraper: Indeed's job data API, LinkedIn's /jobs/view page,
+    Glassdoor's JobDetailQuery or ZipRecruiter's job page. `prefetch` queues
+    jobs (e.g. the visible page of a table) on a few background threads so
+    they are ready when selected; a `get` for a job still queued fetches it
+    right away instead of waiting its turn. Jobs that already have a
+    description are returned as they are.
+
+    Descriptions are cached by job id; the least recently used beyond
+    `max_entries` are dropped. Failed fetches are not cached. Sites without a
+    detail fetch (Google, Bayt, Naukri, which return descriptions with the
+    listings) give None.
+
+    scrape_jobs also reads emails, is_remote (Indeed, LinkedIn) and, for US
+    jobs without a listed salary, the salary from a description; `fields`
+    and `fill` compute those columns once the description is fetched.
+    """
+
+    def __init__(
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        description_format: str = "markdown",
+        country: str = "usa",
+        max_entries: int = 1000,
+        max_workers: int = 4,
+        enforce_annual_salary: bool = False,
+    ):
+        self.proxies = proxies
+        self.enforce_annual_salary = enforce_annual_salary
+        self.ca_cert = ca_cert
+        self.scraper_input = ScraperInput(
+            site_type=list(DETAIL_SCRAPERS),
+            country=Country.from_string(country),
+            description_format=description_format,
+        )
+        self.max_entries = max_entries
+        self.descriptions: OrderedDict[str, Future] = OrderedDict()
+        self.scrapers: dict[Site, Scraper] = {}
+        self.lock = threading.Lock()
+        self.scraper_lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="descriptions"
+        )
+
+    def get(self, job: dict | pd.Series) -> str | None:
+        """The job's description (needs its id, site and job_url), or None if unavailable"""
+        description = job.get("description")
+        if isinstance(description, str) and description:
+            return description
+        future, _ = self._claim(job)
+        self._run(job, future)
+        try:
+            return future.result()
+        except Exception as e:
+            log.warning(f"could not fetch the description of {job['id']}: {e}")
+            return None
+
+    def fields(self, job: dict | pd.Series, description: str | None = None) -> dict:
+        """
+        The description and the columns scrape_jobs derives from it: emails,
+        is_remote where the site reads it from the description, and the
+        salary columns when the job has no listed salary and the description
+        states one. Fetches the description unless given; empty without one.
+        """
+        if description is None:
+            description = self.get(job)
+        if not description:
+            return {}
+        emails = extract_emails_from_text(description)
+        fields = {
+            "description": description,
+            "emails": ", ".join(emails) if emails else None,
+        }
+        site = Site(str(job["site"]))
+        if site in REMOTE_CHECKS:
+            listed_remote = job.get("is_remote")
+            fields["is_remote"] = (
+                not _missing(listed_remote) and bool(listed_remote)
+            ) or REMOTE_CHECKS[site](job, description)
+        if self.scraper_input.country == Country.USA and _missing(
+            job.get("min_amount")
+        ):
+            interval, min_amount, max_amount, currency = extract_salary(
+                description, enforce_annual_salary=self.enforce_annual_salary
+            )
+            if min_amount:
+                fields.update(
+                    interval=interval,
+                    min_amount=min_amount,
+                    max_amount=max_amount,
+                    currency=currency,
+                    salary_source=SalarySource.DESCRIPTION.value,
+                )
+        return fields
+
+    def fill(self, jobs: pd.DataFrame) -> pd.DataFrame:
+        """A copy of `jobs` with descriptions fetched and `fields` applied to every row"""
+        self.prefetch(jobs)
+        jobs = jobs.copy()
+        for position, (_, job) in enumerate(jobs.iterrows()):
+            for column, value in self.fields(job).items():
+                if column not in jobs:
+                    jobs[column] = None
+                jobs.iloc[position, jobs.columns.get_loc(column)] = value
+        return jobs
+
+    def prefetch(self, jobs: pd.DataFrame | list[dict]):
+        """Starts fetching the descriptions of `jobs` in the background"""
+        rows = jobs.to_dict("records") if isinstance(jobs, pd.DataFrame) else jobs
+        for job in rows:
+            description = job.get("description")
+            if isinstance(description, str) and description:
+                continue
+            future, new = self._claim(job)
+            if new:
+                self.executor.submit(self._run, job, future)
+
+    def cached(self, job_id: str) -> bool:
+        with self.lock:
+            future = self.descriptions.get(job_id)
+        return future is not None and future.done()
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+    def _claim(self, job) -> tuple[Future, bool]:
+        """The job's future, and whether it was just created"""
+        job_id = job["id"]
+        with self.lock:
+            future = self.descriptions.get(job_id)
+            if future is not None:
+                self.descriptions.move_to_end(job_id)
+                return future, False
+            future = Future()
+            self.descriptions[job_id] = future
+            while len(self.descriptions) > self.max_entries:
+                self.descriptions.popitem(last=False)
+        return future, True
+
+    def _run(self, job, future: Future):
+        """Fetches into `future` unless another thread already is"""
+        with self.lock:
+            if future.running() or future.done():
+                return
+            future.set_running_or_notify_cancel()
+        try:
+            future.set_result(self._fetch(job))
+        except Exception as e:
+            with self.lock:
+                if self.descriptions.get(job["id"]) is future:
+                    del self.descriptions[job["id"]]
+            future.set_exception(e)
+
+    def _fetch(self, job) -> str | None:
+        site = Site(str(job["site"]))
+        if site not in DETAIL_SCRAPERS:
+            return None
+        with self.scraper_lock:
+            scraper = self.scrapers.get(site)
+            if scraper is None:
+                scraper = DETAIL_SCRAPERS[site](
+                    proxies=self.proxies, ca_cert=self.ca_cert
+                )
+                self.scrapers[site] = scraper
+        with scraper.stats.timer("total"):
+            return scraper.fetch_description(job, self.scraper_input)
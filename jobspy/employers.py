@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+
+# JobPost fields that describe the employer rather than the job
+EMPLOYER_FIELDS = (
+    "company_name",
+    "company_url",
+    "company_url_direct",
+    "company_addresses",
+    "company_industry",
+    "company_num_employees",
+    "company_revenue",
+    "company_description",
+    "company_logo",
+)
+
+
+class EmployerCache:
+    """
+    Employer details parsed once per employer and shared by all their jobs.
+
+    Scrapers key employers by a stable site-specific id (Indeed uses the
+    company page URL) and store the company_* fields of the first job seen
+    from that employer. Later jobs reuse the same record, so the employer's
+    strings exist once however many jobs reference them, and a scraper can
+    leave the employer details out of later requests. Entries expire after
+    `ttl` seconds; the least recently used beyond `max_entries` are dropped.
+    """
+
+    def __init__(self, ttl: float = 24 * 3600, max_entries: int = 10_000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.entries: OrderedDict[tuple[str, str], tuple[dict, float]] = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, site: str, key: str) -> dict | None:
+        with self.lock:
+            entry = self.entries.get((site, key))
+            if entry is None or time.time() - entry[1] > self.ttl:
+                self.misses += 1
+                return None
+            self.entries.move_to_end((site, key))
+            self.hits += 1
+            return entry[0]
+
+    def put(self, site: str, key: str, employer: dict) -> dict:
+        """Stores the employer fields and returns the shared record"""
+        record = {field: employer.get(field) for field in EMPLOYER_FIELDS}
+        with self.lock:
+            self.entries[(site, key)] = (record, time.time())
+            self.entries.move_to_end((site, key))
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return record
+
+    def table(self, site: str | None = None) -> pd.DataFrame:
+        """The employer table: one row per cached employer, keyed by site and key"""
+        with self.lock:
+            rows = [
+                {"site": entry_site, "employer_key": key, **record}
+                for (entry_site, key), (record, _) in self.entries.items()
+                if site is None or entry_site == site
+            ]
+        return pd.DataFrame(rows, columns=["site", "employer_key", *EMPLOYER_FIELDS])
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+# shared by the scrapers of every scrape_jobs call in this process
+employer_cache = EmployerCache()
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+
+ALL = "All"
+DATE_BUCKETS = {"Last 7 days": 7, "Last 14 days": 14, "Last 30 days": 30}
+SALARY_BUCKETS = ("Has Salary", "No Salary Specified")
+
+
+class _CategoricalFacet:
+    """Sorted category codes of one column plus the row positions of each value"""
+
+    def __init__(self, column: pd.Series):
+        codes, categories = pd.factorize(
+            column.fillna("Unknown").astype(str), sort=True
+        )
+        self.codes = codes.astype(np.int32)
+        self.values = list(categories)
+        self.lookup = {value: code for code, value in enumerate(self.values)}
+        self.positions = np.argsort(self.codes, kind="stable")
+        self.bounds = np.searchsorted(
+            self.codes[self.positions], np.arange(len(self.values) + 1)
+        )
+
+    def mask(self, value: str, size: int) -> np.ndarray:
+        mask = np.zeros(size, dtype=bool)
+        code = self.lookup.get(value)
+        if code is not None:
+            mask[self.positions[self.bounds[code] : self.bounds[code + 1]]] = True
+        return mask
+
+    def counts(self, mask: np.ndarray) -> dict[str, int]:
+        counts = np.bincount(self.codes[mask], minlength=len(self.values))
+        return dict(zip(self.values, counts.tolist()))
+
+
+class FacetIndex:
+    """
+    Filter index over one result set, built once and queried on every rerun.
+
+    Categorical columns (company, location, site by default) are stored as
+    sorted codes with the row positions of each value, salary presence as a
+    bitmap and posting dates as day numbers, so a combination of filters is
+    a few bitwise ANDs over NumPy arrays. `counts` returns, for one facet,
+    how many rows each value would keep given the other selections.
+
+    Selections are a dict keyed by column name, `"date_posted"` (a key of
+    DATE_BUCKETS) or `"salary"` (one of SALARY_BUCKETS); None or "All"
+    means no filter.
+    """
+
+    def __init__(self, jobs: pd.DataFrame, columns=("company", "location", "site")):
+        self.size = len(jobs)
+        self.categorical = {
+            column: _CategoricalFacet(jobs[column])
+            for column in columns
+            if column in jobs.columns
+        }
+        min_amount = jobs.get("min_amount", pd.Series(np.nan, index=jobs.index))
+        max_amount = jobs.get("max_amount", pd.Series(np.nan, index=jobs.index))
+        self.has_salary = (min_amount.notna() | max_amount.notna()).to_numpy()
+        dates = pd.to_datetime(jobs.get("date_posted"), errors="coerce")
+        if dates is None:
+            dates = pd.Series(pd.NaT, index=jobs.index)
+        self.days = dates.dt.normalize().to_numpy(dtype="datetime64[D]").astype("int64")
+        self.days[dates.isna().to_numpy()] = np.iinfo(np.int64).min
+
+    def values(self, facet: str) -> list[str]:
+        if facet == "date_posted":
+            return list(DATE_BUCKETS)
+        if facet == "salary":
+            return list(SALARY_BUCKETS)
+        return self.categorical[facet].values
+
+    def _date_mask(self, bucket: str, now: datetime | None) -> np.ndarray:
+        cutoff = (now or datetime.now()) - timedelta(days=DATE_BUCKETS[bucket])
+        return self.days >= np.datetime64(cutoff.date(), "D").astype("int64")
+
+    def _facet_mask(self, facet: str, value, now: datetime | None) -> np.ndarray:
+        if facet == "date_posted":
+            return self._date_mask(value, now)
+        if facet == "salary":
+            return self.has_salary if value == SALARY_BUCKETS[0] else ~self.has_salary
+        return self.categorical[facet].mask(value, self.size)
+
+    def mask(
+        self,
+        selections: dict,
+        base: np.ndarray | None = None,
+        exclude: str | None = None,
+        now: datetime | None = None,
+    ) -> np.ndarray:
+        """
+        :param base: rows to start from (e.g. search hits), all rows if None
+        :param exclude: facet whose selection is ignored
+        :return: boolean mask of the rows matching every selection
+        """
+        mask = np.ones(self.size, dtype=bool) if base is None else base.copy()
+        for facet, value in selections.items():
+            if value is None or value == ALL or facet == exclude:
+                continue
+            mask &= self._facet_mask(facet, value, now)
+        return mask
+
+    def counts(
+        self,
+        facet: str,
+        selections: dict,
+        base: np.ndarray | None = None,
+        now: datetime | None = None,
+    ) -> dict[str, int]:
+        """Rows each value of `facet` would keep under the other selections"""
+        mask = self.mask(selections, base, exclude=facet, now=now)
+        if facet == "date_posted":
+            return {
+                bucket: int(np.count_nonzero(mask & self._date_mask(bucket, now)))
+                for bucket in DATE_BUCKETS
+            }
+        if facet == "salary":
+            with_salary = int(np.count_nonzero(mask & self.has_salary))
+            return {
+                SALARY_BUCKETS[0]: with_salary,
+                SALARY_BUCKETS[1]: int(np.count_nonzero(mask)) - with_salary,
+            }
+        return self.categorical[facet].counts(mask)
@@ -61,7 +61,11 @@ class Glassdoor(Scraper):
         self.base_url = self.scraper_input.country.get_glassdoor_url()
 
         self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, has_retry=True
+            proxies=self.proxies,
+            ca_cert=self.ca_cert,
+            has_retry=True,
+            hedge=self.hedge,
+            stats=self.stats,
         )
         token = self._get_csrf_token()
         headers["gd-csrf-token"] = token if token else fallback_token
@@ -80,6 +84,8 @@ class Glassdoor(Scraper):
         tot_pages = (scraper_input.results_wanted // self.jobs_per_page) + 2
         range_end = min(tot_pages, self.max_pages + 1)
         for page in range(range_start, range_end):
+            if self.cancelled():
+                break
             log.info(f"search page: {page} / {range_end - 1}")
             try:
                 jobs, cursor = self._fetch_jobs_page(
@@ -117,7 +123,8 @@ class Glassdoor(Scraper):
             if response.status_code != 200:
                 exc_msg = f"bad response status code: {response.status_code}"
                 raise GlassdoorException(exc_msg)
-            res_json = response.json()[0]
+            with self.stats.timer("parse"):
+                res_json = response.json()[0]
             if "errors" in res_json:
                 raise ValueError("Error encountered in API response")
         except (
@@ -185,10 +192,12 @@ class Glassdoor(Scraper):
             location = parse_location(location_name)
 
         compensation = parse_compensation(job["header"])
-        try:
-            description = self._fetch_job_description(job_id)
-        except:
-            description = None
+        description = None
+        if self.scraper_input.fetch_descriptions:
+            try:
+                description = self._fetch_job_description(job_id)
+            except:
+                description = None
         company_url = f"{self.base_url}Overview/W-EI_IE{company_id}.htm"
         company_logo = (
             job_data["jobview"].get("overview", {}).get("squareLogoUrl", None)
@@ -199,21 +208,22 @@ class Glassdoor(Scraper):
             .get("adOrderSponsorshipLevel", "")
             .lower()
         )
-        return JobPost(
-            id=f"gd-{job_id}",
-            title=title,
-            company_url=company_url if company_id else None,
-            company_name=company_name,
-            date_posted=date_posted,
-            job_url=job_url,
-            location=location,
-            compensation=compensation,
-            is_remote=is_remote,
-            description=description,
-            emails=extract_emails_from_text(description) if description else None,
-            company_logo=company_logo,
-            listing_type=listing_type,
-        )
+        with self.stats.timer("validation"):
+            return JobPost(
+                id=f"gd-{job_id}",
+                title=title,
+                company_url=company_url if company_id else None,
+                company_name=company_name,
+                date_posted=date_posted,
+                job_url=job_url,
+                location=location,
+                compensation=compensation,
+                is_remote=is_remote,
+                description=description,
+                emails=extract_emails_from_text(description) if description else None,
+                company_logo=company_logo,
+                listing_type=listing_type,
+            )
 
     def _fetch_job_description(self, job_id):
         """
@@ -244,15 +254,32 @@ class Glassdoor(Scraper):
                 """,
             }
         ]
-        res = requests.post(url, json=body, headers=headers)
+        res = self.session.post(url, timeout_seconds=15, data=json.dumps(body))
         if res.status_code != 200:
             return None
         data = res.json()[0]
         desc = data["data"]["jobview"]["job"]["description"]
         if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-            desc = markdown_converter(desc)
+            with self.stats.timer("markdown"):
+                desc = markdown_converter(desc)
         return desc
 
+    def fetch_description(self, job: dict, scraper_input: ScraperInput) -> str | None:
+        """
+        Fetches one job's description with the JobDetailQuery used while scraping
+        """
+        self.scraper_input = scraper_input
+        if self.session is None:
+            # the job url carries the country's Glassdoor url
+            self.base_url = job["job_url"].split("job-listing/")[0]
+            self.session = create_session(
+                proxies=self.proxies, ca_cert=self.ca_cert, has_retry=True, stats=self.stats
+            )
+            token = self._get_csrf_token()
+            headers["gd-csrf-token"] = token if token else fallback_token
+            self.session.headers.update(headers)
+        return self._fetch_job_description(int(job["id"].removeprefix("gd-")))
+
     def _get_location(self, location: str, is_remote: bool) -> (int, str):
         if not location or is_remote:
             return "11047", "STATE"  # remote options
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import math
 import re
-import json
 from typing import Tuple
 from datetime import datetime, timedelta
 
@@ -17,7 +16,13 @@ from jobspy.model import (
     JobType,
 )
 from jobspy.util import extract_emails_from_text, extract_job_type, create_session
-from jobspy.google.util import log, find_job_info_initial_page, find_job_info
+from jobspy.google.util import (
+    log,
+    find_job_info_initial_page,
+    find_job_info,
+    iter_job_infos,
+    loads,
+)
 
 
 class Google(Scraper):
@@ -48,7 +53,11 @@ class Google(Scraper):
         self.scraper_input.results_wanted = min(900, scraper_input.results_wanted)
 
         self.session = create_session(
-            proxies=self.proxies, ca_cert=self.ca_cert, is_tls=False, has_retry=True
+            proxies=self.proxies,
+            ca_cert=self.ca_cert,
+            is_tls=False,
+            has_retry=True,
+            stats=self.stats,
         )
         forward_cursor, job_list = self._get_initial_cursor_and_jobs()
         if forward_cursor is None:
@@ -62,6 +71,7 @@ class Google(Scraper):
         while (
             len(self.seen_urls) < scraper_input.results_wanted + scraper_input.offset
             and forward_cursor
+            and not self.cancelled()
         ):
             log.info(
                 f"search page: {page} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)}"
@@ -126,7 +136,8 @@ class Google(Scraper):
         pattern_fc = r'<div jsname="Yust4d"[^>]+data-async-fc="([^"]+)"'
         match_fc = re.search(pattern_fc, response.text)
         data_async_fc = match_fc.group(1) if match_fc else None
-        jobs_raw = find_job_info_initial_page(response.text)
+        with self.stats.timer("parse"):
+            jobs_raw = find_job_info_initial_page(response.text)
         jobs = []
         for job_raw in jobs_raw:
             job_post = self._parse_job(job_raw)
@@ -146,7 +157,8 @@ class Google(Scraper):
         start_idx = job_data.find("[[[")
         end_idx = job_data.rindex("]]]") + 3
         s = job_data[start_idx:end_idx]
-        parsed = json.loads(s)[0]
+        with self.stats.timer("parse"):
+            parsed = loads(s)[0]
 
         pattern_fc = r'data-async-fc="([^"]+)"'
         match_fc = re.search(pattern_fc, job_data)
@@ -156,9 +168,13 @@ class Google(Scraper):
             _, job_data = array
             if not job_data.startswith("[[["):
                 continue
-            job_d = json.loads(job_data)
-
-            job_info = find_job_info(job_d)
+            with self.stats.timer("parse"):
+                # decode only the job listing; the whole entry only if the key is not found as is
+                job_info = next(iter_job_infos(job_data), None)
+                if job_info is None:
+                    job_info = find_job_info(loads(job_data))
+            if job_info is None:
+                continue
             job_post = self._parse_job(job_info)
             if job_post:
                 jobs_on_page.append(job_post)
@@ -185,18 +201,19 @@ class Google(Scraper):
 
         description = job_info[19]
 
-        job_post = JobPost(
-            id=f"go-{job_info[28]}",
-            title=title,
-            company_name=company_name,
-            location=Location(
-                city=city, state=state, country=country[0] if country else None
-            ),
-            job_url=job_url,
-            date_posted=date_posted,
-            is_remote="remote" in description.lower() or "wfh" in description.lower(),
-            description=description,
-            emails=extract_emails_from_text(description),
-            job_type=extract_job_type(description),
-        )
+        with self.stats.timer("validation"):
+            job_post = JobPost(
+                id=f"go-{job_info[28]}",
+                title=title,
+                company_name=company_name,
+                location=Location(
+                    city=city, state=state, country=country[0] if country else None
+                ),
+                job_url=job_url,
+                date_posted=date_posted,
+                is_remote="remote" in description.lower() or "wfh" in description.lower(),
+                description=description,
+                emails=extract_emails_from_text(description),
+                job_type=extract_job_type(description),
+            )
         return job_post
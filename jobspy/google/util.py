@@ -1,41 +1,128 @@
+from __future__ import annotations
+
+import json
 import re
 
 from jobspy.util import create_logger
 
 log = create_logger("Google")
 
+try:
+    import orjson
+except ImportError:  # optional; the standard library decoder is used without it
+    orjson = None
+
+JSON_LIBRARY = "orjson" if orjson is not None else "json"
+# key of the job listing array in Google's job payloads
+JOB_INFO_KEY = "520084652"
+_JOB_INFO_NEEDLE = f'"{JOB_INFO_KEY}":'
+_decoder = json.JSONDecoder()
+# what follows a job listing on the initial search page: `]}]]]]]`
+_INITIAL_PAGE_END = re.compile(r"\]\s*}\s*\]\s*\]\s*\]\s*\]\s*\]")
+# index paths (list indices and dict keys) of the dict holding the job listing
+# in recent payloads, most recent first; tried before searching a payload
+_job_info_paths: list[tuple] = []
+_MAX_JOB_INFO_PATHS = 4
+
+
+def loads(data: str | bytes):
+    """json.loads, through orjson when it is installed"""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
 
 def find_job_info(jobs_data: list | dict) -> list | None:
-    """Iterates through the JSON data to find the job listings"""
-    if isinstance(jobs_data, dict):
-        for key, value in jobs_data.items():
-            if key == "520084652" and isinstance(value, list):
-                return value
-            else:
-                result = find_job_info(value)
-                if result:
-                    return result
-    elif isinstance(jobs_data, list):
-        for item in jobs_data:
-            result = find_job_info(item)
-            if result:
-                return result
-    return None
+    """
+    Finds the job listing in a decoded payload: first at the index paths it
+    was found at in recent payloads, otherwise by searching the payload
+    (depth first, without recursion), remembering where it was
+    """
+    for path in tuple(_job_info_paths):
+        node = _follow(jobs_data, path)
+        if isinstance(node, dict) and isinstance(node.get(JOB_INFO_KEY), list):
+            return node[JOB_INFO_KEY]
+    found = _search(jobs_data)
+    if found is None:
+        return None
+    path, job_info = found
+    if path not in _job_info_paths:
+        _job_info_paths.insert(0, path)
+        del _job_info_paths[_MAX_JOB_INFO_PATHS:]
+    return job_info
+
+
+def _follow(node, path: tuple):
+    for step in path:
+        if isinstance(node, list) and isinstance(step, int) and step < len(node):
+            node = node[step]
+        elif isinstance(node, dict) and step in node:
+            node = node[step]
+        else:
+            return None
+    return node
 
 
-def find_job_info_initial_page(html_text: str):
-    pattern = f'520084652":(' + r"\[.*?\]\s*])\s*}\s*]\s*]\s*]\s*]\s*]"
-    results = []
-    matches = re.finditer(pattern, html_text)
+def _search(jobs_data: list | dict) -> tuple[tuple, list] | None:
+    """Path of the first dict (depth first) holding the job listing, and the listing"""
+    stack = [(jobs_data, ())]
+    while stack:
+        node, path = stack.pop()
+        if isinstance(node, dict):
+            value = node.get(JOB_INFO_KEY)
+            if isinstance(value, list):
+                return path, value
+            children = node.items()
+        elif isinstance(node, list):
+            children = enumerate(node)
+        else:
+            continue
+        stack.extend(
+            (child, path + (step,))
+            for step, child in reversed(list(children))
+            if isinstance(child, (list, dict))
+        )
+    return None
+
 
-    import json
+def iter_job_infos(text: str, closing: re.Pattern | None = None):
+    """
+    Yields the job listings embedded as `"520084652":[...]` in a page or
+    payload, in order. The text is scanned for the key and only the array
+    after it is decoded, so the work is linear in the text. With `closing`,
+    the pattern that follows each array, the array is cut out at the next
+    match and decoded with `loads`, falling back to the incremental decoder
+    if that is not where it ends.
+    """
+    position = text.find(_JOB_INFO_NEEDLE)
+    while position != -1:
+        start = position + len(_JOB_INFO_NEEDLE)
+        while start < len(text) and text[start] in " \t\r\n":
+            start += 1
+        next_from = start
+        value = None
+        if closing is not None:
+            match = closing.search(text, start)
+            if match is None:
+                # no later array can be followed by it either
+                closing = None
+            else:
+                try:
+                    value, end = (
+                        loads(text[start : match.start() + 1]),
+                        match.start() + 1,
+                    )
+                except ValueError:
+                    value = None
+        if value is None:
+            try:
+                value, end = _decoder.raw_decode(text, start)
+            except json.JSONDecodeError as e:
+                log.error(f"Failed to parse job listing at {start}: {str(e)}")
+        if isinstance(value, list):
+            next_from = end
+            yield value
+        position = text.find(_JOB_INFO_NEEDLE, next_from)
 
-    for match in matches:
-        try:
-            parsed_data = json.loads(match.group(1))
-            results.append(parsed_data)
 
-        except json.JSONDecodeError as e:
-            log.error(f"Failed to parse match: {str(e)}")
-            results.append({"raw_match": match.group(0), "error": str(e)})
-    return results
+def find_job_info_initial_page(html_text: str) -> list[list]:
+    """Job listings of the initial search page"""
+    return list(iter_job_infos(html_text, _INITIAL_PAGE_END))
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Callable, TypeVar
+
+import numpy as np
+
+from jobspy.util import create_logger
+
+log = create_logger("Hedge")
+
+T = TypeVar("T")
+
+
+class _HostStats:
+    def __init__(self, window: int):
+        self.latencies: deque[float] = deque(maxlen=window)
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.budget_denied = 0
+
+
+class _Timer:
+    """Single daemon thread running callbacks once their delay has passed"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.condition = threading.Condition()
+        self.queue: list[tuple[float, int, Callable[[], None]]] = []
+        self.sequence = itertools.count()
+        self.thread: threading.Thread | None = None
+
+    def schedule(self, delay: float, callback: Callable[[], None]):
+        with self.condition:
+            entry = (time.monotonic() + delay, next(self.sequence), callback)
+            heapq.heappush(self.queue, entry)
+            if self.thread is None:
+                self.thread = threading.Thread(
+                    target=self._run, name=self.name, daemon=True
+                )
+                self.thread.start()
+            self.condition.notify()
+
+    def _run(self):
+        while True:
+            with self.condition:
+                while not self.queue or self.queue[0][0] > time.monotonic():
+                    timeout = (
+                        self.queue[0][0] - time.monotonic() if self.queue else None
+                    )
+                    self.condition.wait(timeout)
+                _, _, callback = heapq.heappop(self.queue)
+            try:
+                callback()
+            except Exception as e:
+                log.error(f"hedge timer callback failed: {e}")
+
+
+def _succeeded(future: Future) -> bool:
+    return future.exception() is None and getattr(future.result(), "ok", True)
+
+
+class HedgePolicy:
+    """
+    Hedged requests for slow proxies. When a request to a host has not
+    answered within the `percentile` latency of its recent requests, the same
+    request is sent through the next proxy.
+
+    The primary request runs on the caller's thread; only hedges use the
+    policy's `max_workers` threads, scheduled by a single timer thread. The
+    caller returns once the primary does: with the hedge's response if it
+    answered successfully first or the primary failed, else the primary's.
+
+    The delay is clamped to [`min_delay`, `max_delay`] seconds, and
+    `initial_delay` is used until `min_samples` latencies are known for the
+    host. At most a `budget` fraction of each host's requests are hedged.
+    Hedging needs at least two proxies; `metrics()` reports how often it won.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95,
+        budget: float = 0.1,
+        min_delay: float = 0.5,
+        max_delay: float = 8.0,
+        initial_delay: float = 3.0,
+        window: int = 200,
+        min_samples: int = 20,
+        max_workers: int = 16,
+    ):
+        self.percentile = percentile
+        self.budget = budget
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.initial_delay = initial_delay
+        self.window = window
+        self.min_samples = min_samples
+        self.lock = threading.Lock()
+        self.hosts: dict[str, _HostStats] = {}
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="hedge"
+        )
+        self.timer = _Timer("hedge-timer")
+
+    def _host(self, host: str) -> _HostStats:
+        stats = self.hosts.get(host)
+        if stats is None:
+            stats = self.hosts[host] = _HostStats(self.window)
+        return stats
+
+    def delay(self, host: str) -> float:
+        """Seconds to wait for a response from `host` before hedging"""
+        with self.lock:
+            latencies = list(self._host(host).latencies)
+        if len(latencies) < self.min_samples:
+            return self.initial_delay
+        threshold = float(np.percentile(latencies, self.percentile))
+        return min(max(threshold, self.min_delay), self.max_delay)
+
+    def _timed(self, host: str, send: Callable[[], T]) -> T:
+        started = time.monotonic()
+        result = send()
+        with self.lock:
+            self._host(host).latencies.append(time.monotonic() - started)
+        return result
+
+    def send(
+        self, host: str, primary: Callable[[], T], hedge: Callable[[], T] | None
+    ) -> T:
+        """
+        :param primary: sends the request through the current proxy
+        :param hedge: sends the same request through another proxy, or None
+        :return: the first successful response (or the primary's outcome)
+        """
+        with self.lock:
+            stats = self._host(host)
+            stats.requests += 1
+        if hedge is None:
+            return self._timed(host, primary)
+
+        call = {"finished": False, "hedge": None}
+
+        def send_hedge():
+            with self.lock:
+                if call["finished"]:
+                    return
+                if stats.hedges >= self.budget * stats.requests:
+                    stats.budget_denied += 1
+                    return
+                stats.hedges += 1
+                log.debug(f"hedging a slow request to {host}")
+                call["hedge"] = self.executor.submit(self._timed, host, hedge)
+
+        self.timer.schedule(self.delay(host), send_hedge)
+        try:
+            result = self._timed(host, primary)
+            error = None
+        except Exception as e:
+            result, error = None, e
+        with self.lock:
+            call["finished"] = True
+            second = call["hedge"]
+
+        primary_ok = error is None and getattr(result, "ok", True)
+        if second is not None and (second.done() or not primary_ok):
+            wait([second])
+            if _succeeded(second):
+                with self.lock:
+                    stats.hedge_wins += 1
+                return second.result()
+        if error is not None:
+            raise error
+        return result
+
+    def metrics(self) -> dict:
+        """Request, hedge and hedge-win counts, in total and per host"""
+        with self.lock:
+            by_host = {
+                host: {
+                    "requests": stats.requests,
+                    "hedges": stats.hedges,
+                    "hedge_wins": stats.hedge_wins,
+                    "budget_denied": stats.budget_denied,
+                }
+                for host, stats in self.hosts.items()
+            }
+        for host, counts in by_host.items():
+            counts["delay"] = round(self.delay(host), 3)
+        totals = {
+            name: sum(counts[name] for counts in by_host.values())
+            for name in ("requests", "hedges", "hedge_wins", "budget_denied")
+        }
+        totals["hedge_win_rate"] = (
+            totals["hedge_wins"] / totals["hedges"] if totals["hedges"] else 0.0
+        )
+        totals["by_host"] = by_host
+        return totals
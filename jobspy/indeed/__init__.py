@@ -4,7 +4,15 @@ import math
 from datetime import datetime
 from typing import Tuple
 
-from jobspy.indeed.constant import job_search_query, company_job_search_query, api_headers
+from jobspy.employers import EMPLOYER_FIELDS, EmployerCache, employer_cache
+from jobspy.indeed.constant import (
+    job_search_query,
+    company_job_search_query,
+    api_headers,
+    employer_dossier,
+    job_description,
+    job_data_query,
+)
 from jobspy.indeed.util import is_job_remote, get_compensation, get_job_type
 from jobspy.model import (
     Scraper,
@@ -27,16 +35,23 @@ log = create_logger("Indeed")
 
 
 class Indeed(Scraper):
+    # a search's cursor also ends near this many results, with more jobs left
+    result_cap = 950
+
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        employers: EmployerCache | None = None,
     ):
         """
         Initializes IndeedScraper with the Indeed API url
+        :param employers: cache of parsed employer details, shared process-wide by default
         """
         super().__init__(Site.INDEED, proxies=proxies)
 
         self.session = create_session(
-            proxies=self.proxies, ca_cert=ca_cert, is_tls=False
+            proxies=self.proxies, ca_cert=ca_cert, is_tls=False, stats=self.stats
         )
         self.scraper_input = None
         self.jobs_per_page = 100
@@ -46,6 +61,9 @@ class Indeed(Scraper):
         self.api_country_code = None
         self.base_url = None
         self.api_url = "https://apis.indeed.com/graphql"
+        self.employers = employers if employers is not None else employer_cache
+        self.company_employer_key = None
+        self.skip_cached_dossier = True
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         """
@@ -54,6 +72,7 @@ class Indeed(Scraper):
         :return: job_response
         """
         self.scraper_input = scraper_input
+        self.session.hedge = self.hedge
         domain, self.api_country_code = self.scraper_input.country.indeed_domain_value
         self.base_url = f"https://{domain}.indeed.com"
         self.headers = api_headers.copy()
@@ -62,8 +81,12 @@ class Indeed(Scraper):
         page = 1
 
         cursor = None
+        exhausted = False
 
-        while len(self.seen_urls) < scraper_input.results_wanted + scraper_input.offset:
+        while (
+            len(self.seen_urls) < scraper_input.results_wanted + scraper_input.offset
+            and not self.cancelled()
+        ):
             log.info(
                 f"search page: {page} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)}"
             )
@@ -73,17 +96,25 @@ class Indeed(Scraper):
                 break
             job_list += jobs
             page += 1
+            if cursor is None:
+                # the last page of the search; at the cap it may be truncated
+                exhausted = len(self.seen_urls) < self.result_cap
+                break
         return JobResponse(
             jobs=job_list[
                 scraper_input.offset : scraper_input.offset
                 + scraper_input.results_wanted
-            ]
+            ],
+            exhausted=exhausted,
         )
 
-    def _scrape_page(self, cursor: str | None) -> Tuple[list[JobPost], str | None]:
+    def _scrape_page(
+        self, cursor: str | None, skip_dossier: bool | None = None
+    ) -> Tuple[list[JobPost], str | None]:
         """
         Scrapes a page of Indeed for jobs with scraper_input criteria
         :param cursor:
+        :param skip_dossier: leave the employer dossier out of the query (decided here if None)
         :return: jobs found on page, next page cursor
         """
         jobs = []
@@ -100,6 +131,14 @@ class Indeed(Scraper):
                 else ""
             )
         
+        # a company search mostly returns a single employer, so once it is
+        # cached the pages after the first leave the employer dossier out
+        if skip_dossier is None:
+            skip_dossier = (
+                self.skip_cached_dossier
+                and self.company_employer_key is not None
+                and self.employers.get(self.site.value, self.company_employer_key) is not None
+            )
         query = job_search_query.format(
             what=(f'what: "{search_term}"' if search_term else ""),
             location=(
@@ -110,8 +149,10 @@ class Indeed(Scraper):
             dateOnIndeed=self.scraper_input.hours_old,
             cursor=f'cursor: "{cursor}"' if cursor else "",
             filters=filters,
+            dossier="" if skip_dossier else employer_dossier,
+            description=job_description if self.scraper_input.fetch_descriptions else "",
         )
-            
+
         payload = {
             "query": query,
         }
@@ -129,13 +170,22 @@ class Indeed(Scraper):
                 f"responded with status code: {response.status_code} (submit GitHub issue if this appears to be a bug)"
             )
             return jobs, new_cursor
-        data = response.json()
+        with self.stats.timer("parse"):
+            data = response.json()
         jobs = data["data"]["jobSearch"]["results"]
         new_cursor = data["data"]["jobSearch"]["pageInfo"]["nextCursor"]
+        if skip_dossier and not all(
+            self._employer_cached(job["job"].get("employer")) for job in jobs
+        ):
+            # other employers on the page: fetch it again with their dossiers,
+            # and keep asking for dossiers for the rest of this search
+            log.debug("page has employers without cached details, fetching their dossiers")
+            self.skip_cached_dossier = False
+            return self._scrape_page(cursor, skip_dossier=False)
 
         job_list = []
         for job in jobs:
-            processed_job = self._process_job(job["job"])
+            processed_job = self._process_job(job["job"], has_dossier=not skip_dossier)
             if processed_job:
                 job_list.append(processed_job)
 
@@ -199,69 +249,151 @@ class Indeed(Scraper):
                 """
         return filters_str
 
-    def _process_job(self, job: dict) -> JobPost | None:
+    def _process_job(self, job: dict, has_dossier: bool = True) -> JobPost | None:
         """
         Parses the job dict into JobPost model
         :param job: dict to parse
+        :param has_dossier: whether the query asked for the employer dossier
         :return: JobPost if it's a new job
         """
         job_url = f'{self.base_url}/viewjob?jk={job["key"]}'
         if job_url in self.seen_urls:
             return
         self.seen_urls.add(job_url)
-        description = job["description"]["html"]
-        if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-            description = markdown_converter(description)
+        # absent when descriptions are deferred to fetch_description
+        description = job["description"]["html"] if job.get("description") else None
+        if description and self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
+            with self.stats.timer("markdown"):
+                description = markdown_converter(description)
 
         job_type = get_job_type(job["attributes"])
         timestamp_seconds = job["datePublished"] / 1000
         date_posted = datetime.fromtimestamp(timestamp_seconds).strftime("%Y-%m-%d")
-        employer = job["employer"].get("dossier") if job["employer"] else None
-        employer_details = employer.get("employerDetails", {}) if employer else {}
-        rel_url = job["employer"]["relativeCompanyPageUrl"] if job["employer"] else None
-        return JobPost(
-            id=f'in-{job["key"]}',
-            title=job["title"],
-            description=description,
-            company_name=job["employer"].get("name") if job.get("employer") else None,
-            company_url=(f"{self.base_url}{rel_url}" if job["employer"] else None),
-            company_url_direct=(
-                employer["links"]["corporateWebsite"] if employer else None
-            ),
-            location=Location(
-                city=job.get("location", {}).get("city"),
-                state=job.get("location", {}).get("admin1Code"),
-                country=job.get("location", {}).get("countryCode"),
-            ),
-            job_type=job_type,
-            compensation=get_compensation(job["compensation"]),
-            date_posted=date_posted,
-            job_url=job_url,
-            job_url_direct=(
-                job["recruit"].get("viewJobUrl") if job.get("recruit") else None
+        employer = self._get_employer(job.get("employer"), has_dossier)
+        with self.stats.timer("validation"):
+            return JobPost(
+                id=f'in-{job["key"]}',
+                title=job["title"],
+                description=description,
+                location=Location(
+                    city=job.get("location", {}).get("city"),
+                    state=job.get("location", {}).get("admin1Code"),
+                    country=job.get("location", {}).get("countryCode"),
+                ),
+                job_type=job_type,
+                compensation=get_compensation(job["compensation"]),
+                date_posted=date_posted,
+                job_url=job_url,
+                job_url_direct=(
+                    job["recruit"].get("viewJobUrl") if job.get("recruit") else None
+                ),
+                emails=extract_emails_from_text(description) if description else None,
+                is_remote=is_job_remote(job, description),
+                **employer,
+            )
+
+    def fetch_description(self, job: dict, scraper_input: ScraperInput) -> str | None:
+        """
+        Fetches one job's description from the API by its job key
+        :param job: the job's row, with its in-<key> id
+        :param scraper_input: gives the description format and country
+        :return: description, or None if the job is gone
+        """
+        self.scraper_input = scraper_input
+        _, api_country_code = scraper_input.country.indeed_domain_value
+        headers = api_headers.copy()
+        headers["indeed-co"] = api_country_code
+        job_key = job["id"].removeprefix("in-")
+        response = self.session.post(
+            self.api_url,
+            headers=headers,
+            json={"query": job_data_query.format(job_key=job_key.replace('"', ""))},
+            timeout=10,
+            verify=False,
+        )
+        if not response.ok:
+            log.info(f"description of {job_key} responded with status code: {response.status_code}")
+            return None
+        with self.stats.timer("parse"):
+            results = response.json()["data"]["jobData"]["results"]
+        if not results or not results[0]["job"].get("description"):
+            return None
+        description = results[0]["job"]["description"]["html"]
+        if scraper_input.description_format == DescriptionFormat.MARKDOWN:
+            with self.stats.timer("markdown"):
+                description = markdown_converter(description)
+        return description
+
+    def _employer_key(self, employer: dict) -> str | None:
+        """The employer's company page URL, its cache key; None without one"""
+        rel_url = employer.get("relativeCompanyPageUrl")
+        return f"{self.base_url}{rel_url}" if rel_url else None
+
+    def _employer_cached(self, employer: dict | None) -> bool:
+        if not employer:
+            return True
+        key = self._employer_key(employer)
+        return key is not None and self.employers.get(self.site.value, key) is not None
+
+    def _get_employer(self, employer: dict | None, has_dossier: bool) -> dict:
+        """
+        Parses the employer's company_* fields once per employer and caches them
+        :param employer: the job's employer dict, with its dossier if requested
+        :param has_dossier: whether the dossier was requested
+        :return: company_* fields of the JobPost, shared by the employer's jobs
+        """
+        if not employer:
+            return dict.fromkeys(EMPLOYER_FIELDS)
+        company_url = self._employer_key(employer)
+        cached = (
+            self.employers.get(self.site.value, company_url) if company_url else None
+        )
+        if cached is not None:
+            if self.scraper_input.indeed_company_id:
+                self.company_employer_key = company_url
+            # the name is the job's own, the cached details are the company page's
+            return {**cached, "company_name": employer.get("name")}
+        if not has_dossier:
+            # not cached and not requested: leave the details empty
+            return {
+                **dict.fromkeys(EMPLOYER_FIELDS),
+                "company_name": employer.get("name"),
+                "company_url": company_url,
+            }
+
+        dossier = employer.get("dossier")
+        details = dossier.get("employerDetails", {}) if dossier else {}
+        record = {
+            "company_name": employer.get("name"),
+            "company_url": company_url,
+            "company_url_direct": (
+                dossier["links"]["corporateWebsite"] if dossier else None
             ),
-            emails=extract_emails_from_text(description) if description else None,
-            is_remote=is_job_remote(job, description),
-            company_addresses=(
-                employer_details["addresses"][0]
-                if employer_details.get("addresses")
-                else None
+            "company_addresses": (
+                details["addresses"][0] if details.get("addresses") else None
             ),
-            company_industry=(
-                employer_details["industry"]
+            "company_industry": (
+                details["industry"]
                 .replace("Iv1", "")
                 .replace("_", " ")
                 .title()
                 .strip()
-                if employer_details.get("industry")
+                if details.get("industry")
                 else None
             ),
-            company_num_employees=employer_details.get("employeesLocalizedLabel"),
-            company_revenue=employer_details.get("revenueLocalizedLabel"),
-            company_description=employer_details.get("briefDescription"),
-            company_logo=(
-                employer["images"].get("squareLogoUrl")
-                if employer and employer.get("images")
+            "company_num_employees": details.get("employeesLocalizedLabel"),
+            "company_revenue": details.get("revenueLocalizedLabel"),
+            "company_description": details.get("briefDescription"),
+            "company_logo": (
+                dossier["images"].get("squareLogoUrl")
+                if dossier and dossier.get("images")
                 else None
             ),
-        )
+        }
+        if company_url is None:
+            # no company page to key the employer by, so nothing is shared
+            return {field: record.get(field) for field in EMPLOYER_FIELDS}
+        record = self.employers.put(self.site.value, company_url, record)
+        if self.scraper_input.indeed_company_id:
+            self.company_employer_key = company_url
+        return record
@@ -1,3 +1,44 @@
+# employer details, left out of job searches whose employers are already cached
+employer_dossier = """dossier {
+                    employerDetails {
+                    addresses
+                    industry
+                    employeesLocalizedLabel
+                    revenueLocalizedLabel
+                    briefDescription
+                    ceoName
+                    ceoPhotoUrl
+                    }
+                    images {
+                        headerImageUrl
+                        squareLogoUrl
+                    }
+                    links {
+                    corporateWebsite
+                }
+                }"""
+
+# the listing's description, left out of searches that defer descriptions
+job_description = """description {
+                html
+            }"""
+
+# one job's description by job key, for descriptions fetched on demand
+job_data_query = """
+    query GetJobData {{
+        jobData(input: {{jobKeys: ["{job_key}"]}}) {{
+        results {{
+            job {{
+            key
+            description {{
+                html
+            }}
+            }}
+        }}
+        }}
+    }}
+    """
+
 job_search_query = """
     query GetJobData {{
         jobSearch(
@@ -21,9 +62,7 @@ job_search_query = """
             title
             datePublished
             dateOnIndeed
-            description {{
-                html
-            }}
+            {description}
             location {{
                 countryName
                 countryCode
@@ -67,24 +106,7 @@ job_search_query = """
             employer {{
                 relativeCompanyPageUrl
                 name
-                dossier {{
-                    employerDetails {{
-                    addresses
-                    industry
-                    employeesLocalizedLabel
-                    revenueLocalizedLabel
-                    briefDescription
-                    ceoName
-                    ceoPhotoUrl
-                    }}
-                    images {{
-                        headerImageUrl
-                        squareLogoUrl
-                    }}
-                    links {{
-                    corporateWebsite
-                }}
-                }}
+                {dossier}
             }}
             recruit {{
                 viewJobUrl
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import math
 import random
-import time
 from datetime import datetime
 from typing import Optional
 from urllib.parse import urlparse, urlunparse, unquote
@@ -63,6 +62,7 @@ class LinkedIn(Scraper):
             has_retry=True,
             delay=5,
             clear_cookies=True,
+            stats=self.stats,
         )
         self.session.headers.update(headers)
         self.scraper_input = None
@@ -83,8 +83,10 @@ class LinkedIn(Scraper):
         seconds_old = (
             scraper_input.hours_old * 3600 if scraper_input.hours_old else None
         )
-        continue_search = (
-            lambda: len(job_list) < scraper_input.results_wanted and start < 1000
+        continue_search = lambda: (
+            len(job_list) < scraper_input.results_wanted
+            and start < 1000
+            and not self.cancelled()
         )
         while continue_search():
             request_count += 1
@@ -137,7 +139,8 @@ class LinkedIn(Scraper):
                     log.error(f"LinkedIn: {str(e)}")
                 return JobResponse(jobs=job_list)
 
-            soup = BeautifulSoup(response.text, "html.parser")
+            with self.stats.timer("parse"):
+                soup = BeautifulSoup(response.text, "html.parser")
             job_cards = soup.find_all("div", class_="base-search-card")
             if len(job_cards) == 0:
                 return JobResponse(jobs=job_list)
@@ -153,7 +156,10 @@ class LinkedIn(Scraper):
                     seen_ids.add(job_id)
 
                     try:
-                        fetch_desc = scraper_input.linkedin_fetch_description
+                        fetch_desc = (
+                            scraper_input.linkedin_fetch_description
+                            and scraper_input.fetch_descriptions
+                        )
                         job_post = self._process_job(job_card, job_id, fetch_desc)
                         if job_post:
                             job_list.append(job_post)
@@ -163,7 +169,7 @@ class LinkedIn(Scraper):
                         raise LinkedInException(str(e))
 
             if continue_search():
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
+                self.pause(random.uniform(self.delay, self.delay + self.band_delay))
                 start += len(job_list)
 
         job_list = job_list[: scraper_input.results_wanted]
@@ -221,25 +227,33 @@ class LinkedIn(Scraper):
             description = job_details.get("description")
         is_remote = is_job_remote(title, description, location)
 
-        return JobPost(
-            id=f"li-{job_id}",
-            title=title,
-            company_name=company,
-            company_url=company_url,
-            location=location,
-            is_remote=is_remote,
-            date_posted=date_posted,
-            job_url=f"{self.base_url}/jobs/view/{job_id}",
-            compensation=compensation,
-            job_type=job_details.get("job_type"),
-            job_level=job_details.get("job_level", "").lower(),
-            company_industry=job_details.get("company_industry"),
-            description=job_details.get("description"),
-            job_url_direct=job_details.get("job_url_direct"),
-            emails=extract_emails_from_text(description),
-            company_logo=job_details.get("company_logo"),
-            job_function=job_details.get("job_function"),
-        )
+        with self.stats.timer("validation"):
+            return JobPost(
+                id=f"li-{job_id}",
+                title=title,
+                company_name=company,
+                company_url=company_url,
+                location=location,
+                is_remote=is_remote,
+                date_posted=date_posted,
+                job_url=f"{self.base_url}/jobs/view/{job_id}",
+                compensation=compensation,
+                job_type=job_details.get("job_type"),
+                job_level=job_details.get("job_level", "").lower(),
+                company_industry=job_details.get("company_industry"),
+                description=job_details.get("description"),
+                job_url_direct=job_details.get("job_url_direct"),
+                emails=extract_emails_from_text(description),
+                company_logo=job_details.get("company_logo"),
+                job_function=job_details.get("job_function"),
+            )
+
+    def fetch_description(self, job: dict, scraper_input: ScraperInput) -> str | None:
+        """
+        Fetches one job's description from its /jobs/view page
+        """
+        self.scraper_input = scraper_input
+        return self._get_job_details(job["id"].removeprefix("li-")).get("description")
 
     def _get_job_details(self, job_id: str) -> dict:
         """
@@ -257,7 +271,8 @@ class LinkedIn(Scraper):
         if "linkedin.com/signup" in response.url:
             return {}
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        with self.stats.timer("parse"):
+            soup = BeautifulSoup(response.text, "html.parser")
         div_content = soup.find(
             "div", class_=lambda x: x and "show-more-less-html__markup" in x
         )
@@ -266,7 +281,8 @@ class LinkedIn(Scraper):
             div_content = remove_attributes(div_content)
             description = div_content.prettify(formatter="html")
             if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-                description = markdown_converter(description)
+                with self.stats.timer("markdown"):
+                    description = markdown_converter(description)
 
         h3_tag = soup.find(
             "h3", text=lambda text: text and "Job function" in text.strip()
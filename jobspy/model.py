@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import time
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Any, Optional
 from datetime import date
 from enum import Enum
 from pydantic import BaseModel
 
+from jobspy.stats import ScrapeStats
+
 
 class JobType(Enum):
     FULL_TIME = (
@@ -281,6 +284,11 @@ class JobPost(BaseModel):
 
 class JobResponse(BaseModel):
     jobs: list[JobPost] = []
+    # ScrapeStats of the scraper that produced the jobs, set by scrape_jobs
+    stats: Any = None
+    # the site ran out of results (pagination ended) rather than stopping at
+    # results_wanted or a cap; set by the scrapers that can tell
+    exhausted: bool = False
 
 
 class Site(Enum):
@@ -314,6 +322,8 @@ class ScraperInput(BaseModel):
     linkedin_company_ids: list[int] | None = None
     indeed_company_id: str | None = None
     description_format: DescriptionFormat | None = DescriptionFormat.MARKDOWN
+    # False defers descriptions to Scraper.fetch_description
+    fetch_descriptions: bool = True
 
     results_wanted: int = 15
     hours_old: int | None = None
@@ -326,6 +336,30 @@ class Scraper(ABC):
         self.site = site
         self.proxies = proxies
         self.ca_cert = ca_cert
+        self.cancel_token = None
+        # HedgePolicy for the scrapers whose sessions support hedged requests
+        self.hedge = None
+        self.stats = ScrapeStats(site.value)
+
+    def cancelled(self) -> bool:
+        """Whether the scrape should stop and return the jobs found so far"""
+        return self.cancel_token is not None and self.cancel_token.cancelled
+
+    def pause(self, seconds: float):
+        """Sleeps between pages, cut short if the scrape is cancelled"""
+        if self.cancel_token is None:
+            time.sleep(seconds)
+        else:
+            self.cancel_token.sleep(seconds)
 
     @abstractmethod
     def scrape(self, scraper_input: ScraperInput) -> JobResponse: ...
+
+    def fetch_description(self, job: dict, scraper_input: ScraperInput) -> str | None:
+        """
+        Fetches the description of one job scraped with fetch_descriptions=False
+        :param job: the job's row (id and job_url are used)
+        :param scraper_input: gives the description format (and country)
+        :return: the description, or None if the site has no detail fetch
+        """
+        return None
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import math
-import random
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, date, timedelta
 from typing import Optional
 
@@ -33,39 +33,51 @@ from jobspy.util import (
     markdown_converter,
     create_session,
     create_logger,
+    RateLimiter,
 )
 
 log = create_logger("Naukri")
 
 class Naukri(Scraper):
     base_url = "https://www.naukri.com/jobapi/v3/search"
-    delay = 3
-    band_delay = 4
-    jobs_per_page = 20  
+    jobs_per_page = 20
+    # pages fetched concurrently, the requests per second they share and the
+    # last page number searched
+    max_workers = 4
+    requests_per_second = 1.0
+    max_pages = 50
 
     def __init__(
-        self, proxies: list[str] | str | None = None, ca_cert: str | None = None
+        self,
+        proxies: list[str] | str | None = None,
+        ca_cert: str | None = None,
+        max_workers: int | None = None,
+        requests_per_second: float | None = None,
+        max_pages: int | None = None,
     ):
         """
         Initializes NaukriScraper with the Naukri API URL
+        :param max_workers: pages fetched concurrently
+        :param requests_per_second: rate limit of the page requests
+        :param max_pages: last page number searched
         """
         super().__init__(Site.NAUKRI, proxies=proxies, ca_cert=ca_cert)
-        self.session = create_session(
-            proxies=self.proxies,
-            ca_cert=ca_cert,
-            is_tls=False,
-            has_retry=True,
-            delay=5,
-            clear_cookies=True,
-        )
-        self.session.headers.update(naukri_headers)
+        # one session per page worker: a session clears its cookies around
+        # every request, which would race between threads sharing it
+        self.sessions = threading.local()
         self.scraper_input = None
         self.country = "India"  #naukri is india-focused by default
-        log.info("Naukri scraper initialized")
+        self.max_workers = max_workers or self.max_workers
+        self.max_pages = max_pages or self.max_pages
+        self.rate_limiter = RateLimiter(requests_per_second or self.requests_per_second)
+        log.debug("Naukri scraper initialized")
 
     def scrape(self, scraper_input: ScraperInput) -> JobResponse:
         """
-        Scrapes Naukri API for jobs with scraper_input criteria
+        Scrapes Naukri API for jobs with scraper_input criteria. Pages are
+        fetched `max_workers` at a time under the rate limit and merged in
+        page order; the search ends at the first page with fewer than
+        `jobs_per_page` results, or after page `max_pages`.
         :param scraper_input:
         :return: job_response
         """
@@ -73,82 +85,123 @@ class Naukri(Scraper):
         job_list: list[JobPost] = []
         seen_ids = set()
         start = scraper_input.offset or 0
-        page = (start // self.jobs_per_page) + 1
-        request_count = 0
-        seconds_old = (
-            scraper_input.hours_old * 3600 if scraper_input.hours_old else None
-        )
-        continue_search = (
-            lambda: len(job_list) < scraper_input.results_wanted and page <= 50  # Arbitrary limit
-        )
+        first_page = (start // self.jobs_per_page) + 1
+        total_pages = math.ceil(scraper_input.results_wanted / self.jobs_per_page)
+        fetch_desc = scraper_input.linkedin_fetch_description
 
-        while continue_search():
-            request_count += 1
-            log.info(
-                f"Scraping page {request_count} / {math.ceil(scraper_input.results_wanted / self.jobs_per_page)} "
-                f"for search term: {scraper_input.search_term}"
-            )
-            params = {
-                "noOfResults": self.jobs_per_page,
-                "urlType": "search_by_keyword",
-                "searchType": "adv",
-                "keyword": scraper_input.search_term,
-                "pageNo": page,
-                "k": scraper_input.search_term,
-                "seoKey": f"{scraper_input.search_term.lower().replace(' ', '-')}-jobs",
-                "src": "jobsearchDesk",
-                "latLong": "",
-                "location": scraper_input.location,
-                "remote": "true" if scraper_input.is_remote else None,
-            }
-            if seconds_old:
-                params["days"] = seconds_old // 86400  # Convert to days
+        def pages_needed() -> int:
+            missing = scraper_input.results_wanted - len(job_list)
+            return math.ceil(max(missing, 0) / self.jobs_per_page)
 
-            params = {k: v for k, v in params.items() if v is not None}
-            try:
-                log.debug(f"Sending request to {self.base_url} with params: {params}")
-                response = self.session.get(self.base_url, params=params, timeout=10)
-                if response.status_code not in range(200, 400):
-                    err = f"Naukri API response status code {response.status_code} - {response.text}"
-                    log.error(err)
-                    return JobResponse(jobs=job_list)
-                data = response.json()
-                job_details = data.get("jobDetails", [])
-                log.info(f"Received {len(job_details)} job entries from API")
-                if not job_details:
-                    log.warning("No job details found in API response")
+        pages = {}  # page number -> future of its job entries
+        next_page = page = first_page
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while (
+                len(job_list) < scraper_input.results_wanted
+                and page <= self.max_pages
+                and not self.cancelled()
+            ):
+                # keep pages in flight up to what the missing results need
+                while (
+                    len(pages) < self.max_workers
+                    and next_page < page + pages_needed()
+                    and next_page <= self.max_pages
+                ):
+                    pages[next_page] = executor.submit(self._fetch_page, next_page)
+                    next_page += 1
+                log.info(f"search page: {page - first_page + 1} / {total_pages}")
+                try:
+                    job_details = pages.pop(page).result()
+                except Exception as e:
+                    log.error(f"Naukri API request failed: {str(e)}")
+                    break
+                if job_details is None:
                     break
-            except Exception as e:
-                log.error(f"Naukri API request failed: {str(e)}")
-                return JobResponse(jobs=job_list)
-
-            for job in job_details:
-                job_id = job.get("jobId")
-                if not job_id or job_id in seen_ids:
-                    continue
-                seen_ids.add(job_id)
-                log.debug(f"Processing job ID: {job_id}")
 
-                try:
-                    fetch_desc = scraper_input.linkedin_fetch_description
-                    job_post = self._process_job(job, job_id, fetch_desc)
+                for job in job_details:
+                    job_id = job.get("jobId")
+                    if not job_id or job_id in seen_ids:
+                        continue
+                    seen_ids.add(job_id)
+                    try:
+                        job_post = self._process_job(job, job_id, fetch_desc)
+                    except Exception as e:
+                        log.error(f"Error processing job ID {job_id}: {str(e)}")
+                        raise NaukriException(str(e))
                     if job_post:
                         job_list.append(job_post)
-                        log.info(f"Added job: {job_post.title} (ID: {job_id})")
-                    if not continue_search():
+                        log.debug(f"Added job: {job_post.title} (ID: {job_id})")
+                    if len(job_list) >= scraper_input.results_wanted:
                         break
-                except Exception as e:
-                    log.error(f"Error processing job ID {job_id}: {str(e)}")
-                    raise NaukriException(str(e))
 
-            if continue_search():
-                time.sleep(random.uniform(self.delay, self.delay + self.band_delay))
+                if len(job_details) < self.jobs_per_page:
+                    break
                 page += 1
+            for future in pages.values():
+                future.cancel()
 
         job_list = job_list[:scraper_input.results_wanted]
         log.info(f"Scraping completed. Total jobs collected: {len(job_list)}")
         return JobResponse(jobs=job_list)
 
+    def _session(self):
+        """The calling thread's session"""
+        session = getattr(self.sessions, "session", None)
+        if session is None:
+            session = create_session(
+                proxies=self.proxies,
+                ca_cert=self.ca_cert,
+                is_tls=False,
+                has_retry=True,
+                delay=5,
+                clear_cookies=True,
+                stats=self.stats,
+            )
+            session.headers.update(naukri_headers)
+            self.sessions.session = session
+        return session
+
+    def _fetch_page(self, page: int) -> list[dict] | None:
+        """
+        Fetches the job entries of one search page under the rate limit
+        :return: the page's job entries, None if the scrape was cancelled meanwhile
+        """
+        scraper_input = self.scraper_input
+        self.rate_limiter.acquire()
+        if self.cancelled():
+            return None
+        seconds_old = (
+            scraper_input.hours_old * 3600 if scraper_input.hours_old else None
+        )
+        params = {
+            "noOfResults": self.jobs_per_page,
+            "urlType": "search_by_keyword",
+            "searchType": "adv",
+            "keyword": scraper_input.search_term,
+            "pageNo": page,
+            "k": scraper_input.search_term,
+            "seoKey": f"{scraper_input.search_term.lower().replace(' ', '-')}-jobs",
+            "src": "jobsearchDesk",
+            "latLong": "",
+            "location": scraper_input.location,
+            "remote": "true" if scraper_input.is_remote else None,
+        }
+        if seconds_old:
+            params["days"] = seconds_old // 86400  # Convert to days
+
+        params = {k: v for k, v in params.items() if v is not None}
+        log.debug(f"Sending request to {self.base_url} with params: {params}")
+        response = self._session().get(self.base_url, params=params, timeout=10)
+        if response.status_code not in range(200, 400):
+            raise NaukriException(
+                f"Naukri API response status code {response.status_code} - {response.text}"
+            )
+        with self.stats.timer("parse"):
+            data = response.json()
+        job_details = data.get("jobDetails", [])
+        log.debug(f"Received {len(job_details)} job entries from page {page}")
+        return job_details
+
     def _process_job(
         self, job: dict, job_id: str, full_descr: bool
     ) -> Optional[JobPost]:
@@ -166,7 +219,8 @@ class Naukri(Scraper):
         job_url = f"https://www.naukri.com{job.get('jdURL', f'/job/{job_id}')}"
         description = job.get("jobDescription") if full_descr else None
         if description and self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-            description = markdown_converter(description)
+            with self.stats.timer("markdown"):
+                description = markdown_converter(description)
 
         job_type = parse_job_type(description) if description else None
         company_industry = parse_company_industry(description) if description else None
@@ -182,28 +236,29 @@ class Naukri(Scraper):
         vacancy_count = job.get("vacancy")
         work_from_home_type = self._infer_work_from_home_type(job.get("placeholders", []), title, description or "")
 
-        job_post = JobPost(
-            id=f"nk-{job_id}",
-            title=title,
-            company_name=company,
-            company_url=company_url,
-            location=location,
-            is_remote=is_remote,
-            date_posted=date_posted,
-            job_url=job_url,
-            compensation=compensation,
-            job_type=job_type,
-            company_industry=company_industry,
-            description=description,
-            emails=extract_emails_from_text(description or ""),
-            company_logo=company_logo,
-            skills=skills,
-            experience_range=experience_range,
-            company_rating=company_rating,
-            company_reviews_count=company_reviews_count,
-            vacancy_count=vacancy_count,
-            work_from_home_type=work_from_home_type,
-        )
+        with self.stats.timer("validation"):
+            job_post = JobPost(
+                id=f"nk-{job_id}",
+                title=title,
+                company_name=company,
+                company_url=company_url,
+                location=location,
+                is_remote=is_remote,
+                date_posted=date_posted,
+                job_url=job_url,
+                compensation=compensation,
+                job_type=job_type,
+                company_industry=company_industry,
+                description=description,
+                emails=extract_emails_from_text(description or ""),
+                company_logo=company_logo,
+                skills=skills,
+                experience_range=experience_range,
+                company_rating=company_rating,
+                company_reviews_count=company_reviews_count,
+                vacancy_count=vacancy_count,
+                work_from_home_type=work_from_home_type,
+            )
         log.debug(f"Processed job: {title} at {company}")
         return job_post
 
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import re
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+_word_regex = re.compile(r"\w+")
+_stem_length = 5
+
+
+def _features(text, limit: int | None = None) -> list[str]:
+    """Words plus their 5-letter prefixes, so 'science' and 'scientist' overlap"""
+    if not isinstance(text, str):
+        return []
+    words = _word_regex.findall(text[:limit].lower())
+    return words + [
+        word[:_stem_length] + "~" for word in words if len(word) > _stem_length
+    ]
+
+
+class RelevancePreRanker:
+    """
+    Cheap local relevance model used to drop obvious misses before AI scoring.
+
+    Every job becomes an L2-normalized TF-IDF vector over the words (and word
+    prefixes) of its title, weighted `title_weight`, and the first
+    `description_chars` characters of its description. The matrix is built
+    once per result set and stored feature-major, so scoring a target is a
+    handful of vectorized NumPy adds: the cosine similarity of each job with
+    the target.
+    """
+
+    def __init__(
+        self,
+        titles: Sequence,
+        descriptions: Sequence | None = None,
+        title_weight: float = 3.0,
+        description_chars: int = 2000,
+    ):
+        n_docs = len(titles)
+        self.size = n_docs
+        descriptions = descriptions if descriptions is not None else [None] * n_docs
+        features, weights, lengths = [], [], []
+        for title, description in zip(titles, descriptions):
+            title_features = _features(title)
+            description_features = _features(description, description_chars)
+            features += title_features + description_features
+            weights += [title_weight] * len(title_features)
+            weights += [1.0] * len(description_features)
+            lengths.append(len(title_features) + len(description_features))
+
+        codes, vocabulary = pd.factorize(pd.Series(features, dtype=object))
+        self.vocabulary = {word: i for i, word in enumerate(vocabulary)}
+        doc_ids = np.repeat(np.arange(n_docs, dtype=np.int64), lengths)
+        n = max(n_docs, 1)
+        keys = codes.astype(np.int64) * n + doc_ids
+        pairs, inverse = np.unique(keys, return_inverse=True)
+        tf = np.bincount(inverse, weights=np.asarray(weights, dtype=np.float64))
+        self.features, self.docs = np.divmod(pairs, n)
+
+        df = np.bincount(self.features, minlength=len(vocabulary))
+        self.idf = np.log((1 + n_docs) / (1 + df)) + 1
+        values = (1 + np.log(tf)) * self.idf[self.features]
+        norms = np.sqrt(np.bincount(self.docs, weights=values**2, minlength=n_docs))
+        self.values = values / np.where(norms > 0, norms, 1)[self.docs]
+        self.bounds = np.searchsorted(self.features, np.arange(len(vocabulary) + 1))
+
+    @classmethod
+    def from_jobs(cls, jobs: pd.DataFrame, **kwargs) -> RelevancePreRanker:
+        descriptions = jobs["description"].tolist() if "description" in jobs else None
+        return cls(jobs["title"].tolist(), descriptions, **kwargs)
+
+    def similarity(self, target: str) -> np.ndarray:
+        """:return: cosine similarity (0-1) of every job with `target`"""
+        counts = {}
+        for feature in _features(target):
+            if feature in self.vocabulary:
+                counts[self.vocabulary[feature]] = (
+                    counts.get(self.vocabulary[feature], 0) + 1
+                )
+        scores = np.zeros(self.size)
+        if not counts:
+            return scores
+        ids = np.fromiter(counts, np.int64, len(counts))
+        query = 1 + np.log(np.fromiter(counts.values(), np.float64, len(counts)))
+        query *= self.idf[ids]
+        query /= np.linalg.norm(query)
+        for feature, weight in zip(ids, query):
+            start, end = self.bounds[feature], self.bounds[feature + 1]
+            scores[self.docs[start:end]] += weight * self.values[start:end]
+        return scores
+
+    def select(
+        self,
+        target: str,
+        top_k: int | None = None,
+        min_similarity: float = 0.0,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Jobs worth sending to the expensive scorer: those with similarity
+        above `min_similarity`, best first, at most `top_k` of them
+        :return: (row positions, similarities)
+        """
+        scores = self.similarity(target)
+        positions = np.flatnonzero(scores > min_similarity)
+        order = np.argsort(-scores[positions], kind="stable")
+        positions = positions[order][:top_k]
+        return positions, scores[positions]
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import cProfile
+import os
+import pstats
+import sys
+import tempfile
+import threading
+import tracemalloc
+from contextlib import contextmanager
+
+from jobspy.util import create_logger
+
+log = create_logger("Profiler")
+
+PROFILE_MODES = ("cpu", "memory", "both")
+# cProfile shares one interpreter-wide monitoring slot from Python 3.12 on, so
+# profiled sites take turns there instead of running concurrently
+_cpu_slot = threading.Lock() if sys.version_info >= (3, 12) else None
+
+
+class ScrapeProfiler:
+    """
+    Profiles each site's scrape with cProfile and/or tracemalloc.
+
+    CPU: `<site>.prof` (open with pstats or snakeviz) for the thread running
+    the site's scrape; work the scraper hands to its own threads is not
+    included. The hottest functions are logged.
+
+    Memory: tracemalloc runs for the whole call. For each site,
+    `<site>.memory.txt` lists the top allocations made while it ran and
+    `<site>.snapshot` holds the raw snapshot (tracemalloc.Snapshot.load).
+    Sites scraped concurrently share the tracer, so their allocations overlap.
+
+    Files of an earlier run in the same `profile_dir` are overwritten.
+    """
+
+    def __init__(self, mode: str, profile_dir: str | None = None, top: int = 10):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"profile must be one of {PROFILE_MODES}, got {mode!r}")
+        self.cpu = mode in ("cpu", "both")
+        self.memory = mode in ("memory", "both")
+        self.top = top
+        self.profile_dir = profile_dir or tempfile.mkdtemp(prefix="jobspy-profile-")
+        os.makedirs(self.profile_dir, exist_ok=True)
+        self.files: dict[str, list[str]] = {}
+        self._started_tracing = False
+
+    def start(self):
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def stop(self):
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        log.info(f"profiles written to {self.profile_dir}")
+
+    def __enter__(self) -> "ScrapeProfiler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    @contextmanager
+    def site(self, site: str):
+        """Profiles the scrape of `site` run inside the block"""
+        tracing = self.memory and tracemalloc.is_tracing()
+        before = tracemalloc.take_snapshot() if tracing else None
+        profiler = cProfile.Profile() if self.cpu else None
+        if profiler is not None and _cpu_slot is not None:
+            _cpu_slot.acquire()
+        try:
+            if profiler is not None:
+                profiler.enable()
+            try:
+                yield
+            finally:
+                if profiler is not None:
+                    profiler.disable()
+        finally:
+            if profiler is not None and _cpu_slot is not None:
+                _cpu_slot.release()
+            if profiler is not None:
+                self._write_cpu(site, profiler)
+            if before is not None and tracemalloc.is_tracing():
+                self._write_memory(site, before, tracemalloc.take_snapshot())
+
+    def _path(self, site: str, suffix: str) -> str:
+        path = os.path.join(self.profile_dir, f"{site}{suffix}")
+        self.files.setdefault(site, []).append(path)
+        return path
+
+    def _write_cpu(self, site: str, profiler: cProfile.Profile):
+        profiler.dump_stats(self._path(site, ".prof"))
+        stats = pstats.Stats(profiler)
+        hottest = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)
+        lines = [
+            f"{function} ({_short_path(filename)}:{line}) "
+            f"{cumulative:.3f}s cumulative, {own:.3f}s own, {calls} calls"
+            for (filename, line, function), (_, calls, own, cumulative, _) in hottest[
+                : self.top
+            ]
+        ]
+        log.info(f"{site} hottest functions:\n  " + "\n  ".join(lines))
+
+    def _write_memory(self, site: str, before, after):
+        after.dump(self._path(site, ".snapshot"))
+        growth = after.compare_to(before, "lineno")
+        with open(self._path(site, ".memory.txt"), "w") as f:
+            f.write(f"top allocations while scraping {site}\n")
+            for stat in growth[: self.top * 5]:
+                f.write(f"{stat}\n")
+        top_growth = [stat for stat in growth[: self.top] if stat.size_diff > 0]
+        log.info(
+            f"{site} top allocations:\n  "
+            + "\n  ".join(str(stat) for stat in top_growth)
+        )
+
+
+def _short_path(filename: str) -> str:
+    """`package/module.py`, enough to tell apart the scrapers' `__init__.py` files"""
+    return (
+        os.path.join(*filename.split(os.sep)[-2:]) if os.sep in filename else filename
+    )
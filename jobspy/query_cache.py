@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from jobspy.model import ScraperInput
+from jobspy.util import create_logger
+
+log = create_logger("QueryCache")
+
+# ScraperInput fields that narrow results and can be re-applied locally;
+# every other field must match exactly for a cached result to be reused
+_narrowing_fields = {"site_type", "is_remote", "hours_old", "results_wanted"}
+# most jobs a single query returns from these sites whatever results_wanted
+# asks for; Indeed and LinkedIn stop at about 1000, so a result within 5% of
+# that may be capped
+SITE_RESULT_CAPS = {"indeed": 950, "linkedin": 950, "glassdoor": 900, "google": 900}
+
+
+@dataclass
+class _Entry:
+    signature: tuple
+    sites: frozenset[str]
+    is_remote: bool
+    hours_old: int | None
+    results_wanted: int
+    complete_sites: frozenset[str]
+    jobs: pd.DataFrame
+    created_at: float
+    size: int
+
+
+def _signature(scraper_input: ScraperInput, options: dict) -> tuple:
+    fields = scraper_input.dict(exclude=_narrowing_fields)
+    fields.update(options)
+    return tuple(
+        (name, tuple(value) if isinstance(value, list) else value)
+        for name, value in sorted(fields.items())
+    )
+
+
+class QueryCache:
+    """
+    Results of completed `scrape_jobs` calls, reused for later queries they contain.
+
+    A cached result answers a new query with the same parameters when the
+    new query is narrower: a subset of its sites, remote-only where the cached
+    query was not, or a smaller `hours_old` window. The answer is the
+    cached DataFrame filtered locally, so it lacks jobs posted after the
+    entry was cached; `ttl` (seconds) bounds that staleness. Narrowed
+    answers need the cached site results to be complete, since a capped
+    result may miss jobs the narrower query would return. A site's result is
+    complete when it holds fewer jobs than the site's per-query cap
+    (SITE_RESULT_CAPS) and either its scraper ran out of results (`exhausted`
+    in the `site_status` attrs) or it returned fewer than `results_wanted`.
+
+    At most `max_entries` results totalling `max_bytes` (in-memory size,
+    descriptions included) are kept; the oldest are dropped first, and a
+    result larger than `max_bytes` on its own is not cached.
+    """
+
+    def __init__(
+        self, ttl: float = 900, max_entries: int = 64, max_bytes: int | None = None
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries: list[_Entry] = []
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def put(self, scraper_input: ScraperInput, jobs: pd.DataFrame, **options):
+        sites = frozenset(site.value for site in scraper_input.site_type)
+        counts = jobs["site"].value_counts() if not jobs.empty else pd.Series(dtype=int)
+        site_status = jobs.attrs.get("site_status", {})
+
+        def complete(site: str) -> bool:
+            count = counts.get(site, 0)
+            cap = SITE_RESULT_CAPS.get(site)
+            if cap is not None and count >= cap:
+                # pagination ends at the cap too, so the result may be truncated
+                return False
+            if site_status.get(site, {}).get("exhausted"):
+                return True
+            return count < scraper_input.results_wanted
+
+        complete_sites = frozenset(site for site in sites if complete(site))
+        size = int(jobs.memory_usage(deep=True).sum())
+        if self.max_bytes is not None and size > self.max_bytes:
+            log.debug(f"not caching a {size / 2**20:.1f} MB result")
+            return
+        entry = _Entry(
+            signature=_signature(scraper_input, options),
+            sites=sites,
+            is_remote=scraper_input.is_remote,
+            hours_old=scraper_input.hours_old,
+            results_wanted=scraper_input.results_wanted,
+            complete_sites=complete_sites,
+            jobs=jobs.copy(),
+            created_at=time.time(),
+            size=size,
+        )
+        with self.lock:
+            self._expire()
+            self.entries.append(entry)
+            del self.entries[: -self.max_entries]
+            if self.max_bytes is not None:
+                total = sum(entry.size for entry in self.entries)
+                while total > self.max_bytes:
+                    total -= self.entries.pop(0).size
+
+    def get(self, scraper_input: ScraperInput, **options) -> pd.DataFrame | None:
+        """:return: the cached jobs answering `scraper_input`, or None"""
+        signature = _signature(scraper_input, options)
+        sites = frozenset(site.value for site in scraper_input.site_type)
+        now = time.time()
+        with self.lock:
+            self._expire()
+            for entry in reversed(self.entries):
+                if entry.signature == signature and self._contains(
+                    entry, scraper_input, sites
+                ):
+                    self.hits += 1
+                    log.info(
+                        f"answered from a cached query {now - entry.created_at:.0f}s old"
+                    )
+                    return self._narrow(entry, scraper_input, sites, now)
+            self.misses += 1
+        return None
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def _expire(self):
+        cutoff = time.time() - self.ttl
+        self.entries = [entry for entry in self.entries if entry.created_at >= cutoff]
+
+    @staticmethod
+    def _contains(entry: _Entry, scraper_input: ScraperInput, sites: frozenset) -> bool:
+        if not sites <= entry.sites:
+            return False
+        if entry.is_remote and not scraper_input.is_remote:
+            return False
+        if entry.hours_old is not None and (
+            scraper_input.hours_old is None or scraper_input.hours_old > entry.hours_old
+        ):
+            return False
+        narrowed = (
+            scraper_input.is_remote != entry.is_remote
+            or scraper_input.hours_old != entry.hours_old
+        )
+        if narrowed:
+            # a capped result may be missing jobs that match the narrower filters
+            return sites <= entry.complete_sites
+        return scraper_input.results_wanted <= entry.results_wanted or (
+            sites <= entry.complete_sites
+        )
+
+    @staticmethod
+    def _narrow(
+        entry: _Entry, scraper_input: ScraperInput, sites: frozenset, now: float
+    ) -> pd.DataFrame:
+        jobs = entry.jobs
+        if jobs.empty:
+            return jobs.copy()
+        mask = jobs["site"].isin(sites)
+        if scraper_input.is_remote and not entry.is_remote:
+            mask &= jobs["is_remote"].fillna(False).astype(bool)
+        if scraper_input.hours_old is not None and (
+            scraper_input.hours_old != entry.hours_old
+        ):
+            # dates are only known to the day, so the whole cutoff day is kept
+            cutoff = (
+                datetime.fromtimestamp(now) - timedelta(hours=scraper_input.hours_old)
+            ).date()
+            posted = pd.to_datetime(jobs["date_posted"], errors="coerce")
+            mask &= posted.isna() | (posted >= pd.Timestamp(cutoff))
+        jobs = jobs[mask]
+        jobs = jobs.groupby("site", sort=False).head(scraper_input.results_wanted)
+        return jobs.reset_index(drop=True)
@@ -0,0 +1,327 @@
+from __future__ import annotations
+
+import hashlib
+import re
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Callable, Protocol
+
+import pandas as pd
+
+from jobspy.util import create_logger
+
+log = create_logger("Scoring")
+
+_result_regex = re.compile(
+    r"^\s*\[(\d+)\]\s*SCORE:\s*(\d+)\s*\|\s*CONFIDENCE:\s*(HIGH|MEDIUM|LOW)"
+    r"\s*\|\s*REASONING:\s*(.*)$",
+    re.MULTILINE | re.IGNORECASE,
+)
+_word_regex = re.compile(r"\w+")
+# (job key, description hash) pairs per cache lookup: two parameters each plus
+# the target stays within SQLite's default limit of 999 bound parameters
+_CACHE_CHUNK = 499
+
+PROMPT_HEADER = """You are an expert job matching AI. Score each job below for relevance to the user's interest.
+
+USER INTEREST: {target}
+
+Consider each job's title AND description: required skills and technologies, responsibilities, experience level, industry and team context.
+
+Score from 0-100, where:
+- 0-20: Completely irrelevant (e.g., retail manager for data scientist)
+- 21-40: Slightly relevant (e.g., business analyst for data scientist)
+- 41-60: Moderately relevant (e.g., data analyst for data scientist)
+- 61-80: Highly relevant (e.g., ML engineer for data scientist)
+- 81-100: Perfect match (e.g., data scientist for data scientist)
+
+Respond with exactly one line per job, in this format:
+[job number] SCORE: [0-100] | CONFIDENCE: [HIGH/MEDIUM/LOW] | REASONING: [1-2 sentences]
+
+JOBS:
+"""
+
+JOB_TEMPLATE = """[{number}] Title: {title}
+Company: {company}
+Location: {location}
+Description: {description}
+"""
+
+
+class ScoringClient(Protocol):
+    """Anything that turns a prompt into a completion"""
+
+    def complete(self, prompt: str, max_tokens: int) -> str: ...
+
+
+class OpenAIClient:
+    """Chat-completion client; `openai` is only imported when this is created"""
+
+    def __init__(
+        self,
+        model: str = "gpt-4.1-nano",
+        api_key: str | None = None,
+        temperature: float = 0.1,
+    ):
+        import openai
+
+        self.client = openai.OpenAI(api_key=api_key)
+        self.model = model
+        self.temperature = temperature
+
+    def complete(self, prompt: str, max_tokens: int) -> str:
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=max_tokens,
+            temperature=self.temperature,
+        )
+        return response.choices[0].message.content.strip()
+
+
+class KeywordScoringClient:
+    """
+    Offline stand-in for an LLM: reads the prompt and scores each job by how
+    many words of the user interest appear in its title and description.
+    Useful to exercise the scoring pipeline without network access.
+    """
+
+    def __init__(self):
+        self.calls = 0
+
+    def complete(self, prompt: str, max_tokens: int) -> str:
+        self.calls += 1
+        target = re.search(r"^USER INTEREST: (.*)$", prompt, re.MULTILINE).group(1)
+        target_words = set(_word_regex.findall(target.lower()))
+        jobs = re.split(
+            r"^\[(\d+)\] Title: ", prompt.split("JOBS:", 1)[1], flags=re.MULTILINE
+        )
+        lines = []
+        for number, text in zip(jobs[1::2], jobs[2::2]):
+            title, _, description = text.partition("\n")
+            title_words = set(_word_regex.findall(title.lower()))
+            description_words = set(_word_regex.findall(description.lower()))
+            if not target_words:
+                score = 0
+            else:
+                in_title = len(target_words & title_words) / len(target_words)
+                in_description = len(target_words & description_words) / len(
+                    target_words
+                )
+                score = round(70 * in_title + 30 * in_description)
+            lines.append(
+                f"[{number}] SCORE: {score} | CONFIDENCE: MEDIUM | "
+                f"REASONING: keyword overlap with '{target}'"
+            )
+        return "\n".join(lines)
+
+
+def _description_hash(description) -> str:
+    text = description if isinstance(description, str) else ""
+    return hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
+
+
+def _normalize_target(target: str) -> str:
+    return " ".join(target.lower().split())
+
+
+class ScoreCache:
+    """
+    SQLite cache of AI scores keyed by (job key, description hash, target),
+    shared by every session and process that opens the same file
+    """
+
+    def __init__(self, path: str = "jobs.db"):
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.Lock()
+        with self.lock, self.conn:
+            self.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS ai_scores (
+                    job_key TEXT NOT NULL,
+                    description_hash TEXT NOT NULL,
+                    target TEXT NOT NULL,
+                    score INTEGER NOT NULL,
+                    confidence TEXT,
+                    reasoning TEXT,
+                    scored_at TEXT NOT NULL,
+                    PRIMARY KEY (job_key, description_hash, target)
+                )
+                """
+            )
+
+    def close(self):
+        self.conn.close()
+
+    def get(self, keys: list[tuple[str, str]], target: str) -> dict[tuple, tuple]:
+        """:return: {(job_key, description_hash): (score, confidence, reasoning)}"""
+        found = {}
+        with self.lock:
+            for start in range(0, len(keys), _CACHE_CHUNK):
+                chunk = keys[start : start + _CACHE_CHUNK]
+                placeholders = ", ".join("(?, ?)" for _ in chunk)
+                rows = self.conn.execute(
+                    "SELECT job_key, description_hash, score, confidence, reasoning "
+                    "FROM ai_scores WHERE target = ? AND "
+                    f"(job_key, description_hash) IN (VALUES {placeholders})",
+                    [target] + [value for key in chunk for value in key],
+                ).fetchall()
+                for job_key, description_hash, *result in rows:
+                    found[(job_key, description_hash)] = tuple(result)
+        return found
+
+    def put(self, results: dict[tuple, tuple], target: str):
+        now = datetime.now().isoformat(timespec="seconds")
+        rows = [
+            (job_key, description_hash, target, *result, now)
+            for (job_key, description_hash), result in results.items()
+        ]
+        with self.lock, self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO ai_scores VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+            )
+
+
+class JobScorer:
+    """
+    Scores jobs for relevance to a free-text target with an LLM.
+
+    Jobs are packed `batch_size` per prompt and up to `max_workers` prompts
+    run at once. Scores already in `cache` are reused, and new ones are
+    written back as each batch finishes. Jobs missing from a batched answer
+    are retried one per prompt.
+    """
+
+    def __init__(
+        self,
+        client: ScoringClient,
+        cache: ScoreCache | None = None,
+        batch_size: int = 8,
+        max_workers: int = 4,
+        description_chars: int = 1500,
+        tokens_per_job: int = 120,
+    ):
+        self.client = client
+        self.cache = cache
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.description_chars = description_chars
+        self.tokens_per_job = tokens_per_job
+
+    def _prompt(self, target: str, jobs: list[dict]) -> str:
+        parts = [PROMPT_HEADER.format(target=target)]
+        for number, job in enumerate(jobs, start=1):
+            description = job.get("description")
+            description = description if isinstance(description, str) else ""
+            if len(description) > self.description_chars:
+                description = description[: self.description_chars] + "..."
+            parts.append(
+                JOB_TEMPLATE.format(
+                    number=number,
+                    title=job.get("title") or "",
+                    company=job.get("company") or "Unknown",
+                    location=job.get("location") or "Unknown",
+                    description=" ".join(description.split()),
+                )
+            )
+        return "\n".join(parts)
+
+    def _score_batch(self, target: str, jobs: list[dict]) -> dict[int, tuple]:
+        """:return: {position in `jobs`: (score, confidence, reasoning)}"""
+        answer = self.client.complete(
+            self._prompt(target, jobs), max_tokens=self.tokens_per_job * len(jobs)
+        )
+        results = {}
+        for number, score, confidence, reasoning in _result_regex.findall(answer):
+            position = int(number) - 1
+            if 0 <= position < len(jobs):
+                score = min(100, max(0, int(score)))
+                results[position] = (score, confidence.upper(), reasoning.strip())
+        return results
+
+    def _score_with_retry(self, target: str, jobs: list[dict]) -> dict[int, tuple]:
+        results = self._score_batch(target, jobs)
+        if len(jobs) > 1:
+            for position in range(len(jobs)):
+                if position not in results:
+                    single = self._score_batch(target, [jobs[position]])
+                    if 0 in single:
+                        results[position] = single[0]
+        return results
+
+    def score(
+        self,
+        jobs: pd.DataFrame,
+        target: str,
+        on_batch: Callable[[int, int, list[tuple[dict, tuple]]], None] | None = None,
+    ) -> pd.DataFrame:
+        """
+        :param on_batch: called from the calling thread after each batch with
+            (jobs scored so far, jobs to score, [(job, (score, confidence, reasoning))])
+        :return: copy of `jobs` with `ai_score`, `ai_confidence` and
+            `ai_reasoning` columns (NaN/None where scoring failed)
+        """
+        target = _normalize_target(target)
+        records = jobs.to_dict("records")
+        keys = [
+            (
+                str(job.get("id") or job.get("job_url") or job.get("title")),
+                _description_hash(job.get("description")),
+            )
+            for job in records
+        ]
+        results = self.cache.get(list(set(keys)), target) if self.cache else {}
+        pending = {}
+        for position, key in enumerate(keys):
+            if key not in results:
+                pending.setdefault(key, position)
+        log.info(
+            f"scoring {len(pending)} jobs for '{target}' "
+            f"({len(keys) - len(pending)} cached)"
+        )
+
+        pending_keys = list(pending)
+        batches = [
+            pending_keys[i : i + self.batch_size]
+            for i in range(0, len(pending_keys), self.batch_size)
+        ]
+        done = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            future_to_batch = {
+                executor.submit(
+                    self._score_with_retry,
+                    target,
+                    [records[pending[key]] for key in batch],
+                ): batch
+                for batch in batches
+            }
+            for future in as_completed(future_to_batch):
+                batch = future_to_batch[future]
+                try:
+                    scored = future.result()
+                except Exception as e:
+                    log.error(f"scoring batch failed: {e}")
+                    scored = {}
+                new_results = {batch[i]: result for i, result in scored.items()}
+                results.update(new_results)
+                if self.cache and new_results:
+                    self.cache.put(new_results, target)
+                done += len(batch)
+                if on_batch:
+                    on_batch(
+                        done,
+                        len(pending_keys),
+                        [
+                            (records[pending[key]], new_results.get(key))
+                            for key in batch
+                        ],
+                    )
+
+        scored = [results.get(key, (None, None, None)) for key in keys]
+        jobs = jobs.copy()
+        jobs["ai_score"] = pd.to_numeric([s[0] for s in scored], errors="coerce")
+        jobs["ai_confidence"] = [s[1] for s in scored]
+        jobs["ai_reasoning"] = [s[2] for s in scored]
+        return jobs
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from bisect import bisect_left
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+_token_regex = re.compile(r"\w+")
+
+
+def result_fingerprint(jobs: pd.DataFrame) -> str:
+    """
+    Cheap identity of a result set (row ids and urls), used as the cache key
+    for indexes and other structures derived from it
+    """
+    columns = [c for c in ("id", "job_url") if c in jobs.columns]
+    digest = hashlib.blake2b(str(len(jobs)).encode(), digest_size=16)
+    if columns:
+        hashes = pd.util.hash_pandas_object(jobs[columns], index=False)
+        digest.update(hashes.to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def tokenize(text) -> list[str]:
+    if not isinstance(text, str):
+        return []
+    return _token_regex.findall(text.lower())
+
+
+class _FieldIndex:
+    """Inverted index of one text field with precomputed BM25 weights"""
+
+    def __init__(self, texts: Sequence, k1: float, b: float):
+        token_lists = [tokenize(text) for text in texts]
+        lengths = np.fromiter(map(len, token_lists), np.int64, len(token_lists))
+        token_codes, vocabulary = pd.factorize(
+            pd.Series([t for tokens in token_lists for t in tokens], dtype=object)
+        )
+        n_docs = max(len(texts), 1)
+        doc_ids = np.repeat(np.arange(len(texts), dtype=np.int64), lengths)
+        pairs, tfs = np.unique(token_codes * n_docs + doc_ids, return_counts=True)
+        tokens, docs = np.divmod(pairs, n_docs)
+
+        avg_length = lengths.mean() if len(texts) and lengths.mean() else 1.0
+        norm = k1 * (1 - b + b * lengths / avg_length)
+        df = np.bincount(tokens, minlength=len(vocabulary))
+        idf = np.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+        weights = idf[tokens] * tfs * (k1 + 1) / (tfs + norm[docs])
+
+        bounds = np.searchsorted(tokens, np.arange(len(vocabulary) + 1))
+        self.postings: dict[str, tuple[np.ndarray, np.ndarray]] = {
+            word: (docs[bounds[i] : bounds[i + 1]], weights[bounds[i] : bounds[i + 1]])
+            for i, word in enumerate(vocabulary)
+        }
+        self.vocabulary = sorted(self.postings)
+
+    def expand(self, token: str) -> list[str]:
+        """Vocabulary tokens starting with `token` ('engineer' -> 'engineering')"""
+        start = bisect_left(self.vocabulary, token)
+        matches = []
+        for word in self.vocabulary[start:]:
+            if not word.startswith(token):
+                break
+            matches.append(word)
+        return matches
+
+
+class JobSearchIndex:
+    """
+    BM25 search over job titles (and optionally descriptions), built once per
+    result set. A query matches a job when every query word is a prefix of a
+    word in its title, or the same holds for one of the query's synonyms
+    (`synonyms` maps a phrase to related phrases, e.g. 'developer' ->
+    ['software engineer', 'programmer']). Results are ranked by BM25 with
+    synonym and description hits weighted lower than direct title hits.
+    """
+
+    def __init__(
+        self,
+        titles: Sequence,
+        descriptions: Sequence | None = None,
+        synonyms: dict[str, list[str]] | None = None,
+        k1: float = 1.2,
+        b: float = 0.75,
+        synonym_weight: float = 0.5,
+        description_weight: float = 0.3,
+        match_descriptions: bool = False,
+    ):
+        self.size = len(titles)
+        self.titles = _FieldIndex(titles, k1, b)
+        self.descriptions = (
+            _FieldIndex(descriptions, k1, b) if descriptions is not None else None
+        )
+        self.synonyms = {
+            " ".join(tokenize(phrase)): [" ".join(tokenize(s)) for s in related]
+            for phrase, related in (synonyms or {}).items()
+        }
+        self.synonym_weight = synonym_weight
+        self.description_weight = description_weight
+        self.match_descriptions = match_descriptions and self.descriptions is not None
+
+    def _phrases(self, query: str) -> list[tuple[list[str], float]]:
+        normalized = " ".join(tokenize(query))
+        phrases = {normalized: 1.0}
+        for related in self.synonyms.get(normalized, []):
+            phrases.setdefault(related, self.synonym_weight)
+        return [
+            (phrase.split(), weight) for phrase, weight in phrases.items() if phrase
+        ]
+
+    def _token_hits(self, field: _FieldIndex, token: str):
+        words = field.expand(token)
+        if not words:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        if len(words) == 1:
+            return field.postings[words[0]]
+        docs = np.concatenate([field.postings[w][0] for w in words])
+        weights = np.concatenate([field.postings[w][1] for w in words])
+        return docs, weights
+
+    def search(
+        self, query: str, limit: int | None = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        :return: (row positions of matching jobs, their scores), best first
+        """
+        scores = np.zeros(self.size)
+        matched = np.zeros(self.size, dtype=bool)
+        for tokens, weight in self._phrases(query):
+            phrase_match = np.ones(self.size, dtype=bool)
+            for token in tokens:
+                token_match = np.zeros(self.size, dtype=bool)
+                docs, weights = self._token_hits(self.titles, token)
+                token_match[docs] = True
+                np.add.at(scores, docs, weight * weights)
+                if self.descriptions is not None:
+                    docs, weights = self._token_hits(self.descriptions, token)
+                    if self.match_descriptions:
+                        token_match[docs] = True
+                    np.add.at(scores, docs, weight * self.description_weight * weights)
+                phrase_match &= token_match
+            matched |= phrase_match
+
+        positions = np.flatnonzero(matched)
+        order = np.argsort(-scores[positions], kind="stable")
+        positions = positions[order][:limit]
+        return positions, scores[positions]
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Hashable
+
+from jobspy.model import ScraperInput
+
+
+# free-text fields where case and surrounding spaces do not change the results
+_NORMALIZED_FIELDS = ("search_term", "location")
+
+
+def scraper_input_key(scraper_input: ScraperInput, **options) -> tuple:
+    """
+    Identity of a search and the options it runs with: the search term and
+    location are trimmed and lowercased and sites sorted, so "Data Engineer" /
+    " data engineer" searches of the same sites match. Every other field is
+    compared as given.
+    """
+    fields = scraper_input.dict()
+    fields.update(options)
+    fields["site_type"] = sorted(site.value for site in scraper_input.site_type)
+    for name in _NORMALIZED_FIELDS:
+        if isinstance(fields.get(name), str):
+            fields[name] = fields[name].strip().lower()
+    key = []
+    for name, value in sorted(fields.items()):
+        if isinstance(value, list):
+            value = tuple(value)
+        key.append((name, value))
+    return tuple(key)
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: BaseException | None = None
+        self.followers = 0
+
+
+class SingleFlight:
+    """
+    Process-wide registry of in-flight calls. While a call for a key is
+    running, callers with the same key wait for it and share its result
+    (or its exception) instead of starting their own.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.calls: dict[Hashable, _Call] = {}
+
+    def in_flight(self) -> int:
+        with self.lock:
+            return len(self.calls)
+
+    def do(self, key: Hashable, fn: Callable[[], Any]) -> tuple[Any, bool]:
+        """
+        :return: (result of `fn`, whether it is shared with other callers)
+        """
+        with self.lock:
+            call = self.calls.get(key)
+            if call is not None:
+                call.followers += 1
+                leader = False
+            else:
+                call = self.calls[key] = _Call()
+                leader = True
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self.lock:
+                del self.calls[key]
+            call.done.set()
+        return call.result, call.followers > 0
@@ -0,0 +1,251 @@
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+import weakref
+
+import numpy as np
+import pandas as pd
+
+from jobspy.dedup import JobDeduplicator
+from jobspy.util import create_logger, load_pyarrow
+
+log = create_logger("Spill")
+
+
+def _remove(paths: list[str], directory: str | None):
+    """Deletes spilled chunks, and the directory when the buffer created it"""
+    for path in paths:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+    if directory is not None:
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def _sort_keys(column: pd.Series) -> pd.Series:
+    if column.name == "date_posted":
+        return pd.to_datetime(column, errors="coerce")
+    return column
+
+
+class SpilledJobs:
+    """
+    Lazy handle on jobs spilled to disk by a SpillBuffer.
+
+    Rows stay in their chunk files until asked for. The sort order is computed
+    from the sort column alone, and `rows`, `to_pandas` and `lookup` read only
+    the chunks and columns they need. With pyarrow the chunks are
+    memory-mapped Arrow IPC files; without it they are pickled frames that
+    are loaded whole. The chunk files are deleted with the handle (or `close`).
+    """
+
+    def __init__(
+        self,
+        paths: list[str],
+        sizes: list[int],
+        columns: list[str],
+        sort_by: str,
+        ascending: bool,
+        directory: str | None = None,
+    ):
+        self.paths = paths
+        self.columns = columns
+        self.sort_by = sort_by
+        self.ascending = ascending
+        self.arrow = load_pyarrow()
+        self.bounds = np.concatenate([[0], np.cumsum(sizes)]).astype(np.int64)
+        self._order = None
+        self._ids = None
+        self._finalizer = weakref.finalize(self, _remove, list(paths), directory)
+
+    def _read(
+        self,
+        path: str,
+        columns: list[str] | None = None,
+        rows: np.ndarray | None = None,
+    ) -> pd.DataFrame:
+        """Columns of a chunk, and only `rows` (chunk row numbers, in that order) if given"""
+        if self.arrow is None:
+            chunk = pd.read_pickle(path)
+            if rows is not None:
+                chunk = chunk.iloc[rows]
+            return chunk if columns is None else chunk.reindex(columns=columns)
+        # the table's buffers point into the memory map; only the selected
+        # columns and rows are taken out of it and converted
+        table = self.arrow.ipc.open_file(self.arrow.memory_map(path, "r")).read_all()
+        if columns is not None:
+            table = table.select([c for c in columns if c in table.column_names])
+        if rows is not None:
+            table = table.take(self.arrow.array(rows, type=self.arrow.int64()))
+        return table.to_pandas().reindex(columns=columns)
+
+    def __len__(self) -> int:
+        return int(self.bounds[-1])
+
+    @property
+    def order(self) -> np.ndarray:
+        """Global row numbers in sort order, from the sort column of each chunk"""
+        if self._order is None:
+            keys = pd.concat(
+                [self._read(path, [self.sort_by])[self.sort_by] for path in self.paths],
+                ignore_index=True,
+            )
+            self._order = (
+                _sort_keys(keys)
+                .sort_values(ascending=self.ascending, kind="stable")
+                .index.to_numpy()
+            )
+        return self._order
+
+    def _take(self, rows: np.ndarray, columns: list[str] | None) -> pd.DataFrame:
+        """Rows by global row number, in the given order"""
+        bounds = self.bounds
+        chunk_of = np.searchsorted(bounds, rows, side="right") - 1
+        parts = []
+        for chunk in np.unique(chunk_of):
+            selected = chunk_of == chunk
+            local = rows[selected] - bounds[chunk]
+            frame = self._read(self.paths[chunk], columns, local)
+            parts.append(frame.set_index(pd.Index(np.flatnonzero(selected))))
+        if not parts:
+            return pd.DataFrame(columns=columns)
+        return pd.concat(parts).sort_index().reset_index(drop=True)
+
+    def rows(
+        self, start: int, stop: int, columns: list[str] | None = None
+    ) -> pd.DataFrame:
+        """Rows `start:stop` of the sorted result"""
+        return self._take(self.order[start:stop], columns)
+
+    def to_pandas(
+        self, columns: list[str] | None = None, exclude: list[str] | None = None
+    ) -> pd.DataFrame:
+        """The sorted result in memory, optionally without heavy columns such as description"""
+        if exclude:
+            columns = [c for c in (columns or self.columns) if c not in exclude]
+        return self._take(self.order, columns)
+
+    def lookup(self, job_id: str, column: str):
+        """One value of the job with id `job_id` (e.g. its description), or None"""
+        if self._ids is None:
+            ids = pd.concat(
+                [self._read(path, ["id"])["id"] for path in self.paths],
+                ignore_index=True,
+            )
+            self._ids = pd.Series(np.arange(len(ids)), index=ids.to_numpy())
+            self._ids = self._ids[~self._ids.index.duplicated()]
+        if job_id not in self._ids.index:
+            return None
+        value = self._take(np.array([self._ids[job_id]]), [column])[column].iloc[0]
+        return None if pd.isna(value) else value
+
+    def close(self):
+        self._finalizer()
+
+
+class SpillBuffer:
+    """
+    Collects job frames with bounded memory.
+
+    Frames stay in memory until they take more than `memory_limit_mb` (by
+    `memory_usage(deep=True)`); the buffered rows are then written to a chunk
+    file in `directory` (a new temporary directory by default) and dropped
+    from memory. Duplicates are removed as frames arrive, with a
+    JobDeduplicator whose state is a few small fields per job, so
+    deduplication never needs the spilled rows back.
+
+    `finish` returns the sorted DataFrame when nothing was spilled, otherwise
+    a SpilledJobs handle that sorts and reads rows lazily.
+    """
+
+    def __init__(
+        self,
+        memory_limit_mb: float = 256,
+        directory: str | None = None,
+        dedupe: bool = True,
+        sort_by: str = "date_posted",
+        ascending: bool = False,
+    ):
+        self.memory_limit = memory_limit_mb * 2**20
+        self.directory = directory
+        self.deduplicator = JobDeduplicator() if dedupe else None
+        self.sort_by = sort_by
+        self.ascending = ascending
+        self.pending: list[pd.DataFrame] = []
+        self.pending_bytes = 0
+        self.paths: list[str] = []
+        self.sizes: list[int] = []
+        self.columns: list[str] = []
+        self.owns_directory = directory is None
+        self.rows = 0
+        self.duplicates = 0
+
+    @property
+    def spilled(self) -> bool:
+        return bool(self.paths)
+
+    def append(self, jobs: pd.DataFrame) -> int:
+        """Adds the new (non-duplicate) rows of `jobs`; returns how many were kept"""
+        if jobs.empty:
+            return 0
+        if self.deduplicator is not None:
+            marked = self.deduplicator.add_frame(jobs)
+            keep = marked["duplicate_of"].isna().to_numpy()
+            self.duplicates += int((~keep).sum())
+            jobs = jobs[keep]
+        jobs = jobs.reset_index(drop=True)
+        self.pending.append(jobs)
+        self.pending_bytes += int(jobs.memory_usage(deep=True).sum())
+        self.rows += len(jobs)
+        if self.pending_bytes > self.memory_limit:
+            self._spill()
+        return len(jobs)
+
+    def _spill(self):
+        if not self.pending:
+            return
+        if self.directory is None:
+            self.directory = tempfile.mkdtemp(prefix="jobspy-spill-")
+        os.makedirs(self.directory, exist_ok=True)
+        chunk = pd.concat(self.pending, ignore_index=True)
+        arrow = load_pyarrow()
+        if arrow is None:
+            path = os.path.join(self.directory, f"chunk-{len(self.paths):04d}.pkl")
+            chunk.to_pickle(path)
+        else:
+            path = os.path.join(self.directory, f"chunk-{len(self.paths):04d}.arrow")
+            table = arrow.Table.from_pandas(chunk, preserve_index=False)
+            with arrow.OSFile(path, "wb") as sink:
+                with arrow.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+        log.info(
+            f"spilled {len(chunk)} jobs ({self.pending_bytes / 2**20:.1f} MB) to {path}"
+        )
+        self.paths.append(path)
+        self.sizes.append(len(chunk))
+        self.columns += [c for c in chunk.columns if c not in self.columns]
+        self.pending, self.pending_bytes = [], 0
+
+    def finish(self) -> pd.DataFrame | SpilledJobs:
+        if not self.spilled:
+            if not self.pending:
+                return pd.DataFrame()
+            jobs = pd.concat(self.pending, ignore_index=True)
+            self.pending, self.pending_bytes = [], 0
+            if self.sort_by not in jobs.columns:
+                return jobs
+            return jobs.sort_values(
+                self.sort_by, ascending=self.ascending, key=_sort_keys, kind="stable"
+            ).reset_index(drop=True)
+        self._spill()
+        return SpilledJobs(
+            self.paths,
+            self.sizes,
+            self.columns,
+            self.sort_by,
+            self.ascending,
+            directory=self.directory if self.owns_directory else None,
+        )
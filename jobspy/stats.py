@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+
+COUNTERS = {
+    "requests": "HTTP requests sent",
+    "retries": "HTTP retries made by the session's retry policy",
+    "bytes_in": "Response body bytes received",
+    "rate_limited": "Responses with status 429",
+    "errors": "Requests that raised instead of returning a response",
+}
+STAGES = {
+    "network": "waiting on HTTP responses",
+    "parse": "decoding JSON and HTML responses",
+    "markdown": "converting descriptions to markdown",
+    "validation": "building and validating JobPost models",
+    "dataframe": "assembling the result DataFrame",
+    "total": "the whole scrape",
+}
+
+
+class ScrapeStats:
+    """
+    Lightweight timers and counters for one scrape.
+
+    Each scraper fills its own instance (its session records requests, bytes,
+    retries, 429s and network time; the scraper times parsing, markdown and
+    validation), and `scrape_jobs` keeps them under `sites` next to its own
+    DataFrame assembly time. Stage times are summed across threads, so they
+    can exceed the wall-clock `total` when a scraper works concurrently.
+    """
+
+    def __init__(self, site: str | None = None):
+        self.site = site
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.seconds = dict.fromkeys(STAGES, 0.0)
+        self.sites: dict[str, ScrapeStats] = {}
+        self.lock = threading.Lock()
+
+    def count(self, name: str, n: int = 1):
+        with self.lock:
+            self.counters[name] += n
+
+    def add_time(self, stage: str, seconds: float):
+        with self.lock:
+            self.seconds[stage] += seconds
+
+    @contextmanager
+    def timer(self, stage: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(stage, time.perf_counter() - started)
+
+    def record_response(self, response, seconds: float):
+        """Counts one HTTP response (requests or tls_client) and its network time"""
+        retry = getattr(getattr(response, "raw", None), "retries", None)
+        with self.lock:
+            self.counters["requests"] += 1
+            self.counters["retries"] += len(retry.history) if retry is not None else 0
+            self.counters["bytes_in"] += len(response.content or b"")
+            self.counters["rate_limited"] += response.status_code == 429
+            self.seconds["network"] += seconds
+
+    def totals(self) -> dict:
+        """Counters and stage seconds summed over this scrape and its sites"""
+        with self.lock:
+            totals = {**self.counters, "seconds": dict(self.seconds)}
+        for site_stats in self.sites.values():
+            for name, value in site_stats.totals().items():
+                if name == "seconds":
+                    # a site's total overlaps the others and the call's own total
+                    for stage, seconds in value.items():
+                        if stage != "total":
+                            totals["seconds"][stage] += seconds
+                else:
+                    totals[name] += value
+        return totals
+
+    def to_dict(self) -> dict:
+        """Totals of this scrape, with each site's own numbers under `sites`"""
+        totals = self.totals()
+        stats = {
+            "site": self.site,
+            **totals,
+            "seconds": {stage: round(s, 4) for stage, s in totals["seconds"].items()},
+        }
+        if self.sites:
+            stats["sites"] = {
+                site: site_stats.to_dict() for site, site_stats in self.sites.items()
+            }
+        return stats
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.to_dict(), **kwargs)
+
+    def _samples(self):
+        for site_stats in self.sites.values():
+            yield from site_stats._samples()
+        yield self.site or "all", self.counters, self.seconds
+
+    def to_prometheus(self, prefix: str = "jobspy") -> str:
+        """Prometheus text exposition format, labelled by site (and stage)"""
+        samples = list(self._samples())
+        lines = []
+        for name, help_text in COUNTERS.items():
+            lines.append(f"# HELP {prefix}_{name}_total {help_text}")
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            for site, counters, _ in samples:
+                if site != "all" or not self.sites:
+                    lines.append(
+                        f'{prefix}_{name}_total{{site="{site}"}} {counters[name]}'
+                    )
+        lines.append(f"# HELP {prefix}_stage_seconds_total Seconds spent per stage")
+        lines.append(f"# TYPE {prefix}_stage_seconds_total counter")
+        for site, _, seconds in samples:
+            for stage, value in seconds.items():
+                if value:
+                    lines.append(
+                        f'{prefix}_stage_seconds_total{{site="{site}",stage="{stage}"}} '
+                        f"{value:.6f}"
+                    )
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,262 @@
+from __future__ import annotations
+
+import re
+import sqlite3
+import threading
+from datetime import date, datetime, timedelta
+
+import pandas as pd
+
+from jobspy.util import create_logger, desired_order
+
+log = create_logger("JobStore")
+
+_numeric_columns = {
+    "min_amount": "REAL",
+    "max_amount": "REAL",
+    "company_rating": "REAL",
+    "company_reviews_count": "INTEGER",
+    "vacancy_count": "INTEGER",
+    "is_remote": "INTEGER",
+}
+_nocase_columns = {"site", "company", "location"}
+_indexes = {
+    "site": "site",
+    "company": "company",
+    "location": "location",
+    "date_posted": "date_posted",
+    "salary": "min_amount, max_amount",
+}
+
+
+def _column_sql(column: str) -> str:
+    if column == "id":
+        return "id TEXT PRIMARY KEY"
+    if column in _numeric_columns:
+        return f"{column} {_numeric_columns[column]}"
+    if column in _nocase_columns:
+        return f"{column} TEXT COLLATE NOCASE"
+    return f"{column} TEXT"
+
+
+def _fts_query(search: str) -> str | None:
+    """
+    FTS5 query matching every word of `search`: each whitespace-separated
+    term is quoted as an FTS5 string, so operators (AND, NEAR, -, quotes)
+    are matched as text. Terms without a letter or digit are dropped; None
+    if nothing is left.
+    """
+    terms = [term for term in search.split() if re.search(r"\w", term)]
+    if not terms:
+        return None
+    return " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+def _to_sql_value(value):
+    if value is None or value is pd.NaT:
+        return None
+    if isinstance(value, float) and value != value:
+        return None
+    if isinstance(value, (pd.Timestamp, datetime)):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, bool):
+        return int(value)
+    if hasattr(value, "item"):
+        return value.item()
+    return value
+
+
+class JobStore:
+    """
+    SQLite-backed store of normalized job records, upserted by job `id`.
+
+    Every row keeps `first_seen`/`last_seen` timestamps, the filter columns
+    (site, company, location, date_posted, salary) are indexed and title and
+    description are searchable through an FTS5 index when SQLite supports it.
+    A re-scrape never erases a value with an empty one, so listings scraped
+    without descriptions keep descriptions stored earlier.
+    """
+
+    def __init__(self, path: str = "jobs.db"):
+        self.path = path
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.lock = threading.Lock()
+        self.has_fts = False
+        self._create_schema()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self.conn.close()
+
+    def _create_schema(self):
+        columns = [_column_sql(column) for column in desired_order]
+        columns += ["first_seen TEXT NOT NULL", "last_seen TEXT NOT NULL"]
+        with self.lock, self.conn:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute(f"CREATE TABLE IF NOT EXISTS jobs ({', '.join(columns)})")
+            for name, columns in _indexes.items():
+                self.conn.execute(
+                    f"CREATE INDEX IF NOT EXISTS idx_jobs_{name} ON jobs ({columns})"
+                )
+            try:
+                self.conn.executescript(
+                    """
+                    CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+                        title, description, content='jobs', content_rowid='rowid'
+                    );
+                    CREATE TRIGGER IF NOT EXISTS jobs_fts_insert AFTER INSERT ON jobs BEGIN
+                        INSERT INTO jobs_fts(rowid, title, description)
+                        VALUES (new.rowid, new.title, new.description);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS jobs_fts_delete AFTER DELETE ON jobs BEGIN
+                        INSERT INTO jobs_fts(jobs_fts, rowid, title, description)
+                        VALUES ('delete', old.rowid, old.title, old.description);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS jobs_fts_update
+                    AFTER UPDATE OF title, description ON jobs BEGIN
+                        INSERT INTO jobs_fts(jobs_fts, rowid, title, description)
+                        VALUES ('delete', old.rowid, old.title, old.description);
+                        INSERT INTO jobs_fts(rowid, title, description)
+                        VALUES (new.rowid, new.title, new.description);
+                    END;
+                    """
+                )
+                self.has_fts = True
+            except sqlite3.OperationalError as e:
+                log.warning(f"full-text search disabled, FTS5 unavailable: {e}")
+
+    def upsert(self, jobs: pd.DataFrame) -> int:
+        """
+        Inserts new jobs and refreshes existing ones (matched by `id`)
+        :return: number of rows written
+        """
+        if jobs.empty or "id" not in jobs.columns:
+            return 0
+        columns = [column for column in desired_order if column in jobs.columns]
+        now = datetime.now().isoformat(timespec="seconds")
+        rows = [
+            [_to_sql_value(value) for value in row] + [now, now]
+            for row in jobs[columns].itertuples(index=False, name=None)
+        ]
+        rows = [row for row in rows if row[0] is not None]
+        updates = ", ".join(
+            f"{column} = COALESCE(excluded.{column}, jobs.{column})"
+            for column in columns
+            if column != "id"
+        )
+        sql = (
+            f"INSERT INTO jobs ({', '.join(columns)}, first_seen, last_seen) "
+            f"VALUES ({', '.join('?' * (len(columns) + 2))}) "
+            f"ON CONFLICT(id) DO UPDATE SET {updates}, last_seen = excluded.last_seen"
+        )
+        with self.lock, self.conn:
+            self.conn.executemany(sql, rows)
+        return len(rows)
+
+    def import_csv(self, path: str) -> int:
+        """Loads a CSV previously exported from scrape_jobs into the store"""
+        return self.upsert(pd.read_csv(path))
+
+    def query(
+        self,
+        site: str | list[str] | None = None,
+        company: str | None = None,
+        company_contains: str | list[str] | None = None,
+        location: str | None = None,
+        hours_old: int | None = None,
+        posted_after: date | str | None = None,
+        min_salary: float | None = None,
+        has_salary: bool | None = None,
+        search: str | None = None,
+        seen_after: datetime | str | None = None,
+        seen_within_hours: int | None = None,
+        limit: int | None = None,
+    ) -> pd.DataFrame:
+        """
+        Returns stored jobs matching every given filter, newest first.
+        `search` keeps jobs whose title or description contains all of its
+        words (through FTS5, ranked by bm25, when available);
+        `hours_old` keeps jobs posted within that many hours, as in
+        scrape_jobs; `seen_within_hours` keeps jobs first stored within that
+        many hours.
+        """
+        where, params = [], []
+        if site:
+            sites = [site] if isinstance(site, str) else site
+            where.append(f"jobs.site IN ({', '.join('?' * len(sites))})")
+            params += sites
+        if company:
+            where.append("jobs.company = ?")
+            params.append(company)
+        if company_contains:
+            names = (
+                [company_contains]
+                if isinstance(company_contains, str)
+                else company_contains
+            )
+            where.append(f"({' OR '.join('jobs.company LIKE ?' for _ in names)})")
+            params += [f"%{name}%" for name in names]
+        if location:
+            where.append("jobs.location LIKE ?")
+            params.append(f"%{location}%")
+        if hours_old:
+            cutoff = datetime.now() - timedelta(hours=hours_old)
+            where.append("jobs.date_posted >= ?")
+            params.append(cutoff.date().isoformat())
+        if posted_after:
+            where.append("jobs.date_posted >= ?")
+            params.append(_to_sql_value(posted_after))
+        if min_salary is not None:
+            where.append("COALESCE(jobs.max_amount, jobs.min_amount) >= ?")
+            params.append(min_salary)
+        if has_salary is not None:
+            condition = "(jobs.min_amount IS NOT NULL OR jobs.max_amount IS NOT NULL)"
+            where.append(condition if has_salary else f"NOT {condition}")
+        if seen_after:
+            where.append("jobs.last_seen >= ?")
+            params.append(_to_sql_value(seen_after))
+        if seen_within_hours:
+            cutoff = datetime.now() - timedelta(hours=seen_within_hours)
+            where.append("jobs.first_seen >= ?")
+            params.append(cutoff.isoformat(timespec="seconds"))
+
+        sql = "SELECT jobs.* FROM jobs"
+        order = "jobs.date_posted DESC"
+        if search:
+            if self.has_fts:
+                fts_query = _fts_query(search)
+                if fts_query:
+                    sql += " JOIN jobs_fts ON jobs_fts.rowid = jobs.rowid"
+                    where.append("jobs_fts MATCH ?")
+                    params.append(fts_query)
+                    order = "bm25(jobs_fts)"
+            else:
+                where.append("(jobs.title LIKE ? OR jobs.description LIKE ?)")
+                params += [f"%{search}%", f"%{search}%"]
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY {order}"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self.lock:
+            return pd.read_sql_query(sql, self.conn, params=params)
+
+    def description(self, job_id: str) -> str | None:
+        """The stored description of a job, or None"""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT description FROM jobs WHERE id = ?", (job_id,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def count(self) -> int:
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
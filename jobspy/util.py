@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
+import time
 from itertools import cycle
+from urllib.parse import urlparse
 
 import numpy as np
 import requests
@@ -29,18 +32,166 @@ def create_logger(name: str):
     return logger
 
 
+class RateLimiter:
+    """
+    Thread-safe limiter that spaces calls out to at most `rate` per second
+    """
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+class CancelToken:
+    """
+    Cooperative cancellation shared by the scrapers of one `scrape_jobs` call.
+    Scrapers check it between pages and stop with the jobs they have once it is
+    cancelled explicitly or its deadline (a `time.monotonic()` value) passes.
+    """
+
+    def __init__(self, deadline: float | None = None):
+        self.deadline = deadline
+        self._event = threading.Event()
+
+    def cancel(self):
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        if self._event.is_set():
+            return True
+        return self.deadline is not None and time.monotonic() >= self.deadline
+
+    def remaining(self) -> float | None:
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def sleep(self, seconds: float) -> bool:
+        """Sleeps up to `seconds`, waking early on cancellation. Returns whether cancelled"""
+        remaining = self.remaining()
+        if remaining is not None:
+            seconds = min(seconds, remaining)
+        self._event.wait(seconds)
+        return self.cancelled
+
+
+_host_rate_limiters: dict[str, RateLimiter] = {}
+# limits held by callers for a while (e.g. one per running batch), all applied
+_held_rate_limiters: dict[str, list[RateLimiter]] = {}
+_held_rate_limiters_lock = threading.Lock()
+
+
+def set_host_rate_limit(
+    host: str, rate: float | RateLimiter | None
+) -> RateLimiter | None:
+    """
+    Limits the requests per second sent to `host` by every session in the process.
+    Passing `None` removes the limit. Returns the previous limiter, if any.
+    """
+    previous = _host_rate_limiters.pop(host, None)
+    if isinstance(rate, RateLimiter):
+        _host_rate_limiters[host] = rate
+    elif rate:
+        _host_rate_limiters[host] = RateLimiter(rate)
+    return previous
+
+
+def hold_host_rate_limit(host: str, rate: float) -> RateLimiter:
+    """
+    Adds a limit of `rate` requests per second to `host` until the returned
+    limiter is passed to `release_host_rate_limit`. Limits held at the same
+    time (and the one set with `set_host_rate_limit`) all apply, and releasing
+    one leaves the others in place.
+    """
+    limiter = RateLimiter(rate)
+    with _held_rate_limiters_lock:
+        _held_rate_limiters[host] = _held_rate_limiters.get(host, []) + [limiter]
+    return limiter
+
+
+def release_host_rate_limit(host: str, limiter: RateLimiter):
+    with _held_rate_limiters_lock:
+        limiters = [held for held in _held_rate_limiters.get(host, []) if held is not limiter]
+        if limiters:
+            _held_rate_limiters[host] = limiters
+        else:
+            _held_rate_limiters.pop(host, None)
+
+
+def wait_for_host(url: str):
+    """Blocks until the rate limits (if any) of the url's host allow another request"""
+    if not _host_rate_limiters and not _held_rate_limiters:
+        return
+    host = urlparse(url).hostname
+    limiter = _host_rate_limiters.get(host)
+    if limiter:
+        limiter.acquire()
+    for limiter in _held_rate_limiters.get(host, ()):
+        limiter.acquire()
+
+
 class RotatingProxySession:
-    def __init__(self, proxies=None):
+    def __init__(self, proxies=None, hedge=None, stats=None):
         if isinstance(proxies, str):
-            self.proxy_cycle = cycle([self.format_proxy(proxies)])
-        elif isinstance(proxies, list):
-            self.proxy_cycle = (
-                cycle([self.format_proxy(proxy) for proxy in proxies])
-                if proxies
-                else None
-            )
+            proxies = [proxies]
+        if isinstance(proxies, list) and proxies:
+            self.proxy_cycle = cycle([self.format_proxy(proxy) for proxy in proxies])
+            self.proxy_count = len(proxies)
         else:
             self.proxy_cycle = None
+            self.proxy_count = 0
+        self.hedge = hedge
+        self.stats = stats
+
+    def next_proxy(self) -> dict:
+        next_proxy = next(self.proxy_cycle)
+        return next_proxy if next_proxy["http"] != "http://localhost" else {}
+
+    def send_hedged(self, url: str, send):
+        """
+        Sends through `send(proxy)` with the next proxy, hedged through the one
+        after it when a HedgePolicy is set and there are proxies to spare
+        """
+        if self.stats is not None:
+            send = self._recorded(send)
+        primary_proxy = self.next_proxy() if self.proxy_cycle else None
+        if primary_proxy is not None:
+            self.proxies = primary_proxy
+        wait_for_host(url)
+        if self.hedge is None or self.proxy_count < 2:
+            return send(primary_proxy)
+
+        def hedge():
+            hedge_proxy = self.next_proxy()
+            wait_for_host(url)
+            return send(hedge_proxy)
+
+        return self.hedge.send(
+            urlparse(url).hostname, lambda: send(primary_proxy), hedge
+        )
+
+    def _recorded(self, send):
+        def recorded_send(proxy):
+            started = time.perf_counter()
+            try:
+                response = send(proxy)
+            except Exception:
+                self.stats.count("errors")
+                raise
+            self.stats.record_response(response, time.perf_counter() - started)
+            return response
+
+        return recorded_send
 
     @staticmethod
     def format_proxy(proxy):
@@ -53,8 +204,16 @@ class RotatingProxySession:
 
 
 class RequestsRotating(RotatingProxySession, requests.Session):
-    def __init__(self, proxies=None, has_retry=False, delay=1, clear_cookies=False):
-        RotatingProxySession.__init__(self, proxies=proxies)
+    def __init__(
+        self,
+        proxies=None,
+        has_retry=False,
+        delay=1,
+        clear_cookies=False,
+        hedge=None,
+        stats=None,
+    ):
+        RotatingProxySession.__init__(self, proxies=proxies, hedge=hedge, stats=stats)
         requests.Session.__init__(self)
         self.clear_cookies = clear_cookies
         self.allow_redirects = True
@@ -77,30 +236,35 @@ class RequestsRotating(RotatingProxySession, requests.Session):
         if self.clear_cookies:
             self.cookies.clear()
 
-        if self.proxy_cycle:
-            next_proxy = next(self.proxy_cycle)
-            if next_proxy["http"] != "http://localhost":
-                self.proxies = next_proxy
-            else:
-                self.proxies = {}
-        return requests.Session.request(self, method, url, **kwargs)
+        def send(proxy):
+            request_kwargs = kwargs
+            if proxy is not None:
+                # None values drop the session's proxies for this request
+                proxies = proxy or {"http": None, "https": None}
+                request_kwargs = {**kwargs, "proxies": proxies}
+            return requests.Session.request(self, method, url, **request_kwargs)
+
+        return self.send_hedged(url, send)
 
 
 class TLSRotating(RotatingProxySession, tls_client.Session):
-    def __init__(self, proxies=None):
-        RotatingProxySession.__init__(self, proxies=proxies)
+    def __init__(self, proxies=None, hedge=None, stats=None):
+        RotatingProxySession.__init__(self, proxies=proxies, hedge=hedge, stats=stats)
         tls_client.Session.__init__(self, random_tls_extension_order=True)
 
-    def execute_request(self, *args, **kwargs):
-        if self.proxy_cycle:
-            next_proxy = next(self.proxy_cycle)
-            if next_proxy["http"] != "http://localhost":
-                self.proxies = next_proxy
-            else:
-                self.proxies = {}
-        response = tls_client.Session.execute_request(self, *args, **kwargs)
-        response.ok = response.status_code in range(200, 400)
-        return response
+    def execute_request(self, method, url, *args, **kwargs):
+        def send(proxy):
+            request_kwargs = kwargs
+            if proxy is not None:
+                # an empty proxy url sends the request without a proxy
+                request_kwargs = {**kwargs, "proxy": proxy or {"http": ""}}
+            response = tls_client.Session.execute_request(
+                self, method, url, *args, **request_kwargs
+            )
+            response.ok = response.status_code in range(200, 400)
+            return response
+
+        return self.send_hedged(url, send)
 
 
 def create_session(
@@ -111,19 +275,25 @@ def create_session(
     has_retry: bool = False,
     delay: int = 1,
     clear_cookies: bool = False,
+    hedge=None,
+    stats=None,
 ) -> requests.Session:
     """
     Creates a requests session with optional tls, proxy, and retry settings.
+    :param hedge: HedgePolicy duplicating slow requests through another proxy
+    :param stats: ScrapeStats recording requests, bytes, retries, 429s and network time
     :return: A session object
     """
     if is_tls:
-        session = TLSRotating(proxies=proxies)
+        session = TLSRotating(proxies=proxies, hedge=hedge, stats=stats)
     else:
         session = RequestsRotating(
             proxies=proxies,
             has_retry=has_retry,
             delay=delay,
             clear_cookies=clear_cookies,
+            hedge=hedge,
+            stats=stats,
         )
 
     if ca_cert:
@@ -132,6 +302,16 @@ def create_session(
     return session
 
 
+def load_pyarrow():
+    """pyarrow (with its IPC module) if installed, else None; it is an optional dependency"""
+    try:
+        import pyarrow
+        import pyarrow.ipc  # noqa: F401
+    except ImportError:
+        return None
+    return pyarrow
+
+
 def set_logger_level(verbose: int):
     """
     Adjusts the logger's level. This function allows the logging level to be changed at runtime.
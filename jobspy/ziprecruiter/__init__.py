@@ -3,7 +3,6 @@ from __future__ import annotations
 import json
 import math
 import re
-import time
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
@@ -46,7 +45,9 @@ class ZipRecruiter(Scraper):
         super().__init__(Site.ZIP_RECRUITER, proxies=proxies)
 
         self.scraper_input = None
-        self.session = create_session(proxies=proxies, ca_cert=ca_cert)
+        self.session = create_session(
+            proxies=proxies, ca_cert=ca_cert, stats=self.stats
+        )
         self.session.headers.update(headers)
         self._get_cookies()
 
@@ -66,10 +67,10 @@ class ZipRecruiter(Scraper):
 
         max_pages = math.ceil(scraper_input.results_wanted / self.jobs_per_page)
         for page in range(1, max_pages + 1):
-            if len(job_list) >= scraper_input.results_wanted:
+            if len(job_list) >= scraper_input.results_wanted or self.cancelled():
                 break
             if page > 1:
-                time.sleep(self.delay)
+                self.pause(self.delay)
             log.info(f"search page: {page} / {max_pages}")
             jobs_on_page, continue_token = self._find_jobs_in_page(
                 scraper_input, continue_token
@@ -112,7 +113,8 @@ class ZipRecruiter(Scraper):
                 log.error(f"Indeed: {str(e)}")
             return jobs_list, ""
 
-        res_data = res.json()
+        with self.stats.timer("parse"):
+            res_data = res.json()
         jobs_list = res_data.get("jobs", [])
         next_continue_token = res_data.get("continue", None)
         with ThreadPoolExecutor(max_workers=self.jobs_per_page) as executor:
@@ -131,13 +133,12 @@ class ZipRecruiter(Scraper):
             return
         self.seen_urls.add(job_url)
 
+        fetch_descriptions = self.scraper_input.fetch_descriptions
         description = job.get("job_description", "").strip()
         listing_type = job.get("buyer_type", "")
-        description = (
-            markdown_converter(description)
-            if self.scraper_input.description_format == DescriptionFormat.MARKDOWN
-            else description
-        )
+        if description and self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
+            with self.stats.timer("markdown"):
+                description = markdown_converter(description)
         company = job.get("hiring_company", {}).get("name")
         country_value = "usa" if job.get("job_country") == "US" else "canada"
         country_enum = Country.from_string(country_value)
@@ -154,33 +155,44 @@ class ZipRecruiter(Scraper):
         comp_min = int(job["compensation_min"]) if "compensation_min" in job else None
         comp_max = int(job["compensation_max"]) if "compensation_max" in job else None
         comp_currency = job.get("compensation_currency")
-        description_full, job_url_direct = self._get_descr(job_url)
-
-        return JobPost(
-            id=f'zr-{job["listing_key"]}',
-            title=title,
-            company_name=company,
-            location=location,
-            job_type=job_type,
-            compensation=Compensation(
-                interval=comp_interval,
-                min_amount=comp_min,
-                max_amount=comp_max,
-                currency=comp_currency,
-            ),
-            date_posted=date_posted,
-            job_url=job_url,
-            description=description_full if description_full else description,
-            emails=extract_emails_from_text(description) if description else None,
-            job_url_direct=job_url_direct,
-            listing_type=listing_type,
-        )
+        description_full = job_url_direct = None
+        if fetch_descriptions:
+            description_full, job_url_direct = self._get_descr(job_url)
+
+        with self.stats.timer("validation"):
+            return JobPost(
+                id=f'zr-{job["listing_key"]}',
+                title=title,
+                company_name=company,
+                location=location,
+                job_type=job_type,
+                compensation=Compensation(
+                    interval=comp_interval,
+                    min_amount=comp_min,
+                    max_amount=comp_max,
+                    currency=comp_currency,
+                ),
+                date_posted=date_posted,
+                job_url=job_url,
+                description=description_full if description_full else description,
+                emails=extract_emails_from_text(description) if description else None,
+                job_url_direct=job_url_direct,
+                listing_type=listing_type,
+            )
+
+    def fetch_description(self, job: dict, scraper_input: ScraperInput) -> str | None:
+        """
+        Fetches one job's full description from its job page
+        """
+        self.scraper_input = scraper_input
+        return self._get_descr(job["job_url"])[0]
 
     def _get_descr(self, job_url):
         res = self.session.get(job_url, allow_redirects=True)
         description_full = job_url_direct = None
         if res.ok:
-            soup = BeautifulSoup(res.text, "html.parser")
+            with self.stats.timer("parse"):
+                soup = BeautifulSoup(res.text, "html.parser")
             job_descr_div = soup.find("div", class_="job_description")
             company_descr_section = soup.find("section", class_="company_description")
             job_description_clean = (
@@ -207,7 +219,8 @@ class ZipRecruiter(Scraper):
                 job_url_direct = None
 
             if self.scraper_input.description_format == DescriptionFormat.MARKDOWN:
-                description_full = markdown_converter(description_full)
+                with self.stats.timer("markdown"):
+                    description_full = markdown_converter(description_full)
 
         return description_full, job_url_direct
 
@@ -1,19 +1,42 @@
 from __future__ import annotations
 
+import time
+from contextlib import nullcontext
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from datetime import datetime
 from typing import Tuple
 
 import pandas as pd
 
+from jobspy.batch import scrape_jobs_batch
+from jobspy.compact import compact_jobs
 from jobspy.bayt import BaytScraper
+from jobspy.datasets import SharedDatasets
+from jobspy.dedup import JobDeduplicator, deduplicate_jobs
+from jobspy.descriptions import DescriptionFetcher
+from jobspy.employers import EmployerCache, employer_cache
+from jobspy.facets import FacetIndex
 from jobspy.glassdoor import Glassdoor
 from jobspy.google import Google
+from jobspy.hedging import HedgePolicy
 from jobspy.indeed import Indeed
 from jobspy.linkedin import LinkedIn
 from jobspy.naukri import Naukri
+from jobspy.prerank import RelevancePreRanker
+from jobspy.profiling import ScrapeProfiler
+from jobspy.query_cache import QueryCache
+from jobspy.scoring import JobScorer, KeywordScoringClient, OpenAIClient
+from jobspy.scoring import ScoreCache
+from jobspy.search import JobSearchIndex, result_fingerprint
+from jobspy.singleflight import SingleFlight, scraper_input_key
+from jobspy.spill import SpillBuffer, SpilledJobs
+from jobspy.stats import ScrapeStats
 from jobspy.model import JobType, Location, JobResponse, Country
 from jobspy.model import SalarySource, ScraperInput, Site
+from jobspy.store import JobStore
 from jobspy.util import (
+    CancelToken,
     set_logger_level,
     extract_salary,
     create_logger,
@@ -24,6 +47,10 @@ from jobspy.util import (
 )
 from jobspy.ziprecruiter import ZipRecruiter
 
+_scrapes_in_flight = SingleFlight()
+# seconds past the deadline to wait for scrapers finishing their current page
+DEADLINE_GRACE = 5.0
+
 
 def scrape_jobs(
     site_name: str | list[str] | Site | list[Site] | None = None,
@@ -46,11 +73,46 @@ def scrape_jobs(
     hours_old: int = None,
     enforce_annual_salary: bool = False,
     verbose: int = 0,
+    job_store: JobStore | str | None = None,
+    query_cache: QueryCache | None = None,
+    timeout: float | None = None,
+    deadline: float | datetime | None = None,
+    on_error: str = "raise",
+    hedge: HedgePolicy | None = None,
+    return_stats: bool = False,
+    profile: str | None = None,
+    profile_dir: str | None = None,
+    memory_optimized: bool = False,
+    fetch_descriptions: bool = True,
     **kwargs,
-) -> pd.DataFrame:
+) -> pd.DataFrame | tuple[pd.DataFrame, ScrapeStats]:
     """
     Scrapes job data from job boards concurrently
-    :return: Pandas DataFrame containing job data
+    :param job_store: JobStore (or path to its SQLite file) to upsert the results into
+    :param query_cache: QueryCache to answer this call from an earlier, broader
+        one when possible, and to record this call's results in
+    :param timeout: seconds the whole call may take; scrapers stop between pages
+        once it runs out and return the jobs found so far
+    :param deadline: same as `timeout` as an absolute time (epoch seconds or datetime)
+    :param on_error: "raise" re-raises the first scraper error; "partial" keeps
+        the other sites' jobs and reports the failure in the site status
+    :param hedge: HedgePolicy re-sending slow Indeed/Glassdoor requests through
+        another proxy (needs at least two proxies); its `metrics()` report the hedges
+    :param return_stats: also return the ScrapeStats of the call (per-site
+        requests, retries, bytes, 429s and time per stage), as `(jobs_df, stats)`
+    :param profile: "cpu", "memory" or "both" to profile each site's scrape with
+        cProfile and/or tracemalloc; the hottest functions and top allocations
+        are logged and `attrs["profile_files"]` lists the files written per site
+    :param profile_dir: directory for the profile files (a new temporary one if None)
+    :param memory_optimized: return the frame with categorical and nullable numeric
+        dtypes (see `compact_jobs`); `attrs["memory_usage"]` has the bytes saved
+    :param fetch_descriptions: False scrapes listings only, skipping the per-job
+        detail requests; description is empty unless the listing includes one
+        (ZipRecruiter's search results do); a DescriptionFetcher
+        fetches the description of a job when it is needed
+    :return: Pandas DataFrame containing job data. `attrs["site_status"]` maps each
+        site to its status ("ok", "partial", "timeout" or "error"), job count,
+        elapsed seconds, error message and whether the site ran out of results
     """
     SCRAPER_MAPPING = {
         Site.LINKEDIN: LinkedIn,
@@ -96,122 +158,245 @@ def scrape_jobs(
         indeed_company_id=indeed_company_id,
         offset=offset,
         hours_old=hours_old,
+        fetch_descriptions=fetch_descriptions,
     )
+    cache_options = {"enforce_annual_salary": enforce_annual_salary}
+    if query_cache is not None:
+        cached_jobs = query_cache.get(scraper_input, **cache_options)
+        if cached_jobs is not None:
+            if memory_optimized:
+                cached_jobs = compact_jobs(cached_jobs)
+            return (cached_jobs, ScrapeStats()) if return_stats else cached_jobs
+
+    if timeout is not None or deadline is not None:
+        budgets = []
+        if timeout is not None:
+            budgets.append(timeout)
+        if deadline is not None:
+            if isinstance(deadline, datetime):
+                deadline = deadline.timestamp()
+            budgets.append(deadline - time.time())
+        cancel_token = CancelToken(time.monotonic() + min(budgets))
+    else:
+        cancel_token = CancelToken()
+    started_at = time.monotonic()
+    profiler = ScrapeProfiler(profile, profile_dir) if profile else None
 
-    def scrape_site(site: Site) -> Tuple[str, JobResponse]:
-        scraper_class = SCRAPER_MAPPING[site]
-        scraper = scraper_class(proxies=proxies, ca_cert=ca_cert)
-        scraped_data: JobResponse = scraper.scrape(scraper_input)
-        cap_name = site.value.capitalize()
-        site_name = "ZipRecruiter" if cap_name == "Zip_recruiter" else cap_name
-        create_logger(site_name).info(f"finished scraping")
-        return site.value, scraped_data
+    def run_scrape() -> tuple[pd.DataFrame, ScrapeStats]:
+        stats = ScrapeStats()
+        site_status = {}
 
-    site_to_jobs_dict = {}
+        def site_logger(site: Site):
+            cap_name = site.value.capitalize()
+            return create_logger("ZipRecruiter" if cap_name == "Zip_recruiter" else cap_name)
 
-    def worker(site):
-        site_val, scraped_info = scrape_site(site)
-        return site_val, scraped_info
+        def scrape_site(site: Site) -> Tuple[str, JobResponse]:
+            scraper_class = SCRAPER_MAPPING[site]
+            scraper = scraper_class(proxies=proxies, ca_cert=ca_cert)
+            scraper.cancel_token = cancel_token
+            scraper.hedge = hedge
+            stats.sites[site.value] = scraper.stats
+            profiling = profiler.site(site.value) if profiler else nullcontext()
+            with profiling, scraper.stats.timer("total"):
+                scraped_data: JobResponse = scraper.scrape(scraper_input)
+            scraped_data.stats = scraper.stats
+            stopped_early = cancel_token.cancelled
+            if stopped_early:
+                site_logger(site).info("stopped at the deadline")
+            else:
+                site_logger(site).info("finished scraping")
+            site_status[site.value] = {
+                "status": "partial" if stopped_early else "ok",
+                "jobs": len(scraped_data.jobs),
+                "seconds": round(time.monotonic() - started_at, 2),
+                "error": None,
+                "exhausted": scraped_data.exhausted,
+            }
+            return site.value, scraped_data
 
-    with ThreadPoolExecutor() as executor:
+        site_to_jobs_dict = {}
+
+        def worker(site):
+            site_val, scraped_info = scrape_site(site)
+            return site_val, scraped_info
+
+        if profiler is not None:
+            profiler.start()
+        executor = ThreadPoolExecutor()
         future_to_site = {
             executor.submit(worker, site): site for site in scraper_input.site_type
         }
+        remaining = cancel_token.remaining()
+        try:
+            for future in as_completed(
+                future_to_site,
+                timeout=None if remaining is None else remaining + DEADLINE_GRACE,
+            ):
+                site = future_to_site[future]
+                try:
+                    site_value, scraped_data = future.result()
+                except Exception as e:
+                    if on_error != "partial":
+                        raise
+                    site_logger(site).error(f"scraping failed: {e}")
+                    site_status[site.value] = {
+                        "status": "error",
+                        "jobs": 0,
+                        "seconds": round(time.monotonic() - started_at, 2),
+                        "error": str(e),
+                    }
+                    continue
+                site_to_jobs_dict[site_value] = scraped_data
+        # as_completed raises concurrent.futures.TimeoutError, the builtin only from Python 3.11
+        except FuturesTimeoutError:
+            late_sites = [
+                site.value for future, site in future_to_site.items() if not future.done()
+            ]
+            if on_error != "partial":
+                raise TimeoutError(f"sites still running at the deadline: {late_sites}")
+            for site_value in late_sites:
+                site_status[site_value] = {
+                    "status": "timeout",
+                    "jobs": 0,
+                    "seconds": round(time.monotonic() - started_at, 2),
+                    "error": "still running at the deadline",
+                }
+        finally:
+            # stop any scraper still running (after an error or past the deadline)
+            cancel_token.cancel()
+            executor.shutdown(wait=False, cancel_futures=True)
+            if profiler is not None:
+                profiler.stop()
 
-        for future in as_completed(future_to_site):
-            site_value, scraped_data = future.result()
-            site_to_jobs_dict[site_value] = scraped_data
-
-    jobs_dfs: list[pd.DataFrame] = []
-
-    for site, job_response in site_to_jobs_dict.items():
-        for job in job_response.jobs:
-            job_data = job.dict()
-            job_url = job_data["job_url"]
-            job_data["site"] = site
-            job_data["company"] = job_data["company_name"]
-            job_data["job_type"] = (
-                ", ".join(job_type.value[0] for job_type in job_data["job_type"])
-                if job_data["job_type"]
-                else None
-            )
-            job_data["emails"] = (
-                ", ".join(job_data["emails"]) if job_data["emails"] else None
-            )
-            if job_data["location"]:
-                job_data["location"] = Location(
-                    **job_data["location"]
-                ).display_location()
-
-            # Handle compensation
-            compensation_obj = job_data.get("compensation")
-            if compensation_obj and isinstance(compensation_obj, dict):
-                job_data["interval"] = (
-                    compensation_obj.get("interval").value
-                    if compensation_obj.get("interval")
+        assembly_started = time.perf_counter()
+        jobs_dfs: list[pd.DataFrame] = []
+
+        for site, job_response in site_to_jobs_dict.items():
+            for job in job_response.jobs:
+                job_data = job.dict()
+                job_url = job_data["job_url"]
+                job_data["site"] = site
+                job_data["company"] = job_data["company_name"]
+                job_data["job_type"] = (
+                    ", ".join(job_type.value[0] for job_type in job_data["job_type"])
+                    if job_data["job_type"]
                     else None
                 )
-                job_data["min_amount"] = compensation_obj.get("min_amount")
-                job_data["max_amount"] = compensation_obj.get("max_amount")
-                job_data["currency"] = compensation_obj.get("currency", "USD")
-                job_data["salary_source"] = SalarySource.DIRECT_DATA.value
-                if enforce_annual_salary and (
-                    job_data["interval"]
-                    and job_data["interval"] != "yearly"
-                    and job_data["min_amount"]
-                    and job_data["max_amount"]
-                ):
-                    convert_to_annual(job_data)
-            else:
-                if country_enum == Country.USA:
-                    (
-                        job_data["interval"],
-                        job_data["min_amount"],
-                        job_data["max_amount"],
-                        job_data["currency"],
-                    ) = extract_salary(
-                        job_data["description"],
-                        enforce_annual_salary=enforce_annual_salary,
+                job_data["emails"] = (
+                    ", ".join(job_data["emails"]) if job_data["emails"] else None
+                )
+                if job_data["location"]:
+                    job_data["location"] = Location(
+                        **job_data["location"]
+                    ).display_location()
+
+                # Handle compensation
+                compensation_obj = job_data.get("compensation")
+                if compensation_obj and isinstance(compensation_obj, dict):
+                    job_data["interval"] = (
+                        compensation_obj.get("interval").value
+                        if compensation_obj.get("interval")
+                        else None
                     )
-                    job_data["salary_source"] = SalarySource.DESCRIPTION.value
-
-            job_data["salary_source"] = (
-                job_data["salary_source"]
-                if "min_amount" in job_data and job_data["min_amount"]
-                else None
-            )
-
-            #naukri-specific fields
-            job_data["skills"] = (
-                ", ".join(job_data["skills"]) if job_data["skills"] else None
-            )
-            job_data["experience_range"] = job_data.get("experience_range")
-            job_data["company_rating"] = job_data.get("company_rating")
-            job_data["company_reviews_count"] = job_data.get("company_reviews_count")
-            job_data["vacancy_count"] = job_data.get("vacancy_count")
-            job_data["work_from_home_type"] = job_data.get("work_from_home_type")
-
-            job_df = pd.DataFrame([job_data])
-            jobs_dfs.append(job_df)
-
-    if jobs_dfs:
-        # Step 1: Filter out all-NA columns from each DataFrame before concatenation
-        filtered_dfs = [df.dropna(axis=1, how="all") for df in jobs_dfs]
-
-        # Step 2: Concatenate the filtered DataFrames
-        jobs_df = pd.concat(filtered_dfs, ignore_index=True)
-
-        # Step 3: Ensure all desired columns are present, adding missing ones as empty
-        for column in desired_order:
-            if column not in jobs_df.columns:
-                jobs_df[column] = None  # Add missing columns as empty
-
-        # Reorder the DataFrame according to the desired order
-        jobs_df = jobs_df[desired_order]
-
-        # Step 4: Sort the DataFrame as required
-        return jobs_df.sort_values(
-            by=["site", "date_posted"], ascending=[True, False]
-        ).reset_index(drop=True)
-    else:
-        return pd.DataFrame()
\ No newline at end of file
+                    job_data["min_amount"] = compensation_obj.get("min_amount")
+                    job_data["max_amount"] = compensation_obj.get("max_amount")
+                    job_data["currency"] = compensation_obj.get("currency", "USD")
+                    job_data["salary_source"] = SalarySource.DIRECT_DATA.value
+                    if enforce_annual_salary and (
+                        job_data["interval"]
+                        and job_data["interval"] != "yearly"
+                        and job_data["min_amount"]
+                        and job_data["max_amount"]
+                    ):
+                        convert_to_annual(job_data)
+                else:
+                    if country_enum == Country.USA:
+                        (
+                            job_data["interval"],
+                            job_data["min_amount"],
+                            job_data["max_amount"],
+                            job_data["currency"],
+                        ) = extract_salary(
+                            job_data["description"],
+                            enforce_annual_salary=enforce_annual_salary,
+                        )
+                        job_data["salary_source"] = SalarySource.DESCRIPTION.value
+
+                job_data["salary_source"] = (
+                    job_data["salary_source"]
+                    if "min_amount" in job_data and job_data["min_amount"]
+                    else None
+                )
+
+                #naukri-specific fields
+                job_data["skills"] = (
+                    ", ".join(job_data["skills"]) if job_data["skills"] else None
+                )
+                job_data["experience_range"] = job_data.get("experience_range")
+                job_data["company_rating"] = job_data.get("company_rating")
+                job_data["company_reviews_count"] = job_data.get("company_reviews_count")
+                job_data["vacancy_count"] = job_data.get("vacancy_count")
+                job_data["work_from_home_type"] = job_data.get("work_from_home_type")
+
+                job_df = pd.DataFrame([job_data])
+                jobs_dfs.append(job_df)
+
+        if jobs_dfs:
+            # Step 1: Filter out all-NA columns from each DataFrame before concatenation
+            filtered_dfs = [df.dropna(axis=1, how="all") for df in jobs_dfs]
+
+            # Step 2: Concatenate the filtered DataFrames
+            jobs_df = pd.concat(filtered_dfs, ignore_index=True)
+
+            # Step 3: Ensure all desired columns are present, adding missing ones as empty
+            for column in desired_order:
+                if column not in jobs_df.columns:
+                    jobs_df[column] = None  # Add missing columns as empty
+
+            # Reorder the DataFrame according to the desired order
+            jobs_df = jobs_df[desired_order]
+
+            # Step 4: Sort the DataFrame as required
+            jobs_df = jobs_df.sort_values(
+                by=["site", "date_posted"], ascending=[True, False]
+            ).reset_index(drop=True)
+        else:
+            jobs_df = pd.DataFrame()
+        jobs_df.attrs["site_status"] = site_status
+        if profiler is not None:
+            jobs_df.attrs["profile_files"] = profiler.files
+        stats.add_time("dataframe", time.perf_counter() - assembly_started)
+        stats.add_time("total", time.monotonic() - started_at)
+        return jobs_df, stats
+
+    # identical searches already running in this process share that run
+    flight_options = {
+        "proxies": proxies,
+        "ca_cert": ca_cert,
+        "hedge": hedge,
+        "timeout": timeout,
+        "deadline": deadline,
+        "on_error": on_error,
+        "profile": profile,
+        "profile_dir": profile_dir,
+    }
+    (jobs_df, stats), shared = _scrapes_in_flight.do(
+        scraper_input_key(scraper_input, **cache_options, **flight_options), run_scrape
+    )
+    if shared:
+        jobs_df = jobs_df.copy()
+
+    complete = all(
+        status["status"] == "ok" for status in jobs_df.attrs["site_status"].values()
+    )
+    if query_cache is not None and complete:
+        query_cache.put(scraper_input, jobs_df, **cache_options)
+    if job_store is not None and not jobs_df.empty:
+        if isinstance(job_store, str):
+            with JobStore(job_store) as store:
+                store.upsert(jobs_df)
+        else:
+            job_store.upsert(jobs_df)
+    if memory_optimized:
+        jobs_df = compact_jobs(jobs_df)
+    return (jobs_df, stats) if return_stats else jobs_df
\ No newline at end of file
@@ -31,6 +31,10 @@ setup(
         "regex>=2021.0.0",
         "pydantic>=1.8.0",
     ],
+    extras_require={
+        # memory-mapped Arrow files for shared and spilled result sets
+        "arrow": ["pyarrow>=14.0"],
+    },
     keywords="job scraping indeed linkedin glassdoor google ziprecruiter company-specific",
     project_urls={
         "Bug Reports": "https://github.com/leochan3/JobSyp-new2/issues",
@@ -1,9 +1,17 @@
 #!/usr/bin/env python3
 import streamlit as st
+import numpy as np
 import pandas as pd
-from jobspy_enhanced import scrape_jobs
+from jobspy_enhanced import scrape_jobs_batch, JobStore
+from jobspy_enhanced import JobSearchIndex, result_fingerprint
+from jobspy_enhanced import JobScorer, OpenAIClient, ScoreCache, RelevancePreRanker
+from jobspy_enhanced import FacetIndex, QueryCache, SpillBuffer, SpilledJobs, SharedDatasets
+from jobspy_enhanced import DescriptionFetcher
 from datetime import datetime
 import os
+import threading
+import time
+import uuid
 from fuzzywuzzy import fuzz, process
 import openai
 
@@ -19,6 +27,86 @@ UPLOAD_FOLDER = 'uploads'
 if not os.path.exists(UPLOAD_FOLDER):
     os.makedirs(UPLOAD_FOLDER)
 
+# Every scrape is upserted into this SQLite job store so results can be reloaded without re-scraping
+JOB_STORE_PATH = os.environ.get('JOB_STORE_PATH', 'jobs.db')
+
+# How long a scrape can answer later searches it contains (e.g. 24h after 48h for the same company),
+# and how much memory the cached scrapes may take together
+QUERY_CACHE_TTL_SECONDS = 15 * 60
+QUERY_CACHE_MEMORY_MB = int(os.environ.get('QUERY_CACHE_MEMORY_MB', 256))
+
+# AI filter pre-ranking: jobs at least this similar to the target are scored by the AI, at most this share of
+# the result set (but never fewer than the minimum), so the cap grows with the results instead of cutting
+# recall on large ones (see benchmarks/prerank.py for recall at each cap on the bundled CSVs)
+PRERANK_MIN_SIMILARITY = 0.05
+PRERANK_TOP_FRACTION = 0.25
+PRERANK_MIN_TOP_K = 300
+
+# Combined company results beyond this size spill to disk; the table then keeps every column but the
+# descriptions in memory and reads a description when its job is viewed
+RESULT_MEMORY_LIMIT_MB = int(os.environ.get('RESULT_MEMORY_LIMIT_MB', 512))
+
+# Finished result sets are written here once and shared (memory-mapped with pyarrow) by every session and
+# by other app processes pointed at the same directory; the least recently used beyond the limit are deleted
+SHARED_DATASETS_DIR = os.environ.get('SHARED_DATASETS_DIR', os.path.join(UPLOAD_FOLDER, 'datasets'))
+SHARED_DATASETS_MAX = 16
+
+# With LAZY_DESCRIPTIONS=1 searches scrape listings only; a job's description is fetched when it is viewed
+# (and the visible page's in the background), so large company searches skip one detail request per job.
+# The AI filter then scores jobs without their descriptions, and a salary stated only in the description shows in
+# the job's detail pane once it is fetched (the table and salary sorting go without it).
+LAZY_DESCRIPTIONS = os.environ.get('LAZY_DESCRIPTIONS', '0') == '1'
+
+@st.cache_resource
+def get_job_store():
+    """One shared job store connection for all sessions"""
+    return JobStore(JOB_STORE_PATH)
+
+@st.cache_resource
+def get_description_fetcher():
+    """Descriptions fetched on demand, cached by job id for all sessions"""
+    return DescriptionFetcher()
+
+@st.cache_resource
+def get_shared_datasets():
+    """Result sets shared by all sessions, keyed by result fingerprint"""
+    return SharedDatasets(SHARED_DATASETS_DIR, max_datasets=SHARED_DATASETS_MAX)
+
+def publish_jobs(jobs, spilled=None):
+    """
+    Makes `jobs` this session's result set and returns the frame to display
+    It is stored once in the shared datasets, so sessions viewing the same result hold one copy, not one each
+    """
+    datasets = get_shared_datasets()
+    holder = st.session_state.setdefault('dataset_holder', uuid.uuid4().hex)
+    fingerprint = result_fingerprint(jobs)
+    previous = st.session_state.get('jobs_fingerprint')
+    if previous and previous != fingerprint:
+        datasets.release(previous, holder)
+    st.session_state.jobs_fingerprint = fingerprint
+    st.session_state.jobs_spill = spilled
+    shared = datasets.acquire(fingerprint, holder) if datasets.put(fingerprint, jobs) else None
+    if shared is not None:
+        st.session_state.pop('jobs_data', None)
+        return shared
+    # The dataset could not be stored: keep a private copy in the session
+    st.session_state.jobs_data = jobs
+    return jobs
+
+def session_jobs():
+    """This session's result set, or None (also when its shared dataset was evicted)"""
+    if 'jobs_data' in st.session_state:
+        return st.session_state.jobs_data
+    fingerprint = st.session_state.get('jobs_fingerprint')
+    if fingerprint is None:
+        return None
+    return get_shared_datasets().get(fingerprint, st.session_state.get('dataset_holder'))
+
+@st.cache_resource
+def get_query_cache():
+    """Recent scrapes shared by all sessions; narrower repeat searches are answered by filtering them"""
+    return QueryCache(ttl=QUERY_CACHE_TTL_SECONDS, max_bytes=QUERY_CACHE_MEMORY_MB * 2**20)
+
 def create_job_synonyms():
     """Create a mapping of job title synonyms and related terms"""
     synonyms = {
@@ -69,181 +157,89 @@ def create_job_synonyms():
     }
     return synonyms
 
-def smart_job_search(jobs_df, search_query, threshold=60):
+@st.cache_resource(max_entries=8)
+def get_search_index(fingerprint, _jobs_df):
+    """Search index over one result set, built once per result fingerprint"""
+    return JobSearchIndex(_jobs_df['title'].tolist(), synonyms=create_job_synonyms())
+
+def smart_job_search(jobs_df, search_query, threshold=60, fingerprint=None):
     """
-    Smart job search using fuzzy matching and synonyms
-    Returns jobs that match the search query with relevance scoring
+    Smart job search using the cached title index and synonyms
+    Returns jobs that match the search query, most relevant first
     """
     if not search_query or search_query.strip() == "":
         return jobs_df
     
-    search_query = search_query.lower().strip()
-    search_words = search_query.split()
-    
-    # Simple but effective approach: filter jobs that contain the search terms
-    filtered_jobs = []
-    
-    for idx, job in jobs_df.iterrows():
-        job_title = str(job['title']).lower()
-        
-        # For exact phrase search
-        if search_query in job_title:
-            filtered_jobs.append(job)
-        # For multi-word search, require ALL words to be present
-        elif len(search_words) > 1 and all(word in job_title for word in search_words):
-            filtered_jobs.append(job)
-        # For single word search
-        elif len(search_words) == 1 and search_words[0] in job_title:
-            filtered_jobs.append(job)
-    
-    # Return filtered dataframe
-    if filtered_jobs:
-        return pd.DataFrame(filtered_jobs).reset_index(drop=True)
-    else:
-        return pd.DataFrame(columns=jobs_df.columns)
+    index = get_search_index(fingerprint or result_fingerprint(jobs_df), jobs_df)
+    positions, _ = index.search(search_query)
+    return jobs_df.iloc[positions].reset_index(drop=True)
+
+@st.cache_resource
+def get_score_cache():
+    """AI scores persisted next to the job store and shared by all sessions"""
+    return ScoreCache(JOB_STORE_PATH)
+
+@st.cache_resource(max_entries=8)
+def get_pre_ranker(fingerprint, _jobs_df):
+    """Local TF-IDF relevance model over one result set, built once per result fingerprint"""
+    return RelevancePreRanker.from_jobs(_jobs_df)
+
+def score_status(score):
+    """Color and label for an AI matching score"""
+    if score >= 80:
+        return "limegreen", "PERFECT MATCH"
+    elif score >= 60:
+        return "green", "HIGHLY RELEVANT"
+    elif score >= 40:
+        return "orange", "MODERATELY RELEVANT"
+    elif score >= 20:
+        return "yellow", "SLIGHTLY RELEVANT"
+    return "#ff6666", "NOT RELEVANT"
 
 def ai_filter_jobs(jobs_df, user_target, min_score=50):
     """
     AI-powered job filtering with matching scores (0-100) using OpenAI GPT-4.1-nano
-    Analyzes job titles, descriptions, company, and location for comprehensive relevance scoring
+    Jobs are scored several per prompt and concurrently; scores are cached in the job store by job, description and target
     """
     if not user_target or user_target.strip() == "":
         return jobs_df
     
-    import openai
-    import re
-    client = openai.OpenAI(api_key=os.environ["OPENAI_API_KEY"])
-    model = "gpt-4.1-nano"
-    scored_jobs = []
+    # Drop obvious misses locally so only plausible jobs cost an AI call
+    pre_ranker = get_pre_ranker(result_fingerprint(jobs_df), jobs_df)
+    top_k = max(PRERANK_MIN_TOP_K, int(len(jobs_df) * PRERANK_TOP_FRACTION))
+    positions, _ = pre_ranker.select(user_target, top_k=top_k, min_similarity=PRERANK_MIN_SIMILARITY)
+    candidates_df = jobs_df.iloc[positions]
+    st.info(f"⚡ Pre-ranker sent {len(candidates_df)} of {len(jobs_df)} jobs to the AI for scoring")
+    if len(candidates_df) == 0:
+        return pd.DataFrame(columns=jobs_df.columns)
+    
+    scorer = JobScorer(OpenAIClient(model="gpt-4.1-nano"), cache=get_score_cache())
     
     # Live log placeholder
+    progress_bar = st.progress(0)
     log_placeholder = st.empty()
     log_lines = ["🤖 AI is analyzing job titles and descriptions with matching scores..."]
     
-    with st.spinner("🤖 AI is analyzing job titles and descriptions for relevance..."):
-        for idx, job in jobs_df.iterrows():
-            job_title = str(job['title'])
-            company = str(job.get('company', 'Unknown'))
-            location = str(job.get('location', 'Unknown'))
-            job_description = str(job.get('description', ''))
-            
-            # Truncate description if too long (to avoid token limits)
-            if len(job_description) > 2000:
-                job_description = job_description[:2000] + "..."
-            
-            # Enhanced prompt for comprehensive scoring
-            prompt = f"""
-You are an expert job matching AI. Analyze this job comprehensively for relevance to the user's interests.
-
-USER INTEREST: {user_target}
-
-JOB INFORMATION:
-- Title: {job_title}
-- Company: {company}
-- Location: {location}
-- Description: {job_description}
-
-Analyze the job description for:
-1. Required skills and technologies
-2. Job responsibilities and duties
-3. Experience level and qualifications
-4. Industry and domain focus
-5. Team and role context
-
-Provide a detailed analysis and score this job's relevance from 0-100, where:
-- 0-20: Completely irrelevant (e.g., retail manager for data scientist)
-- 21-40: Slightly relevant (e.g., business analyst for data scientist)
-- 41-60: Moderately relevant (e.g., data analyst for data scientist)
-- 61-80: Highly relevant (e.g., ML engineer for data scientist)
-- 81-100: Perfect match (e.g., data scientist for data scientist)
-
-Consider both the job title AND the detailed description content.
-
-Respond in this exact format:
-SCORE: [0-100]
-CONFIDENCE: [HIGH/MEDIUM/LOW]
-REASONING: [2-3 sentences explaining the score based on title and description analysis]
-
-Example:
-SCORE: 85
-CONFIDENCE: HIGH
-REASONING: This is a direct match for data science role. The title "Senior Data Scientist" and description mentioning "machine learning, Python, statistical analysis" directly align with the user's interest in data science positions.
-"""
-            
-            try:
-                response = client.chat.completions.create(
-                    model=model,
-                    messages=[{"role": "user", "content": prompt}],
-                    max_tokens=200,
-                    temperature=0.1
-                )
-                ai_response = response.choices[0].message.content.strip()
-                
-                # Parse the structured response
-                score_match = re.search(r'SCORE:\s*(\d+)', ai_response)
-                confidence_match = re.search(r'CONFIDENCE:\s*(HIGH|MEDIUM|LOW)', ai_response)
-                reasoning_match = re.search(r'REASONING:\s*(.+)', ai_response, re.DOTALL)
-                
-                if score_match and confidence_match and reasoning_match:
-                    score = int(score_match.group(1))
-                    confidence = confidence_match.group(1)
-                    reasoning = reasoning_match.group(1).strip()
-                    
-                    # Add score and metadata to job
-                    job_with_score = job.copy()
-                    job_with_score['ai_score'] = score
-                    job_with_score['ai_confidence'] = confidence
-                    job_with_score['ai_reasoning'] = reasoning
-                    
-                    # Color coding based on score
-                    if score >= 80:
-                        color = "limegreen"
-                        status = "PERFECT MATCH"
-                    elif score >= 60:
-                        color = "green"
-                        status = "HIGHLY RELEVANT"
-                    elif score >= 40:
-                        color = "orange"
-                        status = "MODERATELY RELEVANT"
-                    elif score >= 20:
-                        color = "yellow"
-                        status = "SLIGHTLY RELEVANT"
-                    else:
-                        color = "#ff6666"
-                        status = "NOT RELEVANT"
-                    
-                    log_lines.append(f"<span style='color:{color}'><b>{job_title}</b> — Score: <b>{score}/100</b> ({status})<br>Confidence: {confidence} | {reasoning}</span>")
-                    
-                    # Only keep jobs above minimum score
-                    if score >= min_score:
-                        scored_jobs.append(job_with_score)
-                else:
-                    # Fallback parsing if structured format fails
-                    log_lines.append(f"<span style='color:orange'>Job: <b>{job_title}</b> — AI parsing error, using fallback</span>")
-                    # Try to extract any number as score
-                    number_match = re.search(r'(\d+)', ai_response)
-                    if number_match:
-                        score = min(100, max(0, int(number_match.group(1))))
-                        job_with_score = job.copy()
-                        job_with_score['ai_score'] = score
-                        job_with_score['ai_confidence'] = 'LOW'
-                        job_with_score['ai_reasoning'] = 'Fallback parsing used'
-                        if score >= min_score:
-                            scored_jobs.append(job_with_score)
-                            
-            except Exception as e:
-                log_lines.append(f"<span style='color:orange'>Job: <b>{job_title}</b> — AI error: {str(e)[:50]}...</span>")
+    def on_batch(done, total, results):
+        for job, result in results:
+            job_title = job.get('title')
+            if result is None:
+                log_lines.append(f"<span style='color:orange'>Job: <b>{job_title}</b> — AI could not score this job</span>")
                 continue
-            
-            # Update the log live
-            log_placeholder.markdown("<br>".join(log_lines), unsafe_allow_html=True)
+            score, confidence, reasoning = result
+            color, status = score_status(score)
+            log_lines.append(f"<span style='color:{color}'><b>{job_title}</b> — Score: <b>{score}/100</b> ({status})<br>Confidence: {confidence} | {reasoning}</span>")
+        progress_bar.progress(done / total)
+        # Only the latest entries are rendered to keep each update cheap
+        log_placeholder.markdown("<br>".join(log_lines[-50:]), unsafe_allow_html=True)
     
-    # Final log update
-    log_placeholder.markdown("<br>".join(log_lines), unsafe_allow_html=True)
+    with st.spinner("🤖 AI is analyzing job titles and descriptions for relevance..."):
+        scored_df = scorer.score(candidates_df, user_target, on_batch=on_batch)
+    progress_bar.empty()
     
-    if scored_jobs:
+    scored_df = scored_df[scored_df['ai_score'] >= min_score]
+    if len(scored_df) > 0:
         # Sort by score (highest first)
-        scored_df = pd.DataFrame(scored_jobs)
         scored_df = scored_df.sort_values('ai_score', ascending=False).reset_index(drop=True)
         
         # Show summary statistics
@@ -275,152 +271,335 @@ def get_related_terms(keyword):
     
     return related_map.get(keyword, [])
 
-def scrape_multiple_companies(companies, location, hours_old, results_wanted):
-    """Scrape jobs for multiple companies with smart time-based splitting for high-volume companies"""
-    all_jobs = []
+# Seconds between reruns while a background scrape is in progress
+SCRAPE_POLL_SECONDS = 1.5
+# Finished scrapes are kept this long so a refreshed page can still pick up the results
+SCRAPE_TASK_TTL_SECONDS = 3600
+
+class ScrapeTask:
+    """
+    Company scrape running in a background thread, owned by the process-wide task registry
+    Reruns (including after a browser refresh) read its progress messages and partial results while it runs
+    """
+    def __init__(self, companies, location, hours_old, results_wanted, job_store, query_cache, datasets):
+        self.id = uuid.uuid4().hex[:12]
+        self.companies = companies
+        self.location = location
+        self.hours_old = hours_old
+        self.results_wanted = results_wanted
+        self.job_store = job_store
+        self.query_cache = query_cache
+        self.datasets = datasets
+        self.lock = threading.Lock()
+        self.company_jobs = {}  # company -> DataFrames found so far, without descriptions
+        self.messages = []  # (level, text); level is a Streamlit message function or 'detail'
+        self.status = f"Scraping {len(companies)} companies..."
+        self.progress = 0.0
+        self.version = 0
+        self.result = None
+        self.fingerprint = None  # key of the result in the shared datasets, once stored there
+        self.spilled = None  # SpilledJobs holding the descriptions when the result spilled to disk
+        self.done = False
+        self.finished_at = None
+        self._partial = (None, None)
+        self.thread = threading.Thread(target=self._run, daemon=True)
     
-    # Create progress tracking
-    progress_bar = st.progress(0)
-    status_text = st.empty()
+    def start(self):
+        self.thread.start()
+        return self
     
-    for i, company in enumerate(companies):
-        status_text.text(f"Scraping {company}... ({i+1}/{len(companies)})")
-        
+    def update(self, message=None, level='info', status=None, progress=None):
+        with self.lock:
+            if message:
+                self.messages.append((level, message))
+            if status is not None:
+                self.status = status
+            if progress is not None:
+                self.progress = progress
+            self.version += 1
+    
+    def add_jobs(self, company, jobs, replace=False):
+        """
+        Publishes jobs found for a company; `replace` drops what was published for it before
+        Descriptions are left out (they are in the job store) so the partial results stay small
+        """
+        jobs = jobs.drop(columns=['description'], errors='ignore')
+        with self.lock:
+            if replace:
+                self.company_jobs[company] = []
+            if len(jobs) > 0:
+                self.company_jobs.setdefault(company, []).append(jobs)
+            self.version += 1
+    
+    def snapshot(self):
+        with self.lock:
+            return list(self.messages), self.status, self.progress, self.done
+    
+    def partial_jobs(self):
+        """Jobs found so far, deduplicated by id only (the full deduplication runs once at the end)"""
+        with self.lock:
+            version = self.version
+            if self._partial[0] == version:
+                return self._partial[1]
+            frames = [frame for frames in self.company_jobs.values() for frame in frames]
+        if frames:
+            jobs = pd.concat(frames, ignore_index=True)
+            jobs = jobs.drop_duplicates(subset=['id']).reset_index(drop=True)
+        else:
+            jobs = pd.DataFrame()
+        self._partial = (version, jobs)
+        return jobs
+    
+    def _run(self):
         try:
-            # First, try a regular search to detect if company has many jobs
-            initial_jobs = scrape_jobs(
+            result = scrape_multiple_companies(self)
+        except Exception as e:
+            self.update(f"❌ Search failed: {e}", 'error')
+            result = pd.DataFrame()
+        fingerprint = result_fingerprint(result)
+        if len(result) > 0 and self.datasets.put(fingerprint, result):
+            # Sessions read the stored copy; the task keeps only its key
+            result = None
+        else:
+            fingerprint = None
+        with self.lock:
+            self.result = result
+            self.fingerprint = fingerprint
+            # The partial results are only shown while the scrape runs
+            self.company_jobs = {}
+            self._partial = (None, None)
+            self.done = True
+            self.finished_at = time.time()
+            self.version += 1
+
+@st.cache_resource
+def get_scrape_tasks():
+    """Registry of background scrapes by id, shared by all sessions so a refreshed page can reattach"""
+    return {}
+
+def start_scrape_task(companies, location, hours_old, results_wanted):
+    tasks = get_scrape_tasks()
+    now = time.time()
+    for task_id, task in list(tasks.items()):
+        if task.done and now - task.finished_at > SCRAPE_TASK_TTL_SECONDS:
+            del tasks[task_id]
+    task = ScrapeTask(companies, location, hours_old, results_wanted, get_job_store(), get_query_cache(), get_shared_datasets())
+    tasks[task.id] = task
+    return task.start()
+
+def scrape_multiple_companies(task):
+    """Scrape jobs for multiple companies with smart time-based splitting for high-volume companies"""
+    companies = task.companies
+    # Collects the company results, removing duplicates as they arrive and spilling to disk past the memory limit
+    all_jobs = SpillBuffer(memory_limit_mb=RESULT_MEMORY_LIMIT_MB)
+    
+    # First, run a regular search for every company concurrently to detect which ones have many jobs
+    initial_results = {}
+    completed = []
+    
+    def on_initial_result(index, query, jobs, error):
+        company = companies[index]
+        completed.append(company)
+        if error:
+            task.update(f"❌ Error scraping {company}: {error}", 'error')
+        else:
+            initial_results[company] = jobs
+            if len(jobs) > 0:
+                jobs['search_company'] = company
+                task.add_jobs(company, jobs)
+        task.update(status=f"Scraped {company}... ({len(completed)}/{len(companies)})", progress=len(completed) / len(companies))
+    
+    scrape_jobs_batch(
+        [{'indeed_company_id': company} for company in companies],
+        site_name=['indeed'],
+        location=task.location,
+        results_wanted=task.results_wanted,
+        hours_old=task.hours_old,
+        fetch_descriptions=not LAZY_DESCRIPTIONS,
+        verbose=0,
+        job_store=task.job_store,
+        query_cache=task.query_cache,
+        dedupe=False,
+        on_result=on_initial_result,
+    )
+    
+    # Time-based splitting with 24-hour windows up to 2 weeks
+    time_ranges = [
+        (None, 24, "Last 24 hours"),
+        (24, 48, "24-48 hours"),
+        (48, 72, "48-72 hours"),
+        (72, 96, "72-96 hours"),
+        (96, 120, "96-120 hours"),
+        (120, 144, "120-144 hours"),
+        (144, 168, "144-168 hours"),
+        (168, 192, "168-192 hours"),
+        (192, 216, "192-216 hours"),
+        (216, 240, "216-240 hours"),
+        (240, 264, "240-264 hours"),
+        (264, 288, "264-288 hours"),
+        (288, 312, "288-312 hours"),
+        (312, 336, "312-336 hours (2 weeks)"),
+        (336, None, "Older than 2 weeks")
+    ]
+    
+    for company in companies:
+        if company not in initial_results:
+            continue
+        initial_jobs = initial_results.pop(company)
+        
+        # If we got close to 1000 jobs, this company likely has more jobs available
+        # Use time-based splitting to get comprehensive results
+        if len(initial_jobs) >= 950:  # Close to 1000 indicates more jobs available
+            task.update(f"🔄 {company} has many jobs ({len(initial_jobs)}), using time-based search for comprehensive results...")
+            completed_ranges = []
+            total_ranges = len(time_ranges)
+            
+            def on_range_result(index, query, range_jobs, error):
+                range_name = time_ranges[index][2]
+                completed_ranges.append(range_name)
+                if error:
+                    task.update(f"⚠️ {company} - error in {range_name}: {error}", 'detail')
+                else:
+                    task.update(f"📅 {company} - {range_name}: {len(range_jobs)} jobs", 'detail')
+                    if len(range_jobs) > 0:
+                        range_jobs['search_company'] = company
+                        # The first window replaces the initial results, later windows add to it
+                        task.add_jobs(company, range_jobs, replace=len(completed_ranges) == 1)
+                task.update(status=f"⏳ {company}: searched {range_name}... ({len(completed_ranges)}/{total_ranges})")
+            
+            combined_company_jobs = scrape_jobs_batch(
+                [
+                    {'hours_old': end_hours, 'tags': {'time_range': range_name}}
+                    for start_hours, end_hours, range_name in time_ranges
+                ],
                 site_name=['indeed'],
                 indeed_company_id=company,
-                location=location,
-                results_wanted=results_wanted,
-                hours_old=hours_old,
-                verbose=0
+                location=task.location,
+                results_wanted=task.results_wanted,
+                fetch_descriptions=not LAZY_DESCRIPTIONS,
+                verbose=0,
+                job_store=task.job_store,
+                # No query cache: the windows run because the initial search hit Indeed's cap, so
+                # they must reach Indeed rather than be narrowed from a capped result
+                # Remove duplicates within this company's results
+                dedupe=True,
+                on_result=on_range_result,
             )
             
-            # If we got close to 1000 jobs, this company likely has more jobs available
-            # Use time-based splitting to get comprehensive results
-            if len(initial_jobs) >= 950:  # Close to 1000 indicates more jobs available
-                st.info(f"🔄 {company} has many jobs ({len(initial_jobs)}), using time-based search for comprehensive results...")
-                
-                # Time-based splitting with 24-hour windows up to 2 weeks
-                time_ranges = [
-                    (None, 24, "Last 24 hours"),
-                    (24, 48, "24-48 hours"),
-                    (48, 72, "48-72 hours"),
-                    (72, 96, "72-96 hours"),
-                    (96, 120, "96-120 hours"),
-                    (120, 144, "120-144 hours"),
-                    (144, 168, "144-168 hours"),
-                    (168, 192, "168-192 hours"),
-                    (192, 216, "192-216 hours"),
-                    (216, 240, "216-240 hours"),
-                    (240, 264, "240-264 hours"),
-                    (264, 288, "264-288 hours"),
-                    (288, 312, "288-312 hours"),
-                    (312, 336, "312-336 hours (2 weeks)"),
-                    (336, None, "Older than 2 weeks")
-                ]
-                
-                company_jobs = []
-                # Create a compact progress display
-                progress_placeholder = st.empty()
-                detailed_progress = st.expander(f"📊 Detailed Progress for {company}", expanded=False)
-                
-                completed_ranges = 0
-                total_ranges = len(time_ranges)
-                
-                for start_hours, end_hours, range_name in time_ranges:
-                    try:
-                        # Update compact progress
-                        progress_placeholder.text(f"⏳ Searching {range_name}... ({completed_ranges + 1}/{total_ranges})")
-                        
-                        range_jobs = scrape_jobs(
-                            site_name=['indeed'],
-                            indeed_company_id=company,
-                            location=location,
-                            results_wanted=results_wanted,
-                            hours_old=end_hours,
-                            verbose=0
-                        )
-                        if len(range_jobs) > 0:
-                            range_jobs['time_range'] = range_name
-                            company_jobs.append(range_jobs)
-                            # Show detailed progress in expander
-                            with detailed_progress:
-                                st.write(f"  📅 {range_name}: {len(range_jobs)} jobs")
-                        else:
-                            with detailed_progress:
-                                st.write(f"  📅 {range_name}: 0 jobs")
-                                
-                        completed_ranges += 1
-                        
-                    except Exception as e:
-                        with detailed_progress:
-                            st.warning(f"  ⚠️ Error in {range_name}: {e}")
-                        completed_ranges += 1
-                        continue
-                
-                # Clear the progress text
-                progress_placeholder.empty()
+            if len(combined_company_jobs) > 0:
+                combined_company_jobs['search_company'] = company
                 
-                if company_jobs:
-                    # Combine and deduplicate
-                    combined_company_jobs = pd.concat(company_jobs, ignore_index=True)
-                    # Remove duplicates within this company's results
-                    combined_company_jobs = combined_company_jobs.drop_duplicates(subset=['job_url', 'title'], keep='first')
-                    combined_company_jobs['search_company'] = company
-                    
-                    total_jobs = len(combined_company_jobs)
-                    st.success(f"✅ {company}: {total_jobs} jobs (time-based search)")
-                    all_jobs.append(combined_company_jobs)
-                else:
-                    # Fallback to initial results if time-based search failed
-                    initial_jobs['search_company'] = company
-                    company_jobs = initial_jobs[initial_jobs['company'].str.contains(company, case=False, na=False)]
-                    accuracy = len(company_jobs) / len(initial_jobs) * 100 if len(initial_jobs) > 0 else 0
-                    st.success(f"✅ {company}: {len(initial_jobs)} jobs (fallback, Accuracy: {accuracy:.1f}%)")
-                    all_jobs.append(initial_jobs)
+                total_jobs = len(combined_company_jobs)
+                task.update(f"✅ {company}: {total_jobs} jobs (time-based search)", 'success')
+                all_jobs.append(combined_company_jobs)
             else:
-                # Company has fewer jobs, use the simple single search result
+                # Fallback to initial results if time-based search failed
                 initial_jobs['search_company'] = company
+                task.add_jobs(company, initial_jobs, replace=True)
                 company_jobs = initial_jobs[initial_jobs['company'].str.contains(company, case=False, na=False)]
                 accuracy = len(company_jobs) / len(initial_jobs) * 100 if len(initial_jobs) > 0 else 0
-                st.success(f"✅ {company}: {len(initial_jobs)} jobs (simple search, Accuracy: {accuracy:.1f}%)")
+                task.update(f"✅ {company}: {len(initial_jobs)} jobs (fallback, Accuracy: {accuracy:.1f}%)", 'success')
                 all_jobs.append(initial_jobs)
-                
-        except Exception as e:
-            st.error(f"❌ Error scraping {company}: {e}")
-            continue
-        
-        progress_bar.progress((i + 1) / len(companies))
-    
-    progress_bar.empty()
-    status_text.empty()
+        elif len(initial_jobs) > 0:
+            # Company has fewer jobs, use the simple single search result
+            initial_jobs['search_company'] = company
+            company_jobs = initial_jobs[initial_jobs['company'].str.contains(company, case=False, na=False)]
+            accuracy = len(company_jobs) / len(initial_jobs) * 100
+            task.update(f"✅ {company}: {len(initial_jobs)} jobs (simple search, Accuracy: {accuracy:.1f}%)", 'success')
+            all_jobs.append(initial_jobs)
+        else:
+            task.update(f"✅ {company}: 0 jobs (simple search, Accuracy: 0.0%)", 'success')
     
     # Combine all results
-    if all_jobs:
-        combined_jobs = pd.concat(all_jobs, ignore_index=True)
-        
-        # Remove duplicates across all companies
-        total_before_dedup = len(combined_jobs)
-        combined_jobs = combined_jobs.drop_duplicates(subset=['job_url', 'title'], keep='first')
-        total_after_dedup = len(combined_jobs)
-        duplicates_removed = total_before_dedup - total_after_dedup
+    if all_jobs.rows:
+        task.update(status="Combining results...", progress=1.0)
+        total_after_dedup = all_jobs.rows
+        duplicates_removed = all_jobs.duplicates
+        total_before_dedup = total_after_dedup + duplicates_removed
         
         # Show compact summary
         if duplicates_removed > 0:
-            st.success(f"✅ **{total_after_dedup} unique jobs found** ({duplicates_removed} duplicates removed from {total_before_dedup} total)")
+            task.update(f"✅ **{total_after_dedup} unique jobs found** ({duplicates_removed} duplicates removed from {total_before_dedup} total)", 'success')
         else:
-            st.success(f"✅ **{total_after_dedup} unique jobs found** (no duplicates)")
-        
-        # Sort by date posted (newest first)
+            task.update(f"✅ **{total_after_dedup} unique jobs found** (no duplicates)", 'success')
+        
+        # Sorted by date posted (newest first)
+        combined_jobs = all_jobs.finish()
+        if isinstance(combined_jobs, SpilledJobs):
+            task.update(f"💾 Results exceeded {RESULT_MEMORY_LIMIT_MB} MB; descriptions stay on disk and load when a job is viewed", 'detail')
+            task.spilled = combined_jobs
+            combined_jobs = combined_jobs.to_pandas(exclude=['description'])
         combined_jobs['date_posted'] = pd.to_datetime(combined_jobs['date_posted'], errors='coerce')
-        combined_jobs = combined_jobs.sort_values('date_posted', ascending=False)
         
         return combined_jobs
     else:
         return pd.DataFrame()
 
+def show_scrape_task(task):
+    """Renders a background scrape: progress and partial results while it runs, the final results once done"""
+    messages, status, progress, done = task.snapshot()
+    
+    st.markdown(f"**🎯 Search:** {len(task.companies)} companies in {task.location} | {f'{task.hours_old}h old' if task.hours_old else 'All time'} | Searching all available jobs")
+    if not done:
+        st.progress(progress)
+        st.text(status)
+    for level, text in messages:
+        if level != 'detail':
+            getattr(st, level)(text)
+    details = [text for level, text in messages if level == 'detail']
+    if details:
+        with st.expander("📊 Detailed Progress", expanded=False):
+            for text in details:
+                st.write(text)
+    
+    if not done:
+        # Show what has been found so far, then poll for more
+        jobs = task.partial_jobs()
+        if len(jobs) > 0:
+            st.header("📋 Job Data")
+            st.caption(f"🔄 {len(jobs)} jobs found so far - the table updates as companies finish")
+            display_job_data_table(jobs)
+        time.sleep(SCRAPE_POLL_SECONDS)
+        st.rerun()
+    
+    # The scrape finished: hand its results to this session
+    st.session_state.scrape_task_collected = task.id
+    jobs = task.result if task.fingerprint is None else get_shared_datasets().get(task.fingerprint)
+    if jobs is None or len(jobs) == 0:
+        st.error("❌ No jobs found for any company")
+        return
+    
+    # Store jobs for pagination
+    jobs = publish_jobs(jobs, task.spilled)
+    
+    # Calculate average accuracy
+    accuracies = []
+    for company in task.companies:
+        company_jobs = jobs[jobs['search_company'] == company]
+        if len(company_jobs) > 0:
+            accurate_jobs = company_jobs[company_jobs['company'].str.contains(company, case=False, na=False)]
+            accuracy = len(accurate_jobs) / len(company_jobs) * 100
+            accuracies.append(accuracy)
+    avg_accuracy = sum(accuracies) / len(accuracies) if accuracies else 0
+    
+    # Create collapsible search summary
+    with st.expander("📊 Search Summary", expanded=False):
+        st.success(f"**📊 Found {len(jobs)} jobs** from {len(jobs['search_company'].unique())} companies across {len(jobs['location'].unique())} locations (Accuracy: {avg_accuracy:.1f}%)")
+    
+    # Show main result briefly
+    st.success(f"✅ **Search Complete: {len(jobs)} jobs found**")
+    
+    # Job data section with pagination
+    st.header("📋 Job Data")
+    display_job_data_table(jobs, fingerprint=st.session_state.jobs_fingerprint)
+
+def get_active_scrape_task():
+    """The background scrape this page follows (from the session or the page URL) until its results are collected"""
+    task_id = st.session_state.get('scrape_task_id') or st.query_params.get('scrape')
+    if not task_id or st.session_state.get('scrape_task_collected') == task_id:
+        return None
+    return get_scrape_tasks().get(task_id)
+
 def format_salary(row):
     """Format salary information from multiple columns"""
     if pd.notna(row.get('min_amount')) and pd.notna(row.get('max_amount')):
@@ -438,7 +617,85 @@ def truncate_title(title, max_length=60):
         return title[:max_length] + "..."
     return title
 
-def display_job_data_table(jobs_df, jobs_per_page=15):
+def format_salary_column(jobs_df):
+    """format_salary for every row at once"""
+    empty = pd.Series(float('nan'), index=jobs_df.index)
+    min_amount = pd.to_numeric(jobs_df.get('min_amount', empty), errors='coerce')
+    max_amount = pd.to_numeric(jobs_df.get('max_amount', empty), errors='coerce')
+    min_str = "&#36;" + min_amount.map('{:,.0f}'.format, na_action='ignore')
+    max_str = "&#36;" + max_amount.map('{:,.0f}'.format, na_action='ignore')
+    salary = pd.Series("Not specified", index=jobs_df.index)
+    salary = salary.mask(max_amount.notna(), "Up to " + max_str)
+    salary = salary.mask(min_amount.notna(), min_str + "+")
+    return salary.mask(min_amount.notna() & max_amount.notna(), min_str + " - " + max_str)
+
+@st.cache_resource(max_entries=8)
+def prepare_jobs(fingerprint, _jobs_df):
+    """
+    Display columns and filter options for one result set, computed once per result fingerprint
+    The returned DataFrame is shared between reruns and sessions and must not be modified in place
+    """
+    jobs = _jobs_df.reset_index(drop=True).copy()
+    # Position of each row in the prepared frame, kept through search and AI filtering to look rows up in the facet index
+    jobs['row_position'] = np.arange(len(jobs))
+    jobs['date_posted_dt'] = pd.to_datetime(jobs['date_posted'], errors='coerce')
+    jobs['date_str'] = jobs['date_posted_dt'].dt.strftime('%Y-%m-%d').fillna('N/A')
+    jobs['formatted_salary'] = format_salary_column(jobs)
+    titles = jobs['title'].fillna('').astype(str)
+    jobs['truncated_title'] = titles.where(titles.str.len() <= 60, titles.str[:60] + "...")
+    
+    return jobs, FacetIndex(jobs)
+
+# Widget keys of the dashboard filters, by facet
+FACET_FILTER_KEYS = {
+    'company': 'company_filter',
+    'location': 'location_filter',
+    'date_posted': 'date_filter',
+    'salary': 'salary_filter',
+}
+
+def facet_selectbox(label, facet, facets, selections, base, reset_filters):
+    """Filter selectbox whose options show how many jobs each value would keep"""
+    key = FACET_FILTER_KEYS[facet]
+    options = ['All'] + facets.values(facet)
+    counts = facets.counts(facet, selections, base)
+    current = st.session_state.get(key, 'All')
+    return st.selectbox(
+        label, options,
+        index=0 if reset_filters or current not in options else options.index(current),
+        format_func=lambda value: value if value == 'All' else f"{value} ({counts.get(value, 0)})",
+        key=key
+    )
+
+@st.cache_data(max_entries=4)
+def export_jobs_csv(fingerprint, _jobs_df):
+    """CSV export of a prepared result set, built once per result fingerprint"""
+    csv_columns = ['title', 'company', 'location', 'date_str', 'formatted_salary', 
+                  'job_type', 'description', 'job_url_direct']
+    csv_export = _jobs_df.reindex(columns=csv_columns)
+    csv_export.columns = ['Job Title', 'Company', 'Location', 'Date Posted', 'Salary', 
+                         'Job Type', 'Description', 'Job URL']
+    return csv_export.to_csv(index=False).encode('utf-8')
+
+def job_description(job):
+    """
+    Description of a table row; results that spilled to disk read it from there, partial results of a running
+    search from the job store, deferred ones are fetched
+    """
+    description = job.get('description') if 'description' in job else None
+    if not isinstance(description, str) or not description:
+        spilled = st.session_state.get('jobs_spill')
+        description = spilled.lookup(job['id'], 'description') if spilled is not None else None
+    if not description and 'description' not in job:
+        description = get_job_store().description(job['id'])
+    if not description and LAZY_DESCRIPTIONS:
+        description = get_description_fetcher().get(job)
+    return description or 'No description available'
+
+def display_job_data_table(jobs_df, jobs_per_page=15, fingerprint=None):
+    # Everything derived from the full result set is cached by its fingerprint, so page flips only slice
+    fingerprint = fingerprint or result_fingerprint(jobs_df)
+    jobs_df, facets = prepare_jobs(fingerprint, jobs_df)
     total_jobs = len(jobs_df)
     
     # Initialize session state for current page
@@ -516,39 +773,25 @@ def display_job_data_table(jobs_df, jobs_per_page=15):
         
         # Use a reset flag for all filters
         reset_filters = st.session_state.get('clear_filters_flag', False)
+        
+        # Facet counts reflect the search query and the other filters' current selections
+        search_base = None
+        if search_query and search_query.strip():
+            search_hits = smart_job_search(jobs_df, search_query, fingerprint=fingerprint)
+            search_base = np.zeros(total_jobs, dtype=bool)
+            search_base[search_hits['row_position'].to_numpy()] = True
+        current_selections = {} if reset_filters else {
+            facet: st.session_state.get(key, 'All') for facet, key in FACET_FILTER_KEYS.items()
+        }
 
         with filter_col1:
-            # Handle NaN values in company column
-            company_values = jobs_df['company'].fillna('Unknown').unique().tolist()
-            company_options = ['All'] + sorted([str(c) for c in company_values])
-            selected_company = st.selectbox(
-                "Company", company_options,
-                index=0 if reset_filters else company_options.index(st.session_state.get('company_filter', 'All')),
-                key="company_filter"
-            )
+            selected_company = facet_selectbox("Company", 'company', facets, current_selections, search_base, reset_filters)
         with filter_col2:
-            # Handle NaN values in location column
-            location_values = jobs_df['location'].fillna('Unknown').unique().tolist()
-            location_options = ['All'] + sorted([str(l) for l in location_values])
-            selected_location = st.selectbox(
-                "Location", location_options,
-                index=0 if reset_filters else location_options.index(st.session_state.get('location_filter', 'All')),
-                key="location_filter"
-            )
+            selected_location = facet_selectbox("Location", 'location', facets, current_selections, search_base, reset_filters)
         with filter_col3:
-            date_options = ['All', 'Last 7 days', 'Last 14 days', 'Last 30 days']
-            selected_date = st.selectbox(
-                "Date Posted", date_options,
-                index=0 if reset_filters else date_options.index(st.session_state.get('date_filter', 'All')),
-                key="date_filter"
-            )
+            selected_date = facet_selectbox("Date Posted", 'date_posted', facets, current_selections, search_base, reset_filters)
         with filter_col4:
-            salary_options = ['All', 'Has Salary', 'No Salary Specified']
-            selected_salary = st.selectbox(
-                "Salary", salary_options,
-                index=0 if reset_filters else salary_options.index(st.session_state.get('salary_filter', 'All')),
-                key="salary_filter"
-            )
+            selected_salary = facet_selectbox("Salary", 'salary', facets, current_selections, search_base, reset_filters)
         # Remove Clear Filters from filter_col5
         # with filter_col5:
         #     if st.button("Clear Filters", key="clear_filters"):
@@ -566,42 +809,26 @@ def display_job_data_table(jobs_df, jobs_per_page=15):
                 st.rerun()
         
         with filter_action_col2:
-            # Prepare CSV data for download (before filtering for full dataset option)
-            csv_data = jobs_df.copy()
-            # Add formatted salary column for CSV
-            csv_data['formatted_salary'] = csv_data.apply(format_salary, axis=1)
-            # Format date for CSV
-            csv_data['date_posted_formatted'] = pd.to_datetime(csv_data['date_posted']).dt.strftime('%Y-%m-%d')
-            
-            # Select relevant columns for CSV export
-            csv_columns = ['title', 'company', 'location', 'date_posted_formatted', 'formatted_salary', 
-                          'job_type', 'description', 'job_url_direct']
-            csv_export = csv_data[csv_columns].copy()
-            csv_export.columns = ['Job Title', 'Company', 'Location', 'Date Posted', 'Salary', 
-                                 'Job Type', 'Description', 'Job URL']
-            
-            # Convert to CSV
-            csv_string = csv_export.to_csv(index=False)
-            
-            # Generate filename with timestamp
-            from datetime import datetime
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"jobs_export_{timestamp}.csv"
-            
-            st.download_button(
-                label="📥 Download CSV",
-                data=csv_string,
-                file_name=filename,
-                mime="text/csv",
-                help="Download all jobs as CSV file"
-            )
+            # The CSV is only serialized once the user asks for it (full dataset, before filtering)
+            if st.session_state.get('csv_export_fingerprint') == fingerprint:
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                st.download_button(
+                    label="📥 Download CSV",
+                    data=export_jobs_csv(fingerprint, jobs_df),
+                    file_name=f"jobs_export_{timestamp}.csv",
+                    mime="text/csv",
+                    help="Download all jobs as CSV file"
+                )
+            elif st.button("📥 Export CSV", key="export_csv", help="Prepare all jobs as a CSV file"):
+                st.session_state.csv_export_fingerprint = fingerprint
+                st.rerun()
         
-        # Apply filters
-        filtered_df = jobs_df.copy()
+        # Apply filters (jobs_df is the shared prepared frame, filters only build new frames from it)
+        filtered_df = jobs_df
         
         # Apply smart search first if query exists
         if search_query and search_query.strip():
-            filtered_df = smart_job_search(filtered_df, search_query)
+            filtered_df = search_hits
             if len(filtered_df) == 0:
                 st.warning(f"No jobs found matching '{search_query}'. Try different keywords or check spelling.")
                 return
@@ -633,40 +860,22 @@ def display_job_data_table(jobs_df, jobs_per_page=15):
                 else:
                     st.info(f"🤖 AI filtered {len(filtered_df)} relevant jobs based on: '{ai_target}'")
 
-        if selected_company != 'All':
-            filtered_df = filtered_df[filtered_df['company'] == selected_company]
-        
-        if selected_location != 'All':
-            filtered_df = filtered_df[filtered_df['location'] == selected_location]
-        
-        if selected_date != 'All':
-            from datetime import datetime, timedelta
-            today = datetime.now()
-            if selected_date == 'Last 7 days':
-                cutoff = today - timedelta(days=7)
-            elif selected_date == 'Last 14 days':
-                cutoff = today - timedelta(days=14)
-            elif selected_date == 'Last 30 days':
-                cutoff = today - timedelta(days=30)
-            
-            filtered_df['date_posted_dt'] = pd.to_datetime(filtered_df['date_posted'])
-            filtered_df = filtered_df[filtered_df['date_posted_dt'] >= cutoff]
-            filtered_df = filtered_df.drop('date_posted_dt', axis=1)
-        
-        if selected_salary == 'Has Salary':
-            filtered_df = filtered_df[
-                (pd.notna(filtered_df['min_amount']) | pd.notna(filtered_df['max_amount']))
-            ]
-        elif selected_salary == 'No Salary Specified':
-            filtered_df = filtered_df[
-                (pd.isna(filtered_df['min_amount']) & pd.isna(filtered_df['max_amount']))
-            ]
+        # Combined facet filters are one boolean mask over the prepared rows
+        facet_mask = facets.mask({
+            'company': selected_company,
+            'location': selected_location,
+            'date_posted': selected_date,
+            'salary': selected_salary,
+        })
+        filtered_df = filtered_df[facet_mask[filtered_df['row_position'].to_numpy()]]
         
         # Apply sorting
         if not filtered_df.empty:
             if st.session_state.sort_column in filtered_df.columns:
+                # Dates are sorted by their parsed value, which may be stored as strings
+                sort_by = 'date_posted_dt' if st.session_state.sort_column == 'date_posted' else st.session_state.sort_column
                 filtered_df = filtered_df.sort_values(
-                    by=st.session_state.sort_column, 
+                    by=sort_by, 
                     ascending=st.session_state.sort_ascending
                 ).reset_index(drop=True)
         
@@ -713,11 +922,11 @@ def display_job_data_table(jobs_df, jobs_per_page=15):
         
         start_idx = (st.session_state.current_page - 1) * jobs_per_page
         end_idx = min(start_idx + jobs_per_page, total_filtered_jobs)
-        page_data = filtered_df.iloc[start_idx:end_idx].copy().reset_index(drop=True)
-        
-        # Format data for display
-        page_data['formatted_salary'] = page_data.apply(format_salary, axis=1)
-        page_data['truncated_title'] = [truncate_title(title) for title in page_data['title']]
+        # Display columns (title, date, salary) were formatted once in prepare_jobs
+        page_data = filtered_df.iloc[start_idx:end_idx].reset_index(drop=True)
+        if LAZY_DESCRIPTIONS:
+            # Fetch the visible jobs' descriptions in the background, ready when one is viewed
+            get_description_fetcher().prefetch(page_data.reindex(columns=['id', 'site', 'job_url', 'description']).to_dict('records'))
         
         # Add custom CSS for job row borders and compactness
         st.markdown("""
@@ -807,8 +1016,7 @@ def display_job_data_table(jobs_df, jobs_per_page=15):
                 cols[1].write(job['truncated_title'])
                 cols[2].write(job['company'])
                 cols[3].write(job['location'])
-                date_str = pd.to_datetime(job['date_posted']).strftime('%Y-%m-%d') if pd.notna(job['date_posted']) else 'N/A'
-                cols[4].write(date_str)
+                cols[4].write(job['date_str'])
                 cols[5].markdown(f"<span style='font-family: inherit;'>{job['formatted_salary']}</span>", unsafe_allow_html=True)
             else:
                 # Normal table without AI scores
@@ -816,8 +1024,7 @@ def display_job_data_table(jobs_df, jobs_per_page=15):
                 cols[0].write(job['truncated_title'])
                 cols[1].write(job['company'])
                 cols[2].write(job['location'])
-                date_str = pd.to_datetime(job['date_posted']).strftime('%Y-%m-%d') if pd.notna(job['date_posted']) else 'N/A'
-                cols[3].write(date_str)
+                cols[3].write(job['date_str'])
                 cols[4].markdown(f"<span style='font-family: inherit;'>{job['formatted_salary']}</span>", unsafe_allow_html=True)
             
             # Check if this job is currently selected
@@ -837,14 +1044,19 @@ def display_job_data_table(jobs_df, jobs_per_page=15):
                 # Normal button
                 if cols[-1].button("View", key=f"view_{start_idx + idx}"):
                     # Include AI data in selected job if available
+                    description = job_description(job)
+                    salary = job['formatted_salary']
+                    if LAZY_DESCRIPTIONS and salary == "Not specified":
+                        # Deferred descriptions were not searched for a salary while scraping
+                        salary = format_salary(get_description_fetcher().fields(job, description))
                     selected_job_data = {
                         'title': job['title'],
                         'company': job['company'],
                         'location': job['location'],
                         'date_posted': job['date_posted'],
                         'job_type': job.get('job_type', 'Not specified'),
-                        'salary': job['formatted_salary'],
-                        'description': job.get('description', 'No description available'),
+                        'salary': salary,
+                        'description': description,
                         'job_url': job.get('job_url_direct', None)
                     }
                     
@@ -1059,6 +1271,9 @@ def main():
         
         # Search button
         search_button = st.button("🔍 Start Search", type="primary")
+        
+        # Reload previously scraped jobs from the job store instead of scraping again
+        load_button = st.button("📂 Load Saved Jobs", help="Show jobs already saved for these companies and location without scraping")
     
     # Main content area
     if search_button:
@@ -1080,45 +1295,41 @@ def main():
         # Parse companies
         companies = [company.strip() for company in companies_input.split(',') if company.strip()]
         
-        # Display search summary (compact)
-        st.markdown(f"**🎯 Search:** {len(companies)} companies in {location} | {f'{hours_old}h old' if hours_old else 'All time'} | Searching all available jobs")
-        
-        # Start scraping with progress indicator
-        with st.spinner("🔍 Scraping jobs..."):
-            jobs = scrape_multiple_companies(companies, location, hours_old, results_wanted)
+        # Scrape in the background; the page follows the task by id, also stored in the URL to survive a refresh
+        task = start_scrape_task(companies, location, hours_old, results_wanted)
+        st.session_state.scrape_task_id = task.id
+        st.query_params['scrape'] = task.id
+    
+    active_task = None if load_button else get_active_scrape_task()
+    if active_task is not None:
+        show_scrape_task(active_task)
+    
+    elif load_button:
+        # Stop following any background scrape; its results stay in the job store
+        st.session_state.pop('scrape_task_id', None)
+        st.query_params.pop('scrape', None)
+        st.session_state.current_page = 1
+        st.session_state.selected_job = None
         
+        companies = [company.strip() for company in companies_input.split(',') if company.strip()]
+        jobs = get_job_store().query(
+            company_contains=companies or None,
+            location=location.strip() or None,
+            hours_old=hours_old,
+        )
         if len(jobs) == 0:
-            st.error("❌ No jobs found for any company")
+            st.error("❌ No saved jobs match these companies and location. Run a search first.")
             return
         
-        # Store jobs in session state for pagination
-        st.session_state.jobs_data = jobs
-        
-        # Calculate average accuracy
-        accuracies = []
-        for company in companies:
-            company_jobs = jobs[jobs['search_company'] == company]
-            if len(company_jobs) > 0:
-                accurate_jobs = company_jobs[company_jobs['company'].str.contains(company, case=False, na=False)]
-                accuracy = len(accurate_jobs) / len(company_jobs) * 100
-                accuracies.append(accuracy)
-        avg_accuracy = sum(accuracies) / len(accuracies) if accuracies else 0
-        
-        # Create collapsible search summary
-        with st.expander("📊 Search Summary", expanded=False):
-            st.success(f"**📊 Found {len(jobs)} jobs** from {len(jobs['search_company'].unique())} companies across {len(jobs['location'].unique())} locations (Accuracy: {avg_accuracy:.1f}%)")
-        
-        # Show main result briefly
-        st.success(f"✅ **Search Complete: {len(jobs)} jobs found**")
-        
-        # Job data section with pagination
+        jobs = publish_jobs(jobs)
+        st.success(f"✅ **Loaded {len(jobs)} saved jobs** from the job store")
         st.header("📋 Job Data")
-        display_job_data_table(jobs)
+        display_job_data_table(jobs, fingerprint=st.session_state.jobs_fingerprint)
     
-    elif 'jobs_data' in st.session_state:
+    elif session_jobs() is not None:
         # Show existing data if available
         st.header("📋 Job Data")
-        display_job_data_table(st.session_state.jobs_data)
+        display_job_data_table(session_jobs(), fingerprint=st.session_state.get('jobs_fingerprint'))
     
     else:
         # Welcome message
@@ -0,0 +1,116 @@
+import importlib
+import threading
+import time
+from datetime import date
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("flask")
+
+
+@pytest.fixture(scope="module")
+def app(tmp_path_factory):
+    # the app opens its job store and uploads folder when it is imported
+    directory = tmp_path_factory.mktemp("app")
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(directory)
+        mp.setenv("JOB_STORE_PATH", str(directory / "jobs.db"))
+        yield importlib.import_module("app")
+
+
+@pytest.fixture
+def client(app):
+    app.scrape_job_registry.clear()
+    app.pending_scrape_jobs.clear()
+    return app.app.test_client()
+
+
+def jobs(companies):
+    return pd.DataFrame(
+        [
+            {
+                "id": f"in-{i}",
+                "site": "indeed",
+                "title": f"Engineer {i}",
+                "company": company,
+                "location": "Seattle, WA",
+                "search_company": company,
+                "date_posted": date(2025, 1, 2),
+                "job_url": f"https://example.com/{i}",
+                "description": f"Role {i}",
+            }
+            for i, company in enumerate(companies * 3)
+        ]
+    )
+
+
+def submit(client, companies):
+    form = {"companies": companies, "location": "Seattle, WA", "hours_old": "24"}
+    return client.post("/scrape", data=form)
+
+
+def wait_for(client, job_id, status):
+    for _ in range(500):
+        body = client.get(f"/status/{job_id}").get_json()
+        if body["status"] == status:
+            return body
+        time.sleep(0.01)
+    raise AssertionError(f"job {job_id} is still {body['status']}")
+
+
+def test_scrape_is_queued_coalesced_and_paged(app, client, monkeypatch):
+    release = threading.Event()
+    calls = []
+
+    def scrape(companies, location, hours_old, results_wanted, on_result=None):
+        calls.append(companies)
+        release.wait(5)
+        for index in range(len(companies)):
+            on_result(index, {}, None, None)
+        return jobs(companies)
+
+    monkeypatch.setattr(app, "scrape_multiple_companies", scrape)
+    first = submit(client, "Acme, Globex")
+    assert first.status_code == 202
+    job_id = first.get_json()["job_id"]
+    assert first.get_json()["coalesced"] is False
+    assert first.get_json()["status_url"] == f"/status/{job_id}"
+
+    second = submit(client, "globex,acme").get_json()
+    assert (second["job_id"], second["coalesced"]) == (job_id, True)
+    running = wait_for(client, job_id, "running")
+    assert running["requests"] == 2
+    assert client.get(f"/results/{job_id}").status_code == 409
+
+    release.set()
+    finished = wait_for(client, job_id, "finished")
+    assert calls == [["Acme", "Globex"]]
+    assert finished["progress"] == {"completed_companies": 2, "total_companies": 2}
+    assert finished["results"]["total_jobs"] == 6
+    assert finished["results"]["company_breakdown"] == {"Acme": 3, "Globex": 3}
+
+    page = client.get(f"/results/{job_id}?page=2&per_page=4").get_json()
+    assert (page["total_jobs"], page["total_pages"]) == (6, 2)
+    assert [job["id"] for job in page["jobs"]] == ["in-4", "in-5"]
+    assert "description" not in page["jobs"][0]
+
+    # once finished, the same request queues a new scrape
+    again = submit(client, "Acme, Globex").get_json()
+    assert again["coalesced"] is False
+    wait_for(client, again["job_id"], "finished")
+
+
+def test_failed_and_unknown_jobs(app, client, monkeypatch):
+    def scrape(companies, location, hours_old, results_wanted, on_result=None):
+        return pd.DataFrame()
+
+    monkeypatch.setattr(app, "scrape_multiple_companies", scrape)
+    job_id = submit(client, "Acme").get_json()["job_id"]
+    failed = wait_for(client, job_id, "failed")
+    assert failed["error"] == "No jobs found for any company"
+    results = client.get(f"/results/{job_id}")
+    assert results.status_code == 409
+    assert results.get_json()["details"] == "No jobs found for any company"
+    assert client.get("/status/missing").status_code == 404
+    assert client.get("/results/missing").status_code == 404
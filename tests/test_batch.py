@@ -0,0 +1,84 @@
+import time
+from unittest.mock import patch
+
+import pandas as pd
+
+from jobspy import util
+from jobspy.batch import scrape_jobs_batch
+
+
+def job(job_id, title="Data Engineer"):
+    return {
+        "id": job_id,
+        "site": "indeed",
+        "title": title,
+        "company": "Acme",
+        "location": "Seattle, WA",
+        "job_url": f"https://www.indeed.com/viewjob?jk={job_id}",
+        "description": "Build pipelines",
+    }
+
+
+def fake_scrape_jobs(delays):
+    def scrape_jobs(search_term, **kwargs):
+        time.sleep(delays[search_term])
+        return pd.DataFrame([job(f"in-{search_term}"), job("in-shared", "Shared role")])
+
+    return scrape_jobs
+
+
+def test_duplicates_resolve_in_query_order():
+    # the last query finishes first; the shared job must still be kept for query 0
+    delays = {"a": 0.2, "b": 0.1, "c": 0.0}
+    reported = []
+    with patch("jobspy.scrape_jobs", fake_scrape_jobs(delays)):
+        jobs = scrape_jobs_batch(
+            [{"search_term": term} for term in delays],
+            max_workers=3,
+            on_result=lambda index, query, jobs, error: reported.append(index),
+        )
+    assert reported == [0, 1, 2]
+    shared = jobs[jobs["id"] == "in-shared"]
+    assert shared["query_index"].tolist() == [0]
+    assert sorted(jobs["id"]) == ["in-a", "in-b", "in-c", "in-shared"]
+
+
+def test_without_dedupe_results_are_reported_as_they_finish():
+    delays = {"a": 0.2, "b": 0.0}
+    reported = []
+    with patch("jobspy.scrape_jobs", fake_scrape_jobs(delays)):
+        jobs = scrape_jobs_batch(
+            [{"search_term": term} for term in delays],
+            max_workers=2,
+            dedupe=False,
+            on_result=lambda index, query, jobs, error: reported.append(index),
+        )
+    assert reported == [1, 0]
+    assert len(jobs) == 4
+
+
+def test_held_rate_limits_are_released_by_their_holder_only():
+    host = "apis.indeed.com"
+    first = util.hold_host_rate_limit(host, 5)
+    second = util.hold_host_rate_limit(host, 2)
+    try:
+        util.release_host_rate_limit(host, first)
+        assert util._held_rate_limiters[host] == [second]
+    finally:
+        util.release_host_rate_limit(host, second)
+    assert host not in util._held_rate_limiters
+
+
+def test_batch_releases_its_rate_limits():
+    seen = []
+
+    def scrape_jobs(**kwargs):
+        seen.append(list(util._held_rate_limiters.get("apis.indeed.com", [])))
+        return pd.DataFrame()
+
+    with patch("jobspy.scrape_jobs", scrape_jobs):
+        scrape_jobs_batch(
+            [{"site_name": "indeed", "search_term": "x"}], requests_per_second=3
+        )
+    assert len(seen[0]) == 1
+    assert "apis.indeed.com" not in util._held_rate_limiters
@@ -0,0 +1,47 @@
+import pandas as pd
+
+from jobspy.compact import compact_jobs
+
+
+def jobs(count=200):
+    return pd.DataFrame(
+        {
+            "id": [f"in-{i}" for i in range(count)],
+            "site": "indeed",
+            "company": ["Acme" if i % 2 else "Globex" for i in range(count)],
+            "company_description": [
+                "A long employer description " * 20 if i % 2 else None
+                for i in range(count)
+            ],
+            "min_amount": [float(i) if i % 3 else None for i in range(count)],
+            "company_reviews_count": [10.0] * count,
+            "is_remote": [bool(i % 2) for i in range(count)],
+        }
+    )
+
+
+def test_values_are_unchanged():
+    original = jobs()
+    compact = compact_jobs(original)
+    assert isinstance(compact["company"].dtype, pd.CategoricalDtype)
+    assert str(compact["min_amount"].dtype) == "Float64"
+    assert str(compact["company_reviews_count"].dtype) == "Int64"
+    assert str(compact["is_remote"].dtype) == "boolean"
+    for column in original.columns:
+        expected = original[column].astype(object).where(original[column].notna(), None)
+        actual = compact[column].astype(object).where(compact[column].notna(), None)
+        assert actual.tolist() == expected.tolist(), column
+
+
+def test_reports_memory_saved():
+    compact = compact_jobs(jobs())
+    usage = compact.attrs["memory_usage"]
+    assert usage["after"] < usage["before"]
+    assert "company_description" in usage["columns"]
+    assert "id" not in usage["columns"]
+
+
+def test_unique_columns_stay_strings():
+    frame = jobs(10).assign(company=[f"Company {i}" for i in range(10)])
+    assert not isinstance(compact_jobs(frame)["company"].dtype, pd.CategoricalDtype)
+    assert compact_jobs(pd.DataFrame()).attrs["memory_usage"]["before"] == 0
@@ -0,0 +1,76 @@
+import tracemalloc
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from jobspy.datasets import SharedDatasets
+
+
+def jobs(count=200, prefix="job"):
+    return pd.DataFrame(
+        {
+            "id": [f"{prefix}-{i}" for i in range(count)],
+            "title": "Engineer",
+            "description": ["x" * 2000 + str(i) for i in range(count)],
+            "min_amount": [float(i) for i in range(count)],
+            "date_posted": date(2025, 1, 1),
+        }
+    )
+
+
+def test_put_get_round_trip(tmp_path):
+    datasets = SharedDatasets(str(tmp_path))
+    original = jobs()
+    assert datasets.put("a", original)
+    assert "a" in datasets
+    shared = datasets.get("a")
+    assert (
+        shared["description"].astype(str).tolist() == original["description"].tolist()
+    )
+    assert datasets.get("a") is shared
+    assert datasets.get("missing") is None
+
+
+def test_refcounts_and_release(tmp_path):
+    datasets = SharedDatasets(str(tmp_path))
+    datasets.put("a", jobs())
+    datasets.acquire("a", "session-1")
+    datasets.acquire("a", "session-2")
+    assert datasets.refcount("a") == 2
+    datasets.release("a", "session-1")
+    assert datasets.refcount("a") == 1
+    datasets.release("a", "session-2")
+    assert datasets.refcount("a") == 0
+    assert "a" not in datasets.frames
+
+
+def test_eviction_keeps_held_and_new_datasets(tmp_path):
+    datasets = SharedDatasets(str(tmp_path), max_datasets=1)
+    datasets.put("held", jobs(prefix="held"))
+    datasets.acquire("held", "session")
+    datasets.put("new", jobs(prefix="new"))
+    assert "held" in datasets and "new" in datasets
+    datasets.release("held", "session")
+    datasets.put("newer", jobs(prefix="newer"))
+    assert "held" not in datasets
+    assert "newer" in datasets
+
+
+def test_arrow_strings_stay_in_the_memory_map(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    datasets = SharedDatasets(str(tmp_path))
+    original = jobs(count=2000)
+    datasets.put("a", original)
+    tracemalloc.start()
+    allocated = pa.total_allocated_bytes()
+    try:
+        shared = datasets.get("a")
+        # neither Python strings nor Arrow buffers hold a copy of the ~4 MB of descriptions
+        python_bytes = tracemalloc.get_traced_memory()[0]
+        arrow_bytes = pa.total_allocated_bytes() - allocated
+    finally:
+        tracemalloc.stop()
+    assert isinstance(shared["description"].dtype, pd.ArrowDtype)
+    assert python_bytes + arrow_bytes < 1_000_000
+    assert shared["description"].str.len().min() >= 2000
@@ -0,0 +1,49 @@
+import time
+from unittest.mock import patch
+
+import pytest
+
+import jobspy
+from jobspy.model import JobResponse, Scraper
+
+
+def slow_scrape(self, scraper_input):
+    time.sleep(0.5)
+    return JobResponse(jobs=[])
+
+
+@pytest.fixture
+def slow_indeed():
+    with patch.object(jobspy, "DEADLINE_GRACE", 0.05), patch.object(
+        jobspy.Indeed, "scrape", slow_scrape
+    ), patch.object(Scraper, "pause", lambda self, seconds: True):
+        yield
+
+
+def test_deadline_overrun_returns_partial_result(slow_indeed):
+    jobs = jobspy.scrape_jobs(
+        site_name="indeed", search_term="x", timeout=0.05, on_error="partial"
+    )
+    assert jobs.attrs["site_status"]["indeed"]["status"] == "timeout"
+
+
+def test_deadline_overrun_raises_without_partial(slow_indeed):
+    with pytest.raises(TimeoutError):
+        jobspy.scrape_jobs(site_name="indeed", search_term="y", timeout=0.05)
+
+
+def test_futures_timeout_is_caught_on_every_python():
+    # on Python 3.10 as_completed raises this class, which is not the builtin TimeoutError
+    class Py310FuturesTimeout(Exception):
+        pass
+
+    def as_completed(futures, timeout=None):
+        raise Py310FuturesTimeout()
+
+    with patch.object(jobspy, "FuturesTimeoutError", Py310FuturesTimeout), patch.object(
+        jobspy, "as_completed", as_completed
+    ), patch.object(jobspy.Indeed, "scrape", slow_scrape):
+        jobs = jobspy.scrape_jobs(
+            site_name="indeed", search_term="z", timeout=5, on_error="partial"
+        )
+    assert jobs.attrs["site_status"]["indeed"]["status"] == "timeout"
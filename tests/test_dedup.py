@@ -0,0 +1,107 @@
+import pandas as pd
+
+from jobspy.dedup import (
+    TOKEN_HASH_CACHE_SIZE,
+    JobDeduplicator,
+    _token_hash,
+    canonicalize_url,
+    deduplicate_jobs,
+    simhash,
+)
+
+DESCRIPTION = (
+    "We are hiring a data engineer to build batch and streaming pipelines on Spark and "
+    "Kafka, own our warehouse models, and partner with analysts on metrics and dashboards."
+)
+
+
+def values(column):
+    return [None if pd.isna(value) else value for value in column]
+
+
+def job(
+    job_id,
+    site,
+    title="Data Engineer",
+    company="Acme",
+    location="Seattle, WA",
+    **fields,
+):
+    return {
+        "id": job_id,
+        "site": site,
+        "title": title,
+        "company": company,
+        "location": location,
+        **fields,
+    }
+
+
+def test_canonicalize_url_drops_tracking():
+    assert canonicalize_url(
+        "https://WWW.Acme.com/jobs/1/?utm_source=x&b=2&a=1&trk=y#apply"
+    ) == ("https://acme.com/jobs/1?a=1&b=2")
+    assert canonicalize_url(None) is None
+
+
+def test_simhash_is_stable_under_small_edits():
+    edited = DESCRIPTION.replace("dashboards", "dashboards!")
+    assert (simhash(DESCRIPTION) ^ simhash(edited)).bit_count() <= 3
+    assert simhash(None) is None
+
+
+def test_reasons():
+    deduplicator = JobDeduplicator()
+    assert deduplicator.add(
+        job("in-1", "indeed", job_url_direct="https://acme.com/jobs/1")
+    ) == (None, None)
+    assert deduplicator.add(job("in-1", "indeed")) == ("in-1", "id")
+    assert deduplicator.add(
+        job(
+            "li-1",
+            "linkedin",
+            title="Analyst",
+            job_url_direct="https://www.acme.com/jobs/1?utm_source=li",
+        )
+    ) == ("in-1", "url")
+    assert deduplicator.add(job("gd-1", "glassdoor", title="Data  engineer")) == (
+        "in-1",
+        "key",
+    )
+
+
+def test_same_site_postings_are_kept_by_default():
+    deduplicator = JobDeduplicator()
+    deduplicator.add(job("in-1", "indeed"))
+    assert deduplicator.add(job("in-2", "indeed")) == (None, None)
+    assert JobDeduplicator(cross_site_only=False).add_frame(
+        pd.DataFrame([job("in-1", "indeed"), job("in-2", "indeed")])
+    )["duplicate_of"].pipe(values) == [None, "in-1"]
+
+
+def test_similar_descriptions_across_sites():
+    jobs = pd.DataFrame(
+        [
+            job(
+                "in-1", "indeed", title="Senior Data Engineer", description=DESCRIPTION
+            ),
+            job(
+                "li-1",
+                "linkedin",
+                title="Data Engineer Senior",
+                location="",
+                description=DESCRIPTION.upper(),
+            ),
+            job("li-2", "linkedin", title="Accountant", description=DESCRIPTION),
+        ]
+    )
+    marked = deduplicate_jobs(jobs, drop=False)
+    assert values(marked["duplicate_of"]) == [None, "in-1", None]
+    assert values(marked["duplicate_reason"]) == [None, "description", None]
+    assert deduplicate_jobs(jobs)["id"].tolist() == ["in-1", "li-2"]
+
+
+def test_token_hash_cache_is_bounded():
+    for i in range(TOKEN_HASH_CACHE_SIZE + 10):
+        _token_hash(f"token{i}")
+    assert _token_hash.cache_info().currsize <= TOKEN_HASH_CACHE_SIZE
@@ -0,0 +1,139 @@
+from unittest.mock import patch
+
+import pytest
+
+from benchmarks.fixtures import JobBoardFixtures, patched_network
+from jobspy import scrape_jobs
+from jobspy.descriptions import DescriptionFetcher
+from jobspy.model import Scraper, ScraperInput, Site
+from jobspy.ziprecruiter import ZipRecruiter
+
+
+@pytest.fixture(scope="module")
+def fixtures():
+    return JobBoardFixtures(jobs_per_site=40)
+
+
+@pytest.fixture
+def network(fixtures):
+    with patched_network(fixtures), patch.object(
+        Scraper, "pause", lambda self, seconds: True
+    ):
+        yield
+
+
+def scrape(site, fetch_descriptions):
+    return scrape_jobs(
+        site_name=[site],
+        search_term="engineer",
+        location="Seattle, WA",
+        # a whole page, as Glassdoor keeps the jobs it processed first
+        results_wanted=30,
+        fetch_descriptions=fetch_descriptions,
+        verbose=0,
+    )
+
+
+@pytest.mark.parametrize("site", ["indeed", "glassdoor"])
+def test_fetched_descriptions_match_scraped_ones(network, site):
+    full = scrape(site, True).set_index("id")
+    lazy = scrape(site, False)
+    assert lazy["description"].isna().all()
+    fetcher = DescriptionFetcher()
+    try:
+        fetcher.prefetch(lazy.head(3))
+        for _, job in lazy.iterrows():
+            assert fetcher.get(job) == full.loc[job["id"], "description"]
+        assert fetcher.cached(lazy["id"].iloc[0])
+    finally:
+        fetcher.close()
+
+
+def test_glassdoor_fetches_through_its_session(network):
+    job = scrape("glassdoor", False).iloc[0]
+    fetcher = DescriptionFetcher()
+    with patch("requests.post", side_effect=AssertionError("module-level post")):
+        assert fetcher.get(job)
+    assert fetcher.scrapers[Site.GLASSDOOR].stats.counters["requests"] >= 1
+    fetcher.close()
+
+
+def test_fields_recompute_description_columns(network):
+    full = scrape("indeed", True).set_index("id")
+    lazy = scrape("indeed", False)
+    fetcher = DescriptionFetcher()
+    filled = fetcher.fill(lazy).set_index("id")
+    fetcher.close()
+    for column in [
+        "description",
+        "is_remote",
+        "min_amount",
+        "max_amount",
+        "salary_source",
+        "emails",
+    ]:
+        expected = full[column].astype(object).where(full[column].notna(), None)
+        actual = (
+            filled.loc[full.index, column]
+            .astype(object)
+            .where(filled.loc[full.index, column].notna(), None)
+        )
+        assert actual.tolist() == expected.tolist(), column
+
+
+def test_fields_keep_listed_salary_and_skip_sites_without_a_check():
+    fetcher = DescriptionFetcher()
+    job = {"id": "gd-1", "site": "glassdoor", "min_amount": 90000.0, "is_remote": False}
+    fields = fetcher.fields(
+        job, "Remote role paying $100,000 - $120,000, email jobs@acme.com"
+    )
+    assert fields == {"description": fields["description"], "emails": "jobs@acme.com"}
+    assert fetcher.fields(job, "") == {}
+    fetcher.close()
+
+
+def test_fields_read_salary_and_remote_from_the_description():
+    fetcher = DescriptionFetcher()
+    job = {"id": "in-1", "site": "indeed", "min_amount": None, "is_remote": False}
+    fields = fetcher.fields(job, "Work from home. Pay: $100,000 - $120,000 a year")
+    fetcher.close()
+    assert fields["is_remote"] is True
+    assert (fields["interval"], fields["min_amount"], fields["max_amount"]) == (
+        "yearly",
+        100000,
+        120000,
+    )
+    assert fields["salary_source"] == "description"
+
+
+def test_ziprecruiter_keeps_the_listing_description(network):
+    jobs, stats = scrape_jobs(
+        site_name=["zip_recruiter"],
+        search_term="engineer",
+        location="Seattle, WA",
+        results_wanted=10,
+        fetch_descriptions=False,
+        verbose=0,
+        return_stats=True,
+    )
+    assert len(jobs) == 10
+    assert jobs["description"].notna().all()
+    # the search pages only, no job page per listing
+    assert stats.totals()["requests"] == 2
+
+
+def test_ziprecruiter_listing_emails_without_detail_fetch(network):
+    scraper = ZipRecruiter()
+    scraper.scraper_input = ScraperInput(
+        site_type=[Site.ZIP_RECRUITER], fetch_descriptions=False
+    )
+    listing = {
+        "name": "Data Engineer",
+        "listing_key": "abc",
+        "job_description": "Send your resume to jobs@example.com",
+        "posted_time": "2025-01-02T00:00:00Z",
+    }
+    with patch.object(scraper, "_get_descr", side_effect=AssertionError("fetched")):
+        job = scraper._process_job(listing)
+    assert job.description == "Send your resume to jobs@example.com"
+    assert job.emails == ["jobs@example.com"]
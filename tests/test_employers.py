@@ -0,0 +1,146 @@
+from jobspy.employers import EMPLOYER_FIELDS, EmployerCache
+from jobspy.indeed import Indeed
+from jobspy.model import ScraperInput, Site
+
+
+def employer(name, rel_url=None, industry="INTERNET_AND_SOFTWARE"):
+    return {
+        "name": name,
+        "relativeCompanyPageUrl": rel_url,
+        "dossier": {
+            "employerDetails": {
+                "industry": industry,
+                "briefDescription": f"About {name}",
+            },
+            "images": {"squareLogoUrl": None},
+            "links": {"corporateWebsite": None},
+        },
+    }
+
+
+def indeed(company_id=None, cache=None):
+    scraper = Indeed(employers=cache if cache is not None else EmployerCache())
+    scraper.scraper_input = ScraperInput(
+        site_type=[Site.INDEED], indeed_company_id=company_id
+    )
+    scraper.base_url = "https://www.indeed.com"
+    scraper.api_country_code = "US"
+    return scraper
+
+
+def test_cache_returns_shared_record_and_counts():
+    cache = EmployerCache()
+    record = cache.put("indeed", "acme", {"company_name": "Acme", "extra": 1})
+    assert set(record) == set(EMPLOYER_FIELDS)
+    assert cache.get("indeed", "acme") is record
+    assert cache.get("indeed", "other") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_expires_and_evicts():
+    cache = EmployerCache(ttl=-1)
+    cache.put("indeed", "acme", {})
+    assert cache.get("indeed", "acme") is None
+    cache = EmployerCache(max_entries=1)
+    cache.put("indeed", "a", {})
+    cache.put("indeed", "b", {})
+    assert cache.table()["employer_key"].tolist() == ["b"]
+
+
+def test_employers_without_company_page_are_not_shared():
+    scraper = indeed()
+    first = scraper._get_employer(employer("Acme LLC"), has_dossier=True)
+    second = scraper._get_employer(employer("Globex Inc"), has_dossier=True)
+    assert first["company_name"] == "Acme LLC"
+    assert second["company_name"] == "Globex Inc"
+    assert second["company_url"] is None
+    assert len(scraper.employers.entries) == 0
+
+
+def test_cached_employer_keeps_job_employer_name():
+    scraper = indeed()
+    scraper._get_employer(employer("Acme", "/cmp/Acme"), has_dossier=True)
+    reused = scraper._get_employer(
+        employer("Acme Europe", "/cmp/Acme"), has_dossier=False
+    )
+    assert reused["company_name"] == "Acme Europe"
+    assert reused["company_description"] == "About Acme"
+
+
+class FakeResponse:
+    ok = True
+    status_code = 200
+
+    def __init__(self, payload):
+        self.payload = payload
+
+    def json(self):
+        return self.payload
+
+
+def page(employers, cursor=None):
+    results = []
+    for index, job_employer in enumerate(employers):
+        results.append(
+            {
+                "job": {
+                    "key": f"{job_employer['name']}-{index}",
+                    "title": "Engineer",
+                    "datePublished": 1700000000000,
+                    "description": {"html": "<p>Build things</p>"},
+                    "location": {
+                        "city": "Seattle",
+                        "admin1Code": "WA",
+                        "countryCode": "US",
+                    },
+                    "compensation": {
+                        "estimated": None,
+                        "baseSalary": None,
+                        "currencyCode": None,
+                    },
+                    "attributes": [],
+                    "employer": job_employer,
+                    "recruit": None,
+                }
+            }
+        )
+    return {
+        "data": {"jobSearch": {"pageInfo": {"nextCursor": cursor}, "results": results}}
+    }
+
+
+def test_company_search_refetches_page_with_uncached_employers():
+    scraper = indeed(company_id="Acme")
+    queries = []
+
+    def post(url, json=None, **kwargs):
+        queries.append(json["query"])
+        with_dossier = "dossier {" in json["query"]
+
+        def strip(job_employer):
+            if with_dossier:
+                return job_employer
+            return {k: v for k, v in job_employer.items() if k != "dossier"}
+
+        if len(queries) == 1:
+            return FakeResponse(
+                page([strip(employer("Acme", "/cmp/Acme"))], cursor="next")
+            )
+        return FakeResponse(
+            page(
+                [
+                    strip(employer("Acme", "/cmp/Acme")),
+                    strip(employer("Globex", "/cmp/Globex", "RETAIL")),
+                ]
+            )
+        )
+
+    scraper.session.post = post
+    scraper.headers = {}
+    first, cursor = scraper._scrape_page(None)
+    second, _ = scraper._scrape_page(cursor)
+    # page two is asked for without the dossier, then again with it for Globex
+    assert ["dossier {" in query for query in queries] == [True, False, True]
+    globex = next(job for job in second if job.company_name == "Globex")
+    assert globex.company_industry == "Retail"
+    assert globex.company_description == "About Globex"
@@ -0,0 +1,59 @@
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from jobspy.facets import ALL, FacetIndex
+
+NOW = datetime(2025, 3, 31, 12)
+
+
+def jobs():
+    return pd.DataFrame(
+        {
+            "company": ["Acme", "Acme", "Globex", None],
+            "location": ["Seattle", "Austin", "Seattle", "Seattle"],
+            "site": ["indeed", "linkedin", "indeed", "indeed"],
+            "min_amount": [100.0, None, None, None],
+            "max_amount": [None, None, 90.0, None],
+            "date_posted": ["2025-03-30", "2025-03-10", "2025-03-20", None],
+        }
+    )
+
+
+def test_mask_combines_selections():
+    index = FacetIndex(jobs())
+    assert index.values("company") == ["Acme", "Globex", "Unknown"]
+    selections = {"company": "Acme", "location": ALL, "salary": "Has Salary"}
+    assert index.mask(selections, now=NOW).tolist() == [True, False, False, False]
+    assert index.mask({"date_posted": "Last 14 days"}, now=NOW).tolist() == [
+        True,
+        False,
+        True,
+        False,
+    ]
+    base = np.array([False, True, True, True])
+    assert index.mask({"location": "Seattle"}, base=base).tolist() == [
+        False,
+        False,
+        True,
+        True,
+    ]
+
+
+def test_counts_ignore_the_facets_own_selection():
+    index = FacetIndex(jobs())
+    selections = {"company": "Acme", "location": "Seattle"}
+    assert index.counts("company", selections) == {"Acme": 1, "Globex": 1, "Unknown": 1}
+    assert index.counts("location", selections) == {"Austin": 1, "Seattle": 1}
+    assert index.counts("salary", {}) == {"Has Salary": 2, "No Salary Specified": 2}
+    assert index.counts("date_posted", {"site": "indeed"}, now=NOW) == {
+        "Last 7 days": 1,
+        "Last 14 days": 2,
+        "Last 30 days": 2,
+    }
+
+
+def test_unknown_value_matches_nothing():
+    index = FacetIndex(jobs())
+    assert not index.mask({"company": "Initech"}).any()
@@ -0,0 +1,68 @@
+import json
+
+import pytest
+
+from jobspy.google import util
+from jobspy.google.util import (
+    JOB_INFO_KEY,
+    find_job_info,
+    find_job_info_initial_page,
+    iter_job_infos,
+)
+
+
+@pytest.fixture(autouse=True)
+def no_remembered_paths(monkeypatch):
+    monkeypatch.setattr(util, "_job_info_paths", [])
+
+
+def listing(index):
+    return ["Data Engineer", f"Company {index}", ["Seattle, WA"], [f"url{index}"]]
+
+
+def test_initial_page_listings_are_cut_at_their_closing_brackets():
+    cards = "".join(
+        f'<div>{{"{JOB_INFO_KEY}": {json.dumps(listing(i))}}}]]]]]</div>'
+        for i in range(3)
+    )
+    assert find_job_info_initial_page(f"<html>{cards}</html>") == [
+        listing(i) for i in range(3)
+    ]
+
+
+def test_listings_without_the_closing_pattern_are_decoded_incrementally():
+    # the first array contains the closing pattern in a string value
+    text = (
+        f'"{JOB_INFO_KEY}": ["]}}]]]]]", 1] trailing '
+        f'"{JOB_INFO_KEY}":\n{json.dumps(listing(1))} then '
+        f'"{JOB_INFO_KEY}": "not a list"'
+    )
+    assert list(iter_job_infos(text)) == [["]}]]]]]", 1], listing(1)]
+    assert find_job_info_initial_page(text) == [["]}]]]]]", 1], listing(1)]
+
+
+def test_malformed_listing_is_skipped():
+    text = f'"{JOB_INFO_KEY}": [1, 2 "{JOB_INFO_KEY}": [3]'
+    assert list(iter_job_infos(text)) == [[3]]
+
+
+def test_find_job_info_searches_then_remembers_the_path():
+    payload = [[None, {"a": [0, {JOB_INFO_KEY: listing(0)}]}], "x"]
+    assert find_job_info(payload) == listing(0)
+    assert util._job_info_paths == [(0, 1, "a", 1)]
+
+    same_shape = [[None, {"a": [9, {JOB_INFO_KEY: listing(1)}]}]]
+    assert find_job_info(same_shape) == listing(1)
+    assert util._job_info_paths == [(0, 1, "a", 1)]
+
+    moved = {"b": [{JOB_INFO_KEY: listing(2)}]}
+    assert find_job_info(moved) == listing(2)
+    assert util._job_info_paths == [("b", 0), (0, 1, "a", 1)]
+    assert find_job_info([{"b": [{JOB_INFO_KEY: "not a list"}]}]) is None
+
+
+def test_remembered_paths_are_capped():
+    for i in range(util._MAX_JOB_INFO_PATHS + 2):
+        find_job_info({f"key{i}": {JOB_INFO_KEY: listing(i)}})
+    assert len(util._job_info_paths) == util._MAX_JOB_INFO_PATHS
+    assert util._job_info_paths[0] == (f"key{util._MAX_JOB_INFO_PATHS + 1}",)
@@ -0,0 +1,88 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from jobspy.hedging import HedgePolicy
+
+HOST = "apis.indeed.com"
+
+
+def slow(seconds, name, ok=True):
+    def send():
+        time.sleep(seconds)
+        return SimpleNamespace(name=name, ok=ok)
+
+    return send
+
+
+def test_fast_primary_is_not_hedged():
+    policy = HedgePolicy(initial_delay=0.5, budget=1.0)
+    assert policy.send(HOST, slow(0, "primary"), slow(0, "hedge")).name == "primary"
+    assert policy.metrics()["hedges"] == 0
+
+
+def test_slow_primary_is_hedged_and_the_hedge_wins():
+    policy = HedgePolicy(initial_delay=0.05, min_delay=0.01, budget=1.0)
+    assert policy.send(HOST, slow(0.5, "primary"), slow(0, "hedge")).name == "hedge"
+    metrics = policy.metrics()
+    assert (metrics["hedges"], metrics["hedge_wins"], metrics["hedge_win_rate"]) == (
+        1,
+        1,
+        1.0,
+    )
+
+
+def test_failed_hedge_falls_back_to_the_primary():
+    policy = HedgePolicy(initial_delay=0.05, min_delay=0.01, budget=1.0)
+    assert (
+        policy.send(HOST, slow(0.2, "primary"), slow(0, "hedge", ok=False)).name
+        == "primary"
+    )
+    assert policy.metrics()["hedge_wins"] == 0
+
+
+def test_budget_limits_hedges():
+    policy = HedgePolicy(initial_delay=0.02, min_delay=0.01, budget=0.5)
+    for _ in range(4):
+        policy.send(HOST, slow(0.1, "primary"), slow(0, "hedge"))
+    metrics = policy.metrics()
+    assert metrics["hedges"] == 2
+    assert metrics["budget_denied"] == 2
+
+
+def test_delay_follows_the_latency_percentile():
+    policy = HedgePolicy(
+        percentile=50, min_samples=3, min_delay=0.0, max_delay=1.0, initial_delay=5
+    )
+    assert policy.delay(HOST) == 5
+    policy._host(HOST).latencies.extend([0.1, 0.2, 0.3, 10.0])
+    assert policy.delay(HOST) == 0.25
+    policy._host(HOST).latencies.extend([10.0] * 10)
+    assert policy.delay(HOST) == 1.0
+
+
+def test_primary_runs_on_the_callers_thread():
+    policy = HedgePolicy(initial_delay=0.05, min_delay=0.01, budget=1.0)
+
+    def primary():
+        return SimpleNamespace(name=threading.current_thread().name, ok=True)
+
+    assert policy.send(HOST, primary, slow(0, "hedge")).name == (
+        threading.current_thread().name
+    )
+    assert policy.send(HOST, primary, None).name == threading.current_thread().name
+
+
+def test_hedge_rescues_a_failed_primary():
+    policy = HedgePolicy(initial_delay=0.05, min_delay=0.01, budget=1.0)
+
+    def primary():
+        time.sleep(0.1)
+        raise ConnectionError("proxy down")
+
+    assert policy.send(HOST, primary, slow(0.2, "hedge")).name == "hedge"
+    assert policy.metrics()["hedge_wins"] == 1
+    with pytest.raises(ConnectionError):
+        policy.send(HOST, primary, None)
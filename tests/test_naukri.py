@@ -0,0 +1,42 @@
+import threading
+from unittest.mock import patch
+
+from benchmarks.fixtures import JobBoardFixtures, patched_network
+from jobspy.model import Country, ScraperInput, Site
+from jobspy.naukri import Naukri
+
+
+def search(results_wanted):
+    return ScraperInput(
+        site_type=[Site.NAUKRI],
+        search_term="engineer",
+        location="Bangalore",
+        country=Country.INDIA,
+        results_wanted=results_wanted,
+    )
+
+
+def test_pages_stop_at_max_pages():
+    with patched_network(JobBoardFixtures(jobs_per_site=400)):
+        scraper = Naukri(requests_per_second=1000, max_pages=3)
+        jobs = scraper.scrape(search(200)).jobs
+    assert len(jobs) == 3 * Naukri.jobs_per_page
+
+
+def test_page_workers_use_their_own_sessions():
+    sessions = {}
+    original = Naukri._session
+
+    def record(self):
+        session = original(self)
+        sessions.setdefault(threading.get_ident(), set()).add(id(session))
+        return session
+
+    with patched_network(JobBoardFixtures(jobs_per_site=200)), patch.object(
+        Naukri, "_session", record
+    ):
+        scraper = Naukri(requests_per_second=1000, max_workers=4)
+        jobs = scraper.scrape(search(200)).jobs
+    assert len(jobs) == 200
+    assert all(len(ids) == 1 for ids in sessions.values())
+    assert len({id_ for ids in sessions.values() for id_ in ids}) == len(sessions)
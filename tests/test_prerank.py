@@ -0,0 +1,47 @@
+import pandas as pd
+
+from jobspy.prerank import RelevancePreRanker
+
+JOBS = pd.DataFrame(
+    {
+        "title": [
+            "Data Scientist",
+            "Senior Data Science Manager",
+            "Warehouse Associate",
+            "Software Engineer",
+            "Marketing Coordinator",
+        ],
+        "description": [
+            "Statistics and modeling",
+            "Lead a data science team",
+            "Pick and pack orders",
+            "Build services; some data work",
+            None,
+        ],
+    }
+)
+
+
+def test_similarity_ranks_matching_titles_first():
+    ranker = RelevancePreRanker.from_jobs(JOBS)
+    scores = ranker.similarity("data science")
+    assert set(scores.argsort()[::-1][:2]) == {0, 1}
+    assert scores[2] == 0
+    assert ((scores >= 0) & (scores <= 1 + 1e-9)).all()
+    assert not ranker.similarity("unknown words").any()
+
+
+def test_select_applies_threshold_then_cap():
+    ranker = RelevancePreRanker.from_jobs(JOBS)
+    positions, scores = ranker.select("data science", min_similarity=0.0)
+    assert set(positions[:2].tolist()) == {0, 1}
+    assert 2 not in positions
+    assert list(scores) == sorted(scores, reverse=True)
+    capped, _ = ranker.select("data science", top_k=1)
+    assert capped.tolist() == positions[:1].tolist()
+    assert len(ranker.select("data science", min_similarity=0.99)[0]) == 0
+
+
+def test_prefixes_match_related_words():
+    ranker = RelevancePreRanker(["Scientist", "Cashier"])
+    assert ranker.similarity("science")[0] > 0
@@ -0,0 +1,52 @@
+import os
+import pstats
+import tracemalloc
+
+import pytest
+
+from jobspy.profiling import ScrapeProfiler
+
+
+def busy_work():
+    return [str(i) * 10 for i in range(20000)]
+
+
+def test_both_modes_write_cpu_and_memory_profiles(tmp_path):
+    with ScrapeProfiler("both", str(tmp_path)) as profiler:
+        with profiler.site("indeed"):
+            jobs = busy_work()
+    assert len(jobs) == 20000
+    assert not tracemalloc.is_tracing()
+    assert profiler.files == {
+        "indeed": [
+            str(tmp_path / "indeed.prof"),
+            str(tmp_path / "indeed.snapshot"),
+            str(tmp_path / "indeed.memory.txt"),
+        ]
+    }
+    functions = {
+        function for _, _, function in pstats.Stats(profiler.files["indeed"][0]).stats
+    }
+    assert "busy_work" in functions
+    snapshot = tracemalloc.Snapshot.load(profiler.files["indeed"][1])
+    assert snapshot.statistics("lineno")
+    with open(profiler.files["indeed"][2]) as f:
+        report = f.read()
+    assert report.startswith("top allocations while scraping indeed\n")
+    assert "test_profiling.py" in report
+
+
+def test_cpu_mode_profiles_each_site_separately(tmp_path):
+    with ScrapeProfiler("cpu", str(tmp_path / "new")) as profiler:
+        with profiler.site("indeed"):
+            busy_work()
+        with profiler.site("linkedin"):
+            pass
+    assert sorted(os.listdir(tmp_path / "new")) == ["indeed.prof", "linkedin.prof"]
+    linkedin = pstats.Stats(profiler.files["linkedin"][0]).stats
+    assert "busy_work" not in {function for _, _, function in linkedin}
+
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError, match="profile must be one of"):
+        ScrapeProfiler("disk")
@@ -0,0 +1,114 @@
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import pandas as pd
+
+from benchmarks.fixtures import JobBoardFixtures, patched_network
+from jobspy import scrape_jobs
+from jobspy.model import Scraper, ScraperInput, Site
+from jobspy.query_cache import QueryCache
+
+
+def search(site=Site.INDEED, results_wanted=5000, hours_old=None, **kwargs):
+    return ScraperInput(
+        site_type=[site],
+        indeed_company_id="Acme",
+        results_wanted=results_wanted,
+        hours_old=hours_old,
+        **kwargs,
+    )
+
+
+def jobs(count, site="indeed", exhausted=False):
+    today = date.today()
+    frame = pd.DataFrame(
+        {
+            "id": [f"in-{i}" for i in range(count)],
+            "site": site,
+            "is_remote": False,
+            "date_posted": [today - timedelta(days=i % 20) for i in range(count)],
+        }
+    )
+    frame.attrs["site_status"] = {site: {"status": "ok", "exhausted": exhausted}}
+    return frame
+
+
+def test_capped_site_result_does_not_answer_narrower_windows():
+    cache = QueryCache()
+    cache.put(search(), jobs(1000))
+    assert cache.get(search(hours_old=24)) is None
+    assert cache.get(search(hours_old=336)) is None
+
+
+def test_exhausted_site_result_at_the_cap_is_not_complete():
+    cache = QueryCache()
+    cache.put(search(), jobs(1000, exhausted=True))
+    assert cache.get(search(hours_old=24)) is None
+
+
+def test_exhausted_site_result_below_the_cap_answers_narrower_windows():
+    cache = QueryCache()
+    cache.put(search(results_wanted=300), jobs(300, exhausted=True))
+    narrowed = cache.get(search(results_wanted=300, hours_old=24))
+    assert narrowed is not None
+    assert len(narrowed) < 300
+
+
+def test_result_below_cap_and_results_wanted_is_complete():
+    cache = QueryCache()
+    cache.put(search(), jobs(40))
+    assert len(cache.get(search(hours_old=72))) <= 40
+
+
+def test_result_at_results_wanted_is_capped():
+    cache = QueryCache()
+    cache.put(search(results_wanted=50), jobs(50))
+    assert cache.get(search(results_wanted=50, hours_old=24)) is None
+    # the same or a smaller request is still answered
+    assert len(cache.get(search(results_wanted=20))) == 20
+
+
+def test_different_parameters_miss():
+    cache = QueryCache()
+    cache.put(search(), jobs(10))
+    assert cache.get(search(location="Seattle, WA")) is None
+    assert cache.misses == 1
+
+
+def test_entries_expire():
+    cache = QueryCache(ttl=-1)
+    cache.put(search(), jobs(10))
+    assert cache.get(search()) is None
+
+
+def test_memory_budget_drops_oldest_entries():
+    size = int(jobs(100).memory_usage(deep=True).sum())
+    cache = QueryCache(max_bytes=int(size * 2.5))
+    for location in ("A", "B", "C"):
+        cache.put(search(location=location), jobs(100))
+    assert [entry.jobs.shape[0] for entry in cache.entries] == [100, 100]
+    assert cache.get(search(location="A")) is None
+    assert cache.get(search(location="C")) is not None
+
+
+def test_result_over_memory_budget_is_not_cached():
+    cache = QueryCache(max_bytes=1000)
+    cache.put(search(), jobs(100))
+    assert cache.entries == []
+
+
+def test_indeed_is_not_exhausted_at_its_cap():
+    def exhausted(jobs_per_site):
+        with patched_network(
+            JobBoardFixtures(jobs_per_site=jobs_per_site)
+        ), patch.object(Scraper, "pause", lambda self, seconds: True):
+            result = scrape_jobs(
+                site_name=["indeed"],
+                search_term="engineer",
+                results_wanted=5000,
+                verbose=0,
+            )
+        return result.attrs["site_status"]["indeed"]["exhausted"]
+
+    assert exhausted(40)
+    assert not exhausted(1000)
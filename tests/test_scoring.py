@@ -0,0 +1,98 @@
+import threading
+import time
+
+import pandas as pd
+
+from jobspy.scoring import JobScorer, KeywordScoringClient, ScoreCache
+
+
+def jobs(count):
+    return pd.DataFrame(
+        [
+            {
+                "id": f"job-{i}",
+                "title": "Data Engineer" if i % 2 else "Store Manager",
+                "company": "Acme",
+                "location": "Remote",
+                "description": f"Build pipelines, posting {i}",
+            }
+            for i in range(count)
+        ]
+    )
+
+
+class DroppingClient(KeywordScoringClient):
+    """Leaves the last job out of every batched answer"""
+
+    def __init__(self):
+        super().__init__()
+        self.batch_sizes = []
+
+    def complete(self, prompt, max_tokens):
+        lines = super().complete(prompt, max_tokens).split("\n")
+        self.batch_sizes.append(len(lines))
+        return "\n".join(lines[:-1] if len(lines) > 1 else lines)
+
+
+class ConcurrencyClient(KeywordScoringClient):
+    def __init__(self):
+        super().__init__()
+        self.lock = threading.Lock()
+        self.running = self.peak = 0
+
+    def complete(self, prompt, max_tokens):
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(0.02)
+        with self.lock:
+            self.running -= 1
+        return super().complete(prompt, max_tokens)
+
+
+def test_jobs_are_scored_in_batches():
+    client = KeywordScoringClient()
+    scored = JobScorer(client, batch_size=4).score(jobs(10), "data engineer")
+    assert client.calls == 3
+    assert scored["ai_score"].tolist() == [0, 70] * 5
+    assert scored["ai_confidence"].eq("MEDIUM").all()
+
+
+def test_jobs_missing_from_a_batch_are_requested_alone():
+    client = DroppingClient()
+    scored = JobScorer(client, batch_size=4, max_workers=1).score(
+        jobs(8), "data engineer"
+    )
+    assert client.batch_sizes == [4, 1, 4, 1]
+    assert scored["ai_score"].notna().all()
+
+
+def test_cache_is_reused_across_scorers(tmp_path):
+    path = str(tmp_path / "jobs.db")
+    first = KeywordScoringClient()
+    cache = ScoreCache(path)
+    JobScorer(first, cache=cache).score(jobs(6), "Data  Engineer")
+    cache.close()
+    assert first.calls == 1
+
+    second = KeywordScoringClient()
+    cache = ScoreCache(path)
+    scored = JobScorer(second, cache=cache).score(jobs(7), "data engineer")
+    cache.close()
+    assert second.calls == 1
+    assert scored["ai_score"].tolist() == [0, 70, 0, 70, 0, 70, 0]
+
+
+def test_cache_lookup_stays_within_sqlite_parameter_limit(tmp_path):
+    cache = ScoreCache(str(tmp_path / "jobs.db"))
+    results = {(f"job-{i}", "hash"): (50, "LOW", "") for i in range(1200)}
+    cache.put(results, "target")
+    assert cache.get(list(results), "target") == results
+    cache.close()
+
+
+def test_concurrent_prompts_are_bounded_by_max_workers():
+    client = ConcurrencyClient()
+    JobScorer(client, batch_size=1, max_workers=3).score(jobs(12), "data engineer")
+    assert client.calls == 12
+    assert client.peak <= 3
@@ -0,0 +1,51 @@
+import pandas as pd
+
+from jobspy.search import JobSearchIndex, result_fingerprint
+
+TITLES = [
+    "Software Engineer",
+    "Senior Software Engineering Manager",
+    "Programmer Analyst",
+    "Data Engineer",
+    "Marketing Manager",
+]
+DESCRIPTIONS = [None, None, None, "Software pipelines", "Software launches"]
+
+
+def test_every_query_word_must_prefix_a_title_word():
+    index = JobSearchIndex(TITLES)
+    positions, scores = index.search("software engineer")
+    assert sorted(positions.tolist()) == [0, 1]
+    assert positions[0] == 0
+    assert list(scores) == sorted(scores, reverse=True)
+    assert (
+        index.search("soft eng")[0].tolist()
+        == index.search("software engineer")[0].tolist()
+    )
+
+
+def test_synonyms_match_with_lower_weight():
+    index = JobSearchIndex(
+        TITLES, synonyms={"developer": ["software engineer", "programmer"]}
+    )
+    positions, scores = index.search("Developer")
+    assert sorted(positions.tolist()) == [0, 1, 2]
+    direct = JobSearchIndex(TITLES).search("programmer")[1][0]
+    assert scores[positions.tolist().index(2)] < direct
+
+
+def test_descriptions_rank_and_optionally_match():
+    ranked = JobSearchIndex(TITLES, DESCRIPTIONS)
+    assert sorted(ranked.search("software")[0].tolist()) == [0, 1]
+    matching = JobSearchIndex(TITLES, DESCRIPTIONS, match_descriptions=True)
+    positions = matching.search("software")[0].tolist()
+    assert sorted(positions) == [0, 1, 3, 4]
+    assert set(positions[:2]) == {0, 1}
+    assert matching.search("software", limit=1)[0].tolist() == positions[:1]
+
+
+def test_result_fingerprint_follows_ids():
+    jobs = pd.DataFrame({"id": ["a", "b"], "job_url": ["u1", "u2"]})
+    assert result_fingerprint(jobs) == result_fingerprint(jobs.copy())
+    assert result_fingerprint(jobs) != result_fingerprint(jobs.iloc[::-1])
+    assert result_fingerprint(jobs) != result_fingerprint(jobs.head(1))
@@ -0,0 +1,110 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from jobspy.model import ScraperInput, Site
+from jobspy.singleflight import SingleFlight, scraper_input_key
+
+
+def search(**fields):
+    return ScraperInput(site_type=[Site.INDEED, Site.LINKEDIN], **fields)
+
+
+def test_key_normalizes_only_the_search_term_and_location():
+    key = scraper_input_key(search(search_term="Data Engineer", location="Seattle"))
+    same = ScraperInput(
+        site_type=[Site.LINKEDIN, Site.INDEED],
+        search_term=" data engineer ",
+        location="SEATTLE",
+    )
+    assert scraper_input_key(same) == key
+    assert scraper_input_key(search(indeed_company_id="Amazon")) != scraper_input_key(
+        search(indeed_company_id="amazon")
+    )
+
+
+def test_key_includes_the_run_options():
+    key = scraper_input_key(search(), proxies=["a:8080"], ca_cert=None, hedge=None)
+    assert key == scraper_input_key(
+        search(), proxies=["a:8080"], ca_cert=None, hedge=None
+    )
+    assert key != scraper_input_key(
+        search(), proxies=["b:8080"], ca_cert=None, hedge=None
+    )
+    assert key != scraper_input_key(
+        search(), proxies=["a:8080"], ca_cert="ca.pem", hedge=None
+    )
+    assert key != scraper_input_key(
+        search(), proxies=["a:8080"], ca_cert=None, hedge=object()
+    )
+
+
+def test_followers_share_the_leaders_result():
+    flight = SingleFlight()
+    calls = []
+    entered = threading.Event()
+    release = threading.Event()
+
+    def fn():
+        calls.append(1)
+        entered.set()
+        release.wait(5)
+        return "jobs"
+
+    with ThreadPoolExecutor(4) as executor:
+        leader = executor.submit(flight.do, "key", fn)
+        entered.wait(5)
+        followers = [executor.submit(flight.do, "key", fn) for _ in range(3)]
+        while flight.calls["key"].followers < 3:
+            time.sleep(0.001)
+        release.set()
+        assert leader.result() == ("jobs", True)
+        assert [follower.result() for follower in followers] == [("jobs", True)] * 3
+    assert calls == [1]
+    assert flight.in_flight() == 0
+
+
+def test_a_lone_call_is_not_shared():
+    assert SingleFlight().do("key", lambda: 1) == (1, False)
+
+
+def test_exceptions_reach_every_caller():
+    flight = SingleFlight()
+    release = threading.Event()
+    entered = threading.Event()
+
+    def fn():
+        entered.set()
+        release.wait(5)
+        raise ValueError("blocked")
+
+    with ThreadPoolExecutor(2) as executor:
+        leader = executor.submit(flight.do, "key", fn)
+        entered.wait(5)
+        follower = executor.submit(flight.do, "key", fn)
+        while flight.calls["key"].followers < 1:
+            time.sleep(0.001)
+        release.set()
+        for future in (leader, follower):
+            with pytest.raises(ValueError, match="blocked"):
+                future.result()
+    assert flight.in_flight() == 0
+    assert flight.do("key", lambda: "retried") == ("retried", False)
+
+
+def test_different_keys_run_separately():
+    flight = SingleFlight()
+    barrier = threading.Barrier(2, timeout=5)
+
+    def fn():
+        # both calls must be running at the same time to pass the barrier
+        return barrier.wait()
+
+    with ThreadPoolExecutor(2) as executor:
+        results = [
+            future.result()
+            for future in [executor.submit(flight.do, key, fn) for key in ("a", "b")]
+        ]
+    assert sorted(results) == [(0, False), (1, False)]
@@ -0,0 +1,71 @@
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from jobspy import spill
+from jobspy.spill import SpillBuffer, SpilledJobs
+
+
+def jobs(start, count):
+    return pd.DataFrame(
+        {
+            "id": [f"job-{i}" for i in range(start, start + count)],
+            "title": [f"Engineer {i}" for i in range(start, start + count)],
+            "company": [f"Company {i}" for i in range(start, start + count)],
+            "location": "Seattle, WA",
+            "site": "indeed",
+            "date_posted": [
+                date(2025, 1, 1) + timedelta(days=i)
+                for i in range(start, start + count)
+            ],
+            "description": [
+                f"description {i} " + "x" * 500 for i in range(start, start + count)
+            ],
+        }
+    )
+
+
+@pytest.fixture(params=["arrow", "pickle"])
+def spilled(request, tmp_path, monkeypatch):
+    if request.param == "arrow":
+        pytest.importorskip("pyarrow")
+    else:
+        monkeypatch.setattr(spill, "load_pyarrow", lambda: None)
+    buffer = SpillBuffer(memory_limit_mb=0.01, directory=str(tmp_path))
+    for start in range(0, 60, 20):
+        buffer.append(jobs(start, 20))
+    result = buffer.finish()
+    assert isinstance(result, SpilledJobs)
+    assert len(result.paths) == 3
+    yield result
+    result.close()
+
+
+def test_small_results_stay_in_memory():
+    buffer = SpillBuffer(memory_limit_mb=16)
+    buffer.append(jobs(0, 10))
+    buffer.append(jobs(5, 10))
+    result = buffer.finish()
+    assert isinstance(result, pd.DataFrame)
+    assert len(result) == 15
+    assert result["id"].iloc[0] == "job-14"
+
+
+def test_rows_are_sorted_across_chunks(spilled):
+    page = spilled.rows(0, 5, ["id", "title"])
+    assert page["id"].tolist() == [f"job-{i}" for i in range(59, 54, -1)]
+    assert list(page.columns) == ["id", "title"]
+    assert len(spilled.to_pandas(exclude=["description"])) == 60
+
+
+def test_lookup_reads_one_value(spilled):
+    assert spilled.lookup("job-42", "description").startswith("description 42 ")
+    assert spilled.lookup("missing", "description") is None
+
+
+def test_read_converts_only_the_requested_rows(spilled):
+    frame = spilled._read(spilled.paths[1], ["id", "description"], np.array([3, 0]))
+    assert frame["id"].tolist() == ["job-23", "job-20"]
+    assert list(frame.columns) == ["id", "description"]
@@ -0,0 +1,52 @@
+from types import SimpleNamespace
+
+from jobspy.stats import ScrapeStats
+
+
+def response(status_code=200, content=b"{}", retries=0):
+    return SimpleNamespace(
+        status_code=status_code,
+        content=content,
+        raw=SimpleNamespace(retries=SimpleNamespace(history=[None] * retries)),
+    )
+
+
+def scrape_stats():
+    stats = ScrapeStats()
+    for site in ("indeed", "linkedin"):
+        site_stats = stats.sites[site] = ScrapeStats(site)
+        site_stats.record_response(response(content=b"x" * 10, retries=1), 0.5)
+        site_stats.record_response(response(status_code=429), 0.25)
+        site_stats.add_time("total", 2.0)
+        with site_stats.timer("parse"):
+            pass
+    stats.add_time("dataframe", 0.1)
+    stats.add_time("total", 3.0)
+    return stats
+
+
+def test_totals_sum_sites_but_not_their_totals():
+    totals = scrape_stats().totals()
+    assert totals["requests"] == 4
+    assert totals["retries"] == 2
+    assert totals["rate_limited"] == 2
+    assert totals["bytes_in"] == 2 * (10 + 2)
+    assert totals["seconds"]["network"] == 1.5
+    assert totals["seconds"]["total"] == 3.0
+
+
+def test_to_dict_nests_sites():
+    stats = scrape_stats().to_dict()
+    assert stats["site"] is None
+    assert stats["sites"]["indeed"]["requests"] == 2
+    assert "sites" not in stats["sites"]["indeed"]
+
+
+def test_prometheus_labels_each_site():
+    text = scrape_stats().to_prometheus()
+    assert 'jobspy_requests_total{site="indeed"} 2' in text
+    assert 'jobspy_requests_total{site="all"}' not in text
+    assert (
+        'jobspy_stage_seconds_total{site="linkedin",stage="network"} 0.750000' in text
+    )
+    assert text.endswith("\n")
@@ -0,0 +1,86 @@
+from datetime import date
+
+import pandas as pd
+import pytest
+
+from jobspy.store import JobStore, _fts_query
+
+
+def jobs():
+    return pd.DataFrame(
+        [
+            {
+                "id": "in-1",
+                "site": "indeed",
+                "title": "C++ Engineer",
+                "company": "Acme",
+                "location": "Seattle, WA",
+                "date_posted": date(2025, 1, 3),
+                "min_amount": 150000.0,
+                "description": "Low-latency systems AND tooling",
+            },
+            {
+                "id": "li-2",
+                "site": "linkedin",
+                "title": "Data Scientist",
+                "company": "Globex",
+                "location": "Austin, TX",
+                "date_posted": date(2025, 1, 2),
+                "min_amount": None,
+                "description": "Machine learning NEAR production",
+            },
+        ]
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    with JobStore(str(tmp_path / "jobs.db")) as store:
+        store.upsert(jobs())
+        yield store
+
+
+def test_filters(store):
+    assert store.count() == 2
+    assert store.query(site="linkedin")["id"].tolist() == ["li-2"]
+    assert store.query(company_contains=["acm"])["id"].tolist() == ["in-1"]
+    assert store.query(has_salary=True)["id"].tolist() == ["in-1"]
+    assert store.query()["id"].tolist() == ["in-1", "li-2"]
+
+
+def test_rescrape_keeps_stored_descriptions(store):
+    listing = jobs().iloc[[0]].assign(description=None, title="Senior C++ Engineer")
+    store.upsert(listing)
+    assert store.description("in-1") == "Low-latency systems AND tooling"
+    assert store.query(site="indeed")["title"].iloc[0] == "Senior C++ Engineer"
+    assert store.description("missing") is None
+
+
+@pytest.mark.parametrize(
+    "search, expected",
+    [
+        ("C++", ["in-1"]),
+        ('"machine learning', ["li-2"]),
+        ("low-latency", ["in-1"]),
+        ("AND", ["in-1"]),
+        ("NEAR production", ["li-2"]),
+        ("engineer scientist", []),
+        ("- ++", ["in-1", "li-2"]),
+    ],
+)
+def test_search_treats_operators_as_text(store, search, expected):
+    assert store.query(search=search)["id"].tolist() == expected
+
+
+def test_fts_query_quotes_terms():
+    assert _fts_query('say "hi" -x') == '"say" """hi""" "-x"'
+    assert _fts_query(" - ") is None
+
+
+def test_hours_old_filters_on_date_posted_only(store):
+    # both jobs were just stored but were posted in January 2025
+    assert store.query(hours_old=24).empty
+    assert store.query(seen_within_hours=24)["id"].tolist() == ["in-1", "li-2"]
+    fresh = jobs().iloc[[1]].assign(id="li-3", date_posted=date.today())
+    store.upsert(fresh)
+    assert store.query(hours_old=24)["id"].tolist() == ["li-3"]
@@ -0,0 +1,80 @@
+import importlib
+import threading
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("streamlit")
+pytest.importorskip("fuzzywuzzy")
+pytest.importorskip("openai")
+
+from jobspy.datasets import SharedDatasets
+
+
+@pytest.fixture(scope="module")
+def app(tmp_path_factory):
+    # the app creates its uploads folder in the working directory on import
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(tmp_path_factory.mktemp("app"))
+        yield importlib.import_module("streamlit_app")
+
+
+def jobs():
+    return pd.DataFrame(
+        {
+            "id": ["in-1", "in-2"],
+            "job_url": ["https://example.com/1", "https://example.com/2"],
+            "title": ["Data Engineer", "Store Manager"],
+            "description": ["Pipelines", "Stores"],
+        }
+    )
+
+
+def new_task(app, tmp_path):
+    datasets = SharedDatasets(str(tmp_path / "datasets"))
+    return app.ScrapeTask(["Acme"], "Seattle", 24, 100, None, None, datasets)
+
+
+def test_task_publishes_progress_then_stores_its_result(app, tmp_path, monkeypatch):
+    release = threading.Event()
+
+    def scrape(task):
+        task.update("Scraping Acme", status="Scraping...", progress=0.5)
+        task.add_jobs("Acme", jobs())
+        release.wait(5)
+        return jobs()
+
+    monkeypatch.setattr(app, "scrape_multiple_companies", scrape)
+    task = new_task(app, tmp_path).start()
+    while task.partial_jobs().empty:
+        task.thread.join(0.01)
+
+    messages, status, progress, done = task.snapshot()
+    assert (messages, status, progress, done) == (
+        [("info", "Scraping Acme")],
+        "Scraping...",
+        0.5,
+        False,
+    )
+    assert task.partial_jobs()["id"].tolist() == ["in-1", "in-2"]
+    assert "description" not in task.partial_jobs()
+
+    release.set()
+    task.thread.join(5)
+    assert task.done and task.finished_at is not None
+    assert task.result is None and task.company_jobs == {}
+    stored = task.datasets.get(task.fingerprint)
+    assert stored["description"].tolist() == ["Pipelines", "Stores"]
+
+
+def test_failed_task_finishes_with_an_error(app, tmp_path, monkeypatch):
+    def scrape(task):
+        raise RuntimeError("blocked")
+
+    monkeypatch.setattr(app, "scrape_multiple_companies", scrape)
+    task = new_task(app, tmp_path).start()
+    task.thread.join(5)
+    messages, _, _, done = task.snapshot()
+    assert done
+    assert messages == [("error", "❌ Search failed: blocked")]
+    assert task.result.empty and task.fingerprint is None